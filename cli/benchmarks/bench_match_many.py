@@ -0,0 +1,95 @@
+"""Bulk routing: :meth:`SkillRegistry.match` per query vs ``match_many``.
+
+Scores a few thousand queries against the real personality skills on
+the in-process index, with a deterministic hashed bag-of-words embedder
+standing in for Ollama. Query vectors are precomputed, so the numbers
+isolate the routing cost — embedding is excluded from both columns:
+
+    uv run python benchmarks/bench_match_many.py
+
+``match``       one embedder call + one top-1 search per query — what
+                ``tab chat`` does per turn.
+``match_many``  one ``embed_many`` call for the whole batch and one
+                ``(queries × dims) @ (dims × skills)`` product.
+
+Against a live Ollama the gap is wider: each ``match`` call is also an
+HTTP round-trip to ``/api/embed``, which ``match_many`` pays once.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from tab_cli.embeddings import EmbeddingCache
+from tab_cli.registry import load_skill_registry
+
+PLUGINS_DIR = Path(__file__).resolve().parents[2] / "plugins"
+DIMS = 768
+QUERIES = 5_000
+
+
+def _hashed(text: str) -> list[float]:
+    out = np.zeros(DIMS, dtype=np.float32)
+    for token in text.lower().split():
+        out[zlib.crc32(token.encode()) % DIMS] += 1.0
+    return out.tolist()
+
+
+class _HashedEmbedder:
+    """Vectors are precomputed, so the timings below are routing cost only."""
+
+    identity = "bench:hashed-bow"
+
+    def __init__(self, texts: Sequence[str]) -> None:
+        self.calls = 0
+        self._vectors = {text: _hashed(text) for text in texts}
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls += 1
+        return [self._vectors.get(text) or _hashed(text) for text in texts]
+
+
+def main() -> None:
+    words = "draw dinosaur teach me about listen think idea topic weather".split()
+    rng = np.random.default_rng(0)
+    queries = [" ".join(rng.choice(words, size=6)) + f" {n}" for n in range(QUERIES)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        embedder = _HashedEmbedder(queries)
+        registry = load_skill_registry(
+            PLUGINS_DIR,
+            embedder=embedder,
+            cache=EmbeddingCache(Path(tmp)),
+            backend="memory",
+        )
+
+        embedder.calls = 0
+        started = time.perf_counter()
+        single = [registry.match(q) for q in queries]
+        per_query = time.perf_counter() - started
+        single_calls = embedder.calls
+
+        embedder.calls = 0
+        registry.match_many(queries[:1])  # build the description matrix
+        embedder.calls = 0
+        started = time.perf_counter()
+        batched = registry.match_many(queries)
+        vectorized = time.perf_counter() - started
+
+    assert [h.name for h in single] == [h.name for h in batched]
+    print(f"queries: {QUERIES}, skills: {len(registry.records)}, dims: {DIMS}")
+    print(f"     match: {per_query * 1000:8.1f} ms  {single_calls} embedder calls")
+    print(f"match_many: {vectorized * 1000:8.1f} ms  {embedder.calls} embedder call")
+
+
+if __name__ == "__main__":
+    main()
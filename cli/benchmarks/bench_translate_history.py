@@ -0,0 +1,97 @@
+"""Per-turn cost of translating chat history for ``/api/chat``.
+
+Every ``tab chat`` turn hands :class:`OllamaNativeModel` the full
+pydantic-ai history. This benchmark grows a synthetic session to a few
+thousand messages and times the translation step for one more turn at
+each size, with and without the model's translation memo:
+
+    uv run python benchmarks/bench_translate_history.py
+
+``full`` is the pre-memo behaviour (re-translate everything) and grows
+linearly with history, i.e. quadratically over a session. ``memo``
+translates only the new tail. What remains is verifying that the prior
+messages and their parts are unchanged, a C-level tuple comparison
+that costs a fraction of a microsecond per message (about a millisecond
+at 4,000 messages, against seconds for the model call itself).
+"""
+
+from __future__ import annotations
+
+import statistics
+import timeit
+
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+from tab_cli.models import OllamaNativeModel
+
+SIZES = (10, 100, 1_000, 2_000, 4_000)
+REPEATS = 51
+
+
+def _turn(n: int) -> list:
+    """One user turn: a prompt, a tool round-trip, and an answer."""
+    return [
+        ModelRequest(parts=[UserPromptPart(content=f"question {n} " * 8)]),
+        ModelResponse(
+            parts=[ToolCallPart(tool_name="web_search", args={"query": f"q{n}"})]
+        ),
+        ModelRequest(
+            parts=[
+                ToolReturnPart(
+                    tool_name="web_search",
+                    content=[{"title": f"t{n}", "url": f"https://x/{n}"}],
+                )
+            ]
+        ),
+        ModelResponse(parts=[TextPart(content=f"answer {n} " * 40)]),
+    ]
+
+
+def _history(size: int) -> list:
+    history: list = [ModelRequest(parts=[SystemPromptPart(content="be tab " * 200)])]
+    n = 0
+    while len(history) < size:
+        history += _turn(n)
+        n += 1
+    return history[:size]
+
+
+def main() -> None:
+    print(f"{'messages':>9}  {'full µs/turn':>13}  {'memo µs/turn':>13}")
+    for size in SIZES:
+        history = _history(size)
+        model = OllamaNativeModel("bench")
+        model._translations.translate(history)  # earlier turns warmed the memo
+
+        full: list[float] = []
+        memo: list[float] = []
+        for n in range(REPEATS):
+            # Each turn appends to the same history, as ``run_chat`` does.
+            history.append(ModelRequest(parts=[UserPromptPart(content=f"more {n}")]))
+            full.append(
+                timeit.timeit(
+                    lambda: OllamaNativeModel._translate_messages(history), number=1
+                )
+            )
+            memo.append(
+                timeit.timeit(
+                    lambda: model._translations.translate(history), number=1
+                )
+            )
+
+        print(
+            f"{size:>9}  {statistics.median(full) * 1e6:>13.1f}  "
+            f"{statistics.median(memo) * 1e6:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Offline latency of the teach research phase's search tools.
+
+Runs against :class:`exa_stub.ExaStubServer` on loopback, so no
+key, no spend, and no network variance:
+
+    uv run python benchmarks/bench_web_search.py
+
+Each scenario issues the same five-angle research batch against a stub
+with fixed per-request latency and reports wall time:
+
+``serial``   five ``web_search`` calls, one after another (what a
+             model calling the single tool does today).
+``many``     one ``web_search_many`` call with the five queries.
+``cached``   the serial batch again with a warm on-disk result cache.
+``flaky``    ``web_search_many`` with 20% injected 500s — failures come
+             back as entries, not exceptions, and don't slow the batch.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from exa_stub import ExaStubServer
+
+from tab_cli.search_cache import SearchCache
+from tab_cli.web_search import build_web_search_many_tool, build_web_search_tool
+
+LATENCY_SECONDS = 0.25
+QUERIES = [
+    "event sourcing trade-offs production",
+    "event sourcing schema versioning",
+    "event sourcing vs CRUD audit log",
+    "CQRS read model rebuild cost",
+    "event store snapshotting strategies",
+]
+
+
+def _timed(label: str, fn) -> None:
+    started = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - started
+    errors = sum(1 for row in results if row["title"].startswith("[web_search"))
+    print(f"{label:>8}: {elapsed * 1000:7.1f} ms  {len(results):3d} rows  {errors} err")
+
+
+def main() -> None:
+    with ExaStubServer(latency_seconds=LATENCY_SECONDS) as stub:
+        single = build_web_search_tool(api_key="stub", search_url=stub.url)
+        many = build_web_search_many_tool(api_key="stub", search_url=stub.url)
+        _timed("serial", lambda: [row for q in QUERIES for row in single(q)])
+        _timed("many", lambda: many(QUERIES))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cached = build_web_search_tool(
+                api_key="stub", search_url=stub.url, cache=SearchCache(Path(tmp))
+            )
+            for query in QUERIES:
+                cached(query)
+            _timed("cached", lambda: [row for q in QUERIES for row in cached(q)])
+
+    with ExaStubServer(
+        latency_seconds=LATENCY_SECONDS, error_rate=0.2, seed=1
+    ) as stub:
+        flaky = build_web_search_many_tool(api_key="stub", search_url=stub.url)
+        _timed("flaky", lambda: flaky(QUERIES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Local stand-in for Exa's ``/search`` endpoint.
+
+``web_search`` and ``web_search_many`` can only be measured against the
+real API today, which costs money, needs a key, and varies with the
+network. :class:`ExaStubServer` is a loopback HTTP server that answers
+``POST /search`` in the shape :func:`tab_cli.web_search.build_web_search_tool`
+parses, with knobs for the behaviour worth benchmarking:
+
+- ``latency_seconds`` (+ ``jitter_seconds``) — server-side delay per
+  request, to exercise timeouts and the batched tool's deadline.
+- ``error_rate`` — fraction of requests answered ``500``; seeded, so a
+  run is reproducible.
+- ``text_chars`` — size of each result's passage, to see what trimming
+  and history growth cost at realistic payload sizes.
+
+Results rotate through the three passage fields the parser accepts —
+``text``, ``snippet``, ``highlights`` — so one run covers each branch.
+A request without ``x-api-key`` gets ``401``, as Exa would.
+
+Point the CLI at it with the ``EXA_SEARCH_URL`` override::
+
+    uv run python benchmarks/exa_stub.py --port 8765 --latency 0.3 &
+    EXA_SEARCH_URL=http://127.0.0.1:8765/search EXA_API_KEY=stub tab teach ...
+
+Stdlib only (``http.server``), one thread per request. Lives with the
+benchmarks rather than in the package: nothing ``tab`` runs imports it.
+The bench scripts import it as a sibling module, and the tests reach it
+through the ``pythonpath`` entry in ``pyproject.toml``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+_PASSAGE_FIELDS = ("text", "snippet", "highlights")
+
+
+class ExaStubServer:
+    """Loopback ``/search`` server; use as a context manager or start/stop."""
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        text_chars: int = 600,
+        seed: int = 0,
+    ) -> None:
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate must be within [0, 1], got {error_rate}")
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.error_rate = error_rate
+        self.text_chars = text_chars
+        self.requests: list[dict[str, Any]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The ``EXA_SEARCH_URL`` value that reaches this server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def start(self) -> ExaStubServer:
+        # A short poll interval keeps ``stop()`` from idling for the
+        # default half second — it adds up across a test run.
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="exa-stub",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> ExaStubServer:
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    def _plan(self, request: dict[str, Any]) -> tuple[float, bool]:
+        """Record ``request``; return its (delay, fail) draw."""
+        with self._lock:
+            self.requests.append(request)
+            jitter = self._random.uniform(0.0, self.jitter_seconds)
+            fail = self._random.random() < self.error_rate
+        return self.latency_seconds + jitter, fail
+
+    def results_for(self, query: str, num_results: int) -> list[dict[str, Any]]:
+        """Deterministic fake results for ``query``."""
+        slug = "-".join(query.lower().split()) or "empty"
+        body = (f"{query} " * (self.text_chars // max(len(query) + 1, 1) + 1))[
+            : self.text_chars
+        ]
+        results: list[dict[str, Any]] = []
+        for index in range(num_results):
+            result: dict[str, Any] = {
+                "title": f"{query} — source {index + 1}",
+                "url": f"https://stub.example/{slug}/{index + 1}",
+            }
+            field = _PASSAGE_FIELDS[index % len(_PASSAGE_FIELDS)]
+            if field == "highlights":
+                half = len(body) // 2
+                result[field] = [body[:half], body[half:]]
+            else:
+                result[field] = body
+            results.append(result)
+        return results
+
+
+def _handler_for(server: ExaStubServer) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802 — http.server naming
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                request = None
+            if self.path.rstrip("/") != "/search":
+                self._reply(404, {"error": "not found"})
+                return
+            if not isinstance(request, dict):
+                self._reply(400, {"error": "body must be a JSON object"})
+                return
+            if not self.headers.get("x-api-key"):
+                self._reply(401, {"error": "missing x-api-key"})
+                return
+
+            delay, fail = server._plan(request)
+            if delay > 0:
+                time.sleep(delay)
+            if fail:
+                self._reply(500, {"error": "injected failure"})
+                return
+
+            query = str(request.get("query") or "")
+            num_results = int(request.get("numResults") or 10)
+            self._reply(200, {"results": server.results_for(query, num_results)})
+
+        def _reply(self, status: int, payload: dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return  # keep benchmark output clean
+
+    return _Handler
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/exa_stub.py",
+        description="Serve a fake Exa /search endpoint on loopback.",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--text-chars", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = ExaStubServer(
+        port=args.port,
+        latency_seconds=args.latency,
+        jitter_seconds=args.jitter,
+        error_rate=args.error_rate,
+        text_chars=args.text_chars,
+        seed=args.seed,
+    )
+    print(f"EXA_SEARCH_URL={server.url}", flush=True)
+    with server:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
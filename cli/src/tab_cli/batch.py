@@ -0,0 +1,144 @@
+"""Batch mode for ``tab ask``: many prompts, one compiled agent.
+
+``tab ask`` pays the whole cold start — import pydantic-ai, read
+``tab.md``, assemble the prompt, build the model — for a single
+question. Scripts that loop over a file of prompts pay it per prompt
+and run them strictly one at a time. ``tab ask --batch in.jsonl``
+compiles the agent once and runs the prompts through
+:func:`run_batch`:
+
+- **Input.** One JSON value per line: either a string (the prompt) or
+  an object with a ``prompt`` string and an optional ``id`` that is
+  echoed back. Blank lines are skipped. A line that doesn't parse into
+  a prompt becomes an error record; it doesn't stop the batch.
+- **Bounded concurrency.** At most ``concurrency`` turns are in flight
+  (``agent.run`` on one event loop — the same async path ``tab mcp``
+  uses), and lines are read only as slots free up, so a huge input
+  file is never loaded whole.
+- **Streamed output.** Each record is written as one JSON line the
+  moment its turn finishes, so a long batch can be tailed and a crash
+  keeps everything already done. Completion order, not input order —
+  ``index`` (0-based input line among non-blank lines) lets a consumer
+  re-sort.
+
+Every record carries ``index``, ``prompt``, ``output`` (``null`` on
+failure), ``error`` (``null`` on success, else the same text ``tab
+ask`` would print after ``tab:``), and ``latency_ms`` for the turn
+alone, plus ``id`` when the input line had one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Turns in flight at once when ``--concurrency`` isn't given. Matches
+# ``tab mcp``'s default for the same reason: enough to overlap hosted
+# providers' network waits without burying a local Ollama.
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+@dataclass
+class BatchSummary:
+    """Counts for the one-line stderr report after a batch."""
+
+    total: int = 0
+    failed: int = 0
+
+
+def run_batch(
+    agent: Any,
+    lines: Iterable[str],
+    write: Callable[[str], None],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> BatchSummary:
+    """Run every prompt in ``lines`` through ``agent``; stream records to ``write``.
+
+    ``write`` receives one serialised JSON record (newline-terminated)
+    per prompt. ``agent`` needs only an async ``run(prompt)`` returning
+    something with ``.output``.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    return asyncio.run(_run_batch(agent, lines, write, concurrency))
+
+
+async def _run_batch(
+    agent: Any,
+    lines: Iterable[str],
+    write: Callable[[str], None],
+    concurrency: int,
+) -> BatchSummary:
+    from tab_cli.models import aclose_shared_models
+
+    summary = BatchSummary()
+    slots = asyncio.Semaphore(concurrency)
+    pending: set[asyncio.Task[None]] = set()
+
+    async def one(index: int, line: str) -> None:
+        try:
+            record = await _turn(agent, index, line)
+        finally:
+            slots.release()
+        summary.total += 1
+        if record["error"] is not None:
+            summary.failed += 1
+        write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    try:
+        index = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(one(index, line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            index += 1
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        # Models are bound to this loop; close their clients before
+        # ``asyncio.run`` tears it down.
+        await aclose_shared_models()
+    return summary
+
+
+async def _turn(agent: Any, index: int, line: str) -> dict[str, Any]:
+    record: dict[str, Any] = {"index": index}
+    try:
+        prompt, record_id = _parse_line(line)
+    except ValueError as exc:
+        record.update(prompt=None, output=None, error=str(exc), latency_ms=0.0)
+        return record
+
+    if record_id is not None:
+        record["id"] = record_id
+    record["prompt"] = prompt
+    started = time.perf_counter()
+    try:
+        result = await agent.run(prompt)
+    except Exception as exc:  # noqa: BLE001 — one bad turn mustn't sink the batch
+        record.update(output=None, error=str(exc))
+    else:
+        record.update(output=result.output, error=None)
+    record["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return record
+
+
+def _parse_line(line: str) -> tuple[str, Any]:
+    """Return ``(prompt, id)`` for one input line, or raise ``ValueError``."""
+    try:
+        value = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid JSON: {exc.msg}") from exc
+    if isinstance(value, str):
+        return value, None
+    if isinstance(value, dict) and isinstance(value.get("prompt"), str):
+        return value["prompt"], value.get("id")
+    raise ValueError('each line must be a JSON string or {"prompt": "..."}')
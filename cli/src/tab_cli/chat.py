@@ -3,6 +3,8 @@
 A turn is: read a line of user input, classify it, react.
 
 - ``/exit`` / ``/quit`` / EOF (Ctrl-D) end the session cleanly.
+- ``/stats`` prints the previous turn's token counts and timings
+  (``ollama:`` models only — see :class:`tab_cli.models.OllamaTurnMetrics`).
 - A "set <setting> to NN%" / "be more <adjective>" phrase mutates the
   active :class:`TabSettings`, recompiles the agent, prints a one-line
   acknowledgement, and continues.
@@ -24,25 +26,51 @@ the next ``run_stream_sync`` call as ``message_history=``. Recompiling
 the agent for a settings change does **not** reset history — the
 conversation continues with the new system prompt in effect.
 
+History is bounded by a token budget (``[chat].history_tokens`` in
+``~/.tab/config.toml``, default :data:`DEFAULT_HISTORY_TOKEN_BUDGET`).
+Once a turn pushes the estimate over budget, :class:`_HistoryManager`
+drops the oldest whole turns — a turn being a user prompt plus every
+tool call, tool return, and response it produced, so ``teach``'s
+``web_search`` round-trips are never split — and leaves a one-line
+system note saying how many were trimmed. The system prompt and the
+newest turn always survive.
+
+Routing and the agent turn overlap when the session speculates (the
+default for ``ollama:`` models; ``[chat].speculate`` overrides it).
+The registry match runs on a worker thread while the default agent's
+request is already in flight. Its chunks are held back until routing
+finishes: a fall-through streams them straight away, and a skill win
+cancels the request before anything reached stdout. On the common path
+— no skill — the embed no longer sits in front of the first token.
+Hosted models default off, because a cancelled speculative request
+there still costs its prompt tokens.
+
 The chat module deliberately holds no provider state of its own; the
 agent does. ``--model`` passes through to :func:`compile_tab_agent`,
 and recompilation on a settings change re-uses whatever model name was
 captured at session start.
+
+With tracing on (``tab --trace PATH`` / ``TAB_TRACE``), each line is a
+``chat.turn`` span with the phases above nested under it — see
+:mod:`tab_cli.tracing`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import IO, TYPE_CHECKING, Any
 
+from tab_cli import tracing
 from tab_cli.personality import TabSettings, compile_tab_agent
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
     from pydantic_ai.messages import ModelMessage
 
+    from tab_cli.prefilter import LexicalPrefilter
     from tab_cli.registry import SkillRegistry
 
 
@@ -50,6 +78,23 @@ if TYPE_CHECKING:
 _GREETING = "tab — say something, or /exit to leave."
 
 
+# Default cap on the history threaded into each turn, in estimated
+# tokens. Roomy enough for the ~2k-token persona prompt plus a couple of
+# ``teach`` turns with search results; small enough that a long session
+# stops growing latency and provider cost instead of running into the
+# model's context limit. Override with ``[chat].history_tokens``.
+DEFAULT_HISTORY_TOKEN_BUDGET = 16_000
+
+# Rough characters-per-token ratio for English prose under the BPE
+# tokenizers Tab's providers use. An estimate is all the budget needs —
+# it decides *when* to trim, not what the provider bills.
+_CHARS_PER_TOKEN = 4
+
+# Prefix of the system note left in place of trimmed turns. Recognised
+# on the next compaction so the note is replaced, not stacked.
+_TRIM_NOTE_PREFIX = "[Earlier conversation trimmed:"
+
+
 # Setting-adjustment patterns. tab.md documents two flavors:
 #
 #   1. "set humor to 90%"          — explicit numeric value
@@ -85,14 +130,179 @@ class _Session:
     set, the loop bypasses grimoire and settings detection and routes
     every line through that skill's agent. ``None`` means normal chat
     routing — grimoire-then-agent.
+
+    ``prefilter`` is the lexical pre-gate in front of ``registry``: a
+    line it rules out skips the embedding round-trip and goes straight
+    to the agent. ``None`` routes every line through the registry.
+
+    ``speculate`` overlaps routing with the default agent turn — see
+    :func:`_routed_turn`.
+
+    ``last_turn`` holds the messages the most recent turn added, for
+    ``/stats`` to read its usage from.
     """
 
     agent: Agent
     settings: TabSettings
     model: str | None
     registry: SkillRegistry | None
+    prefilter: LexicalPrefilter | None = None
+    speculate: bool = False
     history: list[ModelMessage] = field(default_factory=list)
     active_skill: str | None = None
+    history_manager: _HistoryManager | None = None
+    last_turn: list[ModelMessage] = field(default_factory=list)
+
+    def record(self, messages: list[ModelMessage]) -> None:
+        """Replace history with ``messages``, compacted to the budget.
+
+        Compaction is skipped while a sticky skill is active: ``listen``
+        synthesises from the whole dump on ``/done``, so trimming its
+        early lines mid-dump would lose exactly what the user asked Tab
+        to hold. The first turn after the skill exits compacts as usual.
+        """
+        # Every turn runs with ``message_history=self.history``, and
+        # ``all_messages()`` is that history plus the turn's own.
+        self.last_turn = messages[len(self.history) :]
+        if self.history_manager is None or self.active_skill is not None:
+            self.history = messages
+        else:
+            self.history = self.history_manager.compact(messages)
+
+
+def _estimate_tokens(message: Any) -> int:
+    """Estimate the prompt tokens ``message`` contributes.
+
+    Counts the text the model actually sees — prompt and response
+    content, tool-call arguments, tool-return payloads — at
+    :data:`_CHARS_PER_TOKEN`, plus a small per-part overhead for role
+    and framing tokens. Anything that isn't a pydantic-ai message is
+    sized by its ``str``.
+    """
+    from pydantic_ai.messages import (
+        ModelRequest,
+        ModelResponse,
+        ToolCallPart,
+        ToolReturnPart,
+    )
+
+    if not isinstance(message, (ModelRequest, ModelResponse)):
+        return len(str(message)) // _CHARS_PER_TOKEN + 1
+
+    chars = 0
+    for part in message.parts:
+        if isinstance(part, ToolCallPart):
+            chars += len(part.tool_name) + len(part.args_as_json_str())
+        elif isinstance(part, ToolReturnPart):
+            chars += len(part.tool_name) + len(part.model_response_str())
+        else:
+            content = getattr(part, "content", "")
+            chars += len(content) if isinstance(content, str) else len(str(content))
+    return chars // _CHARS_PER_TOKEN + 4 * len(message.parts)
+
+
+@dataclass
+class _HistoryManager:
+    """Keep the REPL's history inside a token budget.
+
+    History is split into a *head* — the system-prompt parts
+    pydantic-ai stored on the first request — and *turns*, each opening
+    with a request that carries a user prompt and running up to the
+    next one. A turn therefore owns its tool calls and tool returns;
+    dropping whole turns can never leave a ``ToolCallPart`` without its
+    ``ToolReturnPart`` (which providers reject) or the reverse.
+
+    :meth:`compact` keeps the head and as many of the newest turns as
+    fit the budget — always at least the newest, even if it alone is
+    over — and drops the rest, recording the running count of trimmed
+    turns in a system note. Older turns are dropped rather than
+    summarised: a summary costs a model call per compaction, which is
+    the latency this exists to cap.
+    """
+
+    token_budget: int = DEFAULT_HISTORY_TOKEN_BUDGET
+    trimmed_turns: int = 0
+
+    def compact(self, messages: list[ModelMessage]) -> list[ModelMessage]:
+        sizes = [_estimate_tokens(message) for message in messages]
+        if sum(sizes) <= self.token_budget:
+            return messages
+
+        from pydantic_ai.messages import ModelRequest, SystemPromptPart
+
+        head, turns = _split_turns(messages)
+        if len(turns) <= 1:
+            return messages
+
+        head_parts = [
+            part
+            for part in head
+            if not (
+                isinstance(part, SystemPromptPart)
+                and part.content.startswith(_TRIM_NOTE_PREFIX)
+            )
+        ]
+        spent = sum(
+            len(part.content) // _CHARS_PER_TOKEN + 4 for part in head_parts
+        )
+        kept: list[list[ModelMessage]] = []
+        for turn in reversed(turns):
+            cost = sum(_estimate_tokens(message) for message in turn)
+            if kept and spent + cost > self.token_budget:
+                break
+            kept.append(turn)
+            spent += cost
+        kept.reverse()
+
+        self.trimmed_turns += len(turns) - len(kept)
+        note = SystemPromptPart(
+            content=(
+                f"{_TRIM_NOTE_PREFIX} {self.trimmed_turns} earlier "
+                f"turn{'s' if self.trimmed_turns != 1 else ''} of this "
+                "conversation were dropped to stay within the history "
+                "budget; ask the user to restate anything you still need.]"
+            )
+        )
+        compacted: list[ModelMessage] = [
+            ModelRequest(parts=[*head_parts, note])
+        ]
+        for turn in kept:
+            compacted.extend(turn)
+        return compacted
+
+
+def _split_turns(
+    messages: list[ModelMessage],
+) -> tuple[list[Any], list[list[ModelMessage]]]:
+    """Split history into head system parts and user-prompt-led turns.
+
+    The first request usually carries both the system prompt and the
+    first user prompt; its system parts go to the head and the rest
+    becomes a request of its own opening turn one. Messages before the
+    first user prompt that aren't system parts (rare — a resumed run)
+    ride along with the first turn.
+    """
+    from pydantic_ai.messages import ModelRequest, SystemPromptPart, UserPromptPart
+
+    head: list[Any] = []
+    turns: list[list[ModelMessage]] = []
+    for index, message in enumerate(messages):
+        if index == 0 and isinstance(message, ModelRequest):
+            head = [p for p in message.parts if isinstance(p, SystemPromptPart)]
+            rest = [p for p in message.parts if not isinstance(p, SystemPromptPart)]
+            if not rest:
+                continue
+            if len(rest) != len(message.parts):
+                message = ModelRequest(parts=rest)
+
+        opens_turn = isinstance(message, ModelRequest) and any(
+            isinstance(part, UserPromptPart) for part in message.parts
+        )
+        if opens_turn or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return head, turns
 
 
 # Skills that take over the session for multiple turns once they fire,
@@ -112,25 +322,29 @@ _STICKY_SKILLS = frozenset({"listen"})
 # "done" as a synthesis trigger.
 _STICKY_EXIT_COMMAND = "/done"
 
+# Prints the previous turn's model timings. Handled before routing and
+# sticky mode, like ``/exit``, so it never reaches a skill or the model.
+_STATS_COMMAND = "/stats"
+
 
 def _tools_for_skill(skill_name: str) -> list[Any]:
     """Return the per-skill tool list for ``skill_name`` dispatches.
 
     Most personality skills don't need tools — the runner stays
     generic on purpose. ``teach`` is the first that does: the SKILL.md
-    body's research phase wants a ``web_search`` tool and grimoire
-    routing inside ``tab chat`` is one of the two paths that need to
-    wire it (the other being the one-shot ``tab teach`` Typer
-    subcommand).
+    body's research phase wants ``web_search`` (plus its batched
+    sibling ``web_search_many``), and grimoire routing inside ``tab
+    chat`` is one of the two paths that need to wire them (the other
+    being the one-shot ``tab teach`` Typer subcommand).
 
     Lazy import for the same reason ``compile_skill_agent`` is lazy:
     the chat module is loaded for every REPL turn and ``httpx`` /
     pydantic-ai cost only matters when a tool is actually attached.
     """
     if skill_name == "teach":
-        from tab_cli.web_search import default_web_search
+        from tab_cli.web_search import default_web_search, default_web_search_many
 
-        return [default_web_search()]
+        return [default_web_search(), default_web_search_many()]
     return []
 
 
@@ -187,11 +401,12 @@ def _stream_agent_turn(session: _Session, prompt: str, stdout: IO[str]) -> None:
     # which only worked because test fakes happened to be context-manager-
     # shaped; live pydantic-ai surfaces a TypeError.) Iterate the result
     # straight, write deltas as they arrive.
+    started = tracing.now()
     result = session.agent.run_stream_sync(
         prompt,
         message_history=session.history,
     )
-    for chunk in result.stream_text(delta=True):
+    for chunk in tracing.stream(result.stream_text(delta=True), started):
         stdout.write(chunk)
         stdout.flush()
     stdout.write("\n")
@@ -201,8 +416,8 @@ def _stream_agent_turn(session: _Session, prompt: str, stdout: IO[str]) -> None:
     # model response. Appending ``new_messages()`` to ``history``
     # would also work but ``all_messages`` is the documented "this
     # is the canonical history" accessor and matches what tests can
-    # assert on.
-    session.history = list(result.all_messages())
+    # assert on. ``record`` trims it to the session's token budget.
+    session.record(list(result.all_messages()))
 
 
 def _dispatch_skill(
@@ -228,20 +443,22 @@ def _dispatch_skill(
     # paying for the skill module's import cost when no skill ever fires.
     from tab_cli.skills import compile_skill_agent
 
-    skill_agent = compile_skill_agent(
-        skill_name,
-        settings=session.settings,
-        model=session.model,
-        tools=_tools_for_skill(skill_name),
-    )
+    with tracing.span("agent.compile", skill=skill_name):
+        skill_agent = compile_skill_agent(
+            skill_name,
+            settings=session.settings,
+            model=session.model,
+            tools=_tools_for_skill(skill_name),
+        )
 
     # See ``_stream_agent_turn`` — ``run_stream_sync`` returns the
     # ``StreamedRunResultSync`` directly, not a context manager.
+    started = tracing.now()
     result = skill_agent.run_stream_sync(
         user_prompt,
         message_history=session.history,
     )
-    for chunk in result.stream_text(delta=True):
+    for chunk in tracing.stream(result.stream_text(delta=True), started):
         stdout.write(chunk)
         stdout.flush()
     stdout.write("\n")
@@ -252,7 +469,7 @@ def _dispatch_skill(
     # the system prompt is recomputed at each compile, so threading
     # these messages back into the regular agent for the next turn
     # works without prompt drift.
-    session.history = list(result.all_messages())
+    session.record(list(result.all_messages()))
 
 
 def run_chat(
@@ -260,8 +477,11 @@ def run_chat(
     model: str | None = None,
     settings: TabSettings | None = None,
     registry: SkillRegistry | None = None,
+    prefilter: LexicalPrefilter | None = None,
+    speculate: bool | None = None,
     stdin: IO[str] | None = None,
     stdout: IO[str] | None = None,
+    history_token_budget: int | None = None,
 ) -> None:
     """Run the interactive REPL until EOF / ``/exit`` / ``/quit``.
 
@@ -274,9 +494,21 @@ def run_chat(
             a default load from ``plugins/`` next to the package — the
             production code path. Tests inject a stub to skip the
             grimoire/Ollama runtime requirement.
+        prefilter: Lexical pre-gate consulted before ``registry.match``.
+            ``None`` builds one from the registry's skill records when
+            the registry is a real :class:`SkillRegistry`; injected
+            stub registries get no pre-gate unless a test passes one.
+        speculate: Start the default agent turn while the registry
+            match is still running. ``None`` reads ``[chat].speculate``
+            from the config, falling back to on for ``ollama:`` models
+            and off otherwise.
         stdin / stdout: Streams to read user input from and stream
             responses to. Default to ``sys.stdin`` / ``sys.stdout`` so
             tests can substitute :class:`io.StringIO`.
+        history_token_budget: Cap on the estimated tokens of history
+            threaded into each turn. ``None`` reads
+            ``[chat].history_tokens`` from the config, falling back to
+            :data:`DEFAULT_HISTORY_TOKEN_BUDGET`.
 
     Errors loading the agent or registry surface as ``RuntimeError``-shaped
     exceptions for the Typer wrapper to collapse into a readable
@@ -285,6 +517,17 @@ def run_chat(
     stdin = stdin if stdin is not None else sys.stdin
     stdout = stdout if stdout is not None else sys.stdout
 
+    from tab_cli.warmup import start_warm_up
+
+    # Compiled before the registry loads so a local model's weights
+    # start loading first — that load is the longest wait in a cold
+    # session, and it now overlaps the registry load and the user's
+    # first line. Hosted models have nothing to preload.
+    active_settings = settings if settings is not None else TabSettings()
+    with tracing.span("agent.compile", agent="tab"):
+        agent = compile_tab_agent(settings=active_settings, model=model)
+    start_warm_up(getattr(agent, "model", None))
+
     if registry is None:
         # Lazy-imported so importing ``tab_cli.chat`` doesn't pull in
         # grimoire's Postgres/Ollama runtime requirements; tests that
@@ -294,20 +537,168 @@ def run_chat(
         from tab_cli.registry import load_skill_registry
 
         plugins_dir = Path(__file__).resolve().parents[3] / "plugins"
-        registry = load_skill_registry(plugins_dir)
+        with tracing.span("grimoire.load"):
+            registry = load_skill_registry(plugins_dir)
+
+    # The routing embedder is needed on the first line, too.
+    start_warm_up(registry)
+
+    if prefilter is None:
+        from tab_cli.registry import SkillRegistry
+
+        if isinstance(registry, SkillRegistry):
+            from tab_cli.prefilter import LexicalPrefilter
+
+            prefilter = LexicalPrefilter.from_records(registry.records)
+
+    if history_token_budget is None:
+        from tab_cli.config import load_chat_history_tokens_from_config
+
+        history_token_budget = load_chat_history_tokens_from_config()
+    if history_token_budget is None:
+        history_token_budget = DEFAULT_HISTORY_TOKEN_BUDGET
+
+    if speculate is None:
+        from tab_cli.config import load_chat_speculate_from_config
+
+        speculate = load_chat_speculate_from_config()
+    if speculate is None:
+        speculate = model is not None and model.startswith("ollama:")
 
-    active_settings = settings if settings is not None else TabSettings()
-    agent = compile_tab_agent(settings=active_settings, model=model)
     session = _Session(
         agent=agent,
         settings=active_settings,
         model=model,
         registry=registry,
+        prefilter=prefilter,
+        speculate=speculate,
+        history_manager=_HistoryManager(token_budget=history_token_budget),
     )
 
     stdout.write(f"{_GREETING}\n")
     stdout.flush()
 
+    try:
+        _repl(session, stdin, stdout)
+    finally:
+        # Recompiles share one Ollama client per (model, host) for the
+        # life of the process; the REPL ending is that life ending.
+        from tab_cli.models import close_shared_models
+
+        close_shared_models()
+
+
+def _turn_loop() -> asyncio.AbstractEventLoop:
+    """The event loop ``run_stream_sync`` drives on this thread.
+
+    Speculative turns run on the same loop as every other REPL turn, so
+    the shared Ollama model's connection pool — bound to the loop that
+    opened it — is reused rather than rebuilt. Mirrors pydantic-ai's own
+    lookup: the thread's current loop, created and installed if absent.
+    """
+    try:
+        return asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
+
+
+def _routed_turn(session: _Session, prompt: str, stdout: IO[str]) -> Any:
+    """Route ``prompt`` while the default agent turn is already under way.
+
+    Returns the passing hit when a skill wins — the speculative request
+    is cancelled and the caller dispatches the skill. Returns ``None``
+    when routing falls through, by which point the agent's response has
+    been streamed to ``stdout`` and recorded into history exactly as
+    :func:`_stream_agent_turn` would have.
+    """
+    return _turn_loop().run_until_complete(_overlap(session, prompt, stdout))
+
+
+async def _overlap(session: _Session, prompt: str, stdout: IO[str]) -> Any:
+    assert session.registry is not None
+    # Set once routing falls through; the agent holds its chunks until then.
+    fell_through = asyncio.Event()
+
+    async def agent_turn() -> list[ModelMessage]:
+        started = tracing.now()
+        async with session.agent.run_stream(
+            prompt, message_history=session.history
+        ) as result:
+            chunks = tracing.astream(result.stream_text(delta=True), started)
+            async for chunk in chunks:
+                await fell_through.wait()
+                stdout.write(chunk)
+                stdout.flush()
+            return list(result.all_messages())
+
+    speculative = asyncio.ensure_future(agent_turn())
+    try:
+        hit = await asyncio.to_thread(_match, session, prompt)
+    except BaseException:
+        speculative.cancel()
+        await asyncio.gather(speculative, return_exceptions=True)
+        raise
+
+    if hit is not None and hit.passed:
+        # Cancelling closes the HTTP stream, which stops generation on
+        # the server; a request that already failed is equally moot.
+        speculative.cancel()
+        await asyncio.gather(speculative, return_exceptions=True)
+        return hit
+
+    fell_through.set()
+    messages = await speculative
+    stdout.write("\n")
+    stdout.flush()
+    session.record(messages)
+    return None
+
+
+def _turn_stats(session: _Session) -> str:
+    """The ``/stats`` line for the last turn.
+
+    Only ``ollama:`` responses carry the timing breakdown (see
+    :class:`tab_cli.models.OllamaTurnMetrics`); hosted models, and a
+    session with no turns yet, get a one-line explanation instead.
+    """
+    if not session.last_turn:
+        return "[stats: no turns yet]"
+    from tab_cli.models import OllamaTurnMetrics
+
+    metrics = OllamaTurnMetrics.from_messages(session.last_turn)
+    if metrics is None:
+        return "[stats: timings are only reported for ollama: models]"
+    return f"[stats: {metrics.summary()}]"
+
+
+def _match(session: _Session, line: str) -> Any:
+    """``registry.match``, timed as the turn's ``grimoire.match`` span."""
+    assert session.registry is not None
+    with tracing.span("grimoire.match") as span:
+        hit = session.registry.match(line)
+        if hit is not None:
+            span.set(skill=hit.name, similarity=hit.similarity, passed=hit.passed)
+        return hit
+
+
+def _usage_attributes(messages: list[ModelMessage]) -> dict[str, Any]:
+    """The turn's Ollama metrics as span attributes; empty for hosted models."""
+    from tab_cli.models import OllamaTurnMetrics
+
+    metrics = OllamaTurnMetrics.from_messages(messages)
+    if metrics is None:
+        return {}
+    return {f"ollama.{name}": value for name, value in asdict(metrics).items()}
+
+
+def _worth_routing(session: _Session, line: str) -> bool:
+    return session.prefilter is None or session.prefilter.could_match(line)
+
+
+def _repl(session: _Session, stdin: IO[str], stdout: IO[str]) -> None:
+    """Read-classify-react until EOF / ``/exit`` / ``/quit``."""
     while True:
         line = _read_input(stdin, stdout)
         if line is None:
@@ -325,61 +716,93 @@ def run_chat(
         if stripped in ("/exit", "/quit"):
             return
 
-        # Sticky-skill mode (today: listen). Bypass grimoire and
-        # settings detection and route every line through the active
-        # skill agent. The SKILL.md body decides what to emit (silence
-        # while listening, synthesis on done). ``/done`` is the
-        # explicit exit signal — we forward it so the skill agent
-        # produces the synthesis, then drop back to normal routing.
-        if session.active_skill is not None:
-            is_exit = stripped == _STICKY_EXIT_COMMAND
-            _dispatch_skill(session, session.active_skill, stripped, stdout)
-            if is_exit:
-                session.active_skill = None
+        if stripped == _STATS_COMMAND:
+            stdout.write(f"{_turn_stats(session)}\n")
+            stdout.flush()
             continue
 
-        # Settings nudge — handled before routing because phrases like
-        # "be more direct" should never accidentally trip a skill match.
+        with tracing.span("chat.turn", chars=len(stripped)) as turn:
+            route = _handle_line(session, stripped, stdout)
+            turn.set(route=route)
+            if route != "settings" and tracing.enabled():
+                turn.set(**_usage_attributes(session.last_turn))
+
+
+def _handle_line(session: _Session, stripped: str, stdout: IO[str]) -> str:
+    """React to one non-command input line.
+
+    Returns how the line was handled — ``"sticky"``, ``"settings"``,
+    ``"skill"`` or ``"agent"`` — for the turn's trace span.
+    """
+    # Sticky-skill mode (today: listen). Bypass grimoire and
+    # settings detection and route every line through the active
+    # skill agent. The SKILL.md body decides what to emit (silence
+    # while listening, synthesis on done). ``/done`` is the
+    # explicit exit signal — we forward it so the skill agent
+    # produces the synthesis, then drop back to normal routing.
+    if session.active_skill is not None:
+        is_exit = stripped == _STICKY_EXIT_COMMAND
+        _dispatch_skill(session, session.active_skill, stripped, stdout)
+        if is_exit:
+            session.active_skill = None
+        return "sticky"
+
+    # Settings nudge — handled before routing because phrases like
+    # "be more direct" should never accidentally trip a skill match.
+    with tracing.span("settings.detect") as detect:
         updated = _detect_setting_change(stripped, session.settings)
-        if updated is not None:
-            session.settings = updated
+        detect.set(changed=updated is not None)
+    if updated is not None:
+        session.settings = updated
+        with tracing.span("agent.compile", agent="tab"):
             session.agent = compile_tab_agent(
                 settings=session.settings, model=session.model
             )
-            stdout.write(
-                f"[settings: humor {session.settings.humor}%, "
-                f"directness {session.settings.directness}%, "
-                f"warmth {session.settings.warmth}%, "
-                f"autonomy {session.settings.autonomy}%, "
-                f"verbosity {session.settings.verbosity}%]\n"
-            )
-            stdout.flush()
-            continue
-
-        # Skill match check. The registry can be empty (no records seeded)
-        # — in that case ``match`` returns ``None`` and we fall through.
-        hit = session.registry.match(stripped) if session.registry else None
-        if hit is not None and hit.passed:
-            # Announce the dispatch before streaming the skill's
-            # response. Without this, a grimoire match is invisible —
-            # the user types, sees a different-shaped reply, and has
-            # no signal that routing happened. Important when a match
-            # is surprising (e.g. ``hello`` matching ``hey-tab``).
-            # Only fires on the entry turn; sticky-mode continuations
-            # take the ``session.active_skill`` branch above and stay
-            # quiet, which matches the intent — once you're inside
-            # ``listen``, every line is the skill, no need to re-announce.
-            stdout.write(f"[skill: {hit.name}]\n")
-            stdout.flush()
-            _dispatch_skill(session, hit.name, stripped, stdout)
-            # Sticky skills (e.g. ``listen``) take over the session
-            # until ``/done``. Set the flag *after* the dispatch so the
-            # entry turn — the SKILL.md's "Listening..." acknowledgement
-            # — runs through the same code path as a normal one-shot
-            # dispatch.
-            if hit.name in _STICKY_SKILLS:
-                session.active_skill = hit.name
-            continue
-
-        # Default: route to the agent and stream the response back.
-        _stream_agent_turn(session, stripped, stdout)
+        stdout.write(
+            f"[settings: humor {session.settings.humor}%, "
+            f"directness {session.settings.directness}%, "
+            f"warmth {session.settings.warmth}%, "
+            f"autonomy {session.settings.autonomy}%, "
+            f"verbosity {session.settings.verbosity}%]\n"
+        )
+        stdout.flush()
+        return "settings"
+
+    # Skill match check. The registry can be empty (no records seeded)
+    # — in that case ``match`` returns ``None`` and we fall through.
+    # Lines the lexical pre-gate rules out ("thanks", a pasted
+    # traceback) skip the embed and fall through the same way.
+    routable = session.registry is not None and _worth_routing(session, stripped)
+    if routable and session.speculate:
+        hit = _routed_turn(session, stripped, stdout)
+        if hit is None:
+            return "agent"  # the speculative agent turn already streamed
+    elif routable:
+        hit = _match(session, stripped)
+    else:
+        hit = None
+    if hit is not None and hit.passed:
+        # Announce the dispatch before streaming the skill's
+        # response. Without this, a grimoire match is invisible —
+        # the user types, sees a different-shaped reply, and has
+        # no signal that routing happened. Important when a match
+        # is surprising (e.g. ``hello`` matching ``hey-tab``).
+        # Only fires on the entry turn; sticky-mode continuations
+        # take the ``session.active_skill`` branch above and stay
+        # quiet, which matches the intent — once you're inside
+        # ``listen``, every line is the skill, no need to re-announce.
+        stdout.write(f"[skill: {hit.name}]\n")
+        stdout.flush()
+        _dispatch_skill(session, hit.name, stripped, stdout)
+        # Sticky skills (e.g. ``listen``) take over the session
+        # until ``/done``. Set the flag *after* the dispatch so the
+        # entry turn — the SKILL.md's "Listening..." acknowledgement
+        # — runs through the same code path as a normal one-shot
+        # dispatch.
+        if hit.name in _STICKY_SKILLS:
+            session.active_skill = hit.name
+        return "skill"
+
+    # Default: route to the agent and stream the response back.
+    _stream_agent_turn(session, stripped, stdout)
+    return "agent"
@@ -16,7 +16,13 @@ from __future__ import annotations
 
 import typer
 
-from tab_cli.personality import TabSettings
+# Option defaults come from the modules that own them. All three are
+# stdlib-only, so ``--help`` stays fast. The turn limits are shared by
+# ``tab serve`` and ``tab mcp`` (``mcp_server`` re-exports them).
+from tab_cli.batch import DEFAULT_BATCH_CONCURRENCY
+from tab_cli.daemon import DEFAULT_MAX_CONCURRENCY, DEFAULT_REQUEST_TIMEOUT_SECONDS
+from tab_cli.route import DEFAULT_ROUTE_BATCH_SIZE
+from tab_cli.settings import TabSettings
 
 app = typer.Typer(
     name="tab",
@@ -136,6 +142,43 @@ def _resolve_model_or_exit(flag_value: str | None) -> str:
     raise typer.Exit(code=1)
 
 
+def _forward_to_daemon(request: dict[str, object]) -> object | None:
+    """Hand ``request`` to a running ``tab serve``; ``None`` if there isn't one.
+
+    Called before any heavy import, so with a daemon up the command
+    never loads pydantic-ai at all. A daemon that answers with an error
+    collapses to the usual ``tab: <reason>`` line and exit 1 rather than
+    re-running the turn in-process — it may already have spent tokens.
+    """
+    # Stdlib-only module; cheap enough to import on every invocation.
+    from tab_cli.daemon import DaemonError, forward
+
+    try:
+        return forward(request)
+    except DaemonError as exc:
+        typer.echo(f"tab: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
+def _turn_request(
+    prompt: str,
+    *,
+    settings: TabSettings,
+    model: str,
+    skill: str | None = None,
+) -> dict[str, object]:
+    """The ``tab serve`` request for one ``ask`` or skill turn."""
+    request: dict[str, object] = {
+        "op": "ask" if skill is None else "skill",
+        "prompt": prompt,
+        "model": model,
+        "settings": settings.model_dump(),
+    }
+    if skill is not None:
+        request["skill"] = skill
+    return request
+
+
 def _dial_options() -> dict[str, typer.models.OptionInfo]:
     """Return the five ``--<dial>`` Typer options.
 
@@ -162,6 +205,30 @@ def _dial_options() -> dict[str, typer.models.OptionInfo]:
 _DIAL_OPTS = _dial_options()
 
 
+# Root-callback only: the callback runs before every subcommand, so
+# one declaration covers ``tab --trace t.jsonl chat`` and ``tab
+# --trace t.jsonl ask ...`` alike. Repeating it on ``chat`` would read
+# ``TAB_TRACE`` — the environment fallback, so tracing can be switched
+# on without touching the command line — a second time.
+_TRACE_OPT = typer.Option(
+    None,
+    "--trace",
+    envvar="TAB_TRACE",
+    help=(
+        "Append per-turn latency spans (routing, compile, first token, "
+        "streaming, tool calls) to this JSONL file."
+    ),
+    show_default=False,
+)
+
+
+def _enable_tracing(path: str | None) -> None:
+    if path:
+        from tab_cli import tracing
+
+        tracing.enable(path)
+
+
 @app.callback()
 def _root(
     ctx: typer.Context,
@@ -180,6 +247,7 @@ def _root(
     warmth: int | None = _DIAL_OPTS["warmth"],
     autonomy: int | None = _DIAL_OPTS["autonomy"],
     verbosity: int | None = _DIAL_OPTS["verbosity"],
+    trace: str | None = _TRACE_OPT,
 ) -> None:
     """Root callback. Dispatches bare ``tab`` to the chat REPL.
 
@@ -187,7 +255,11 @@ def _root(
     ``tab --humor 90`` works the same as ``tab chat --humor 90`` — the
     bare-``tab``-equals-chat shortcut needs the same flag surface as
     the explicit subcommand.
+
+    ``--trace`` is handled before the subcommand check: ``tab --trace
+    t.jsonl ask ...`` traces any subcommand, not just the REPL.
     """
+    _enable_tracing(trace)
     if ctx.invoked_subcommand is not None:
         return
 
@@ -216,8 +288,8 @@ def _root(
 
 @app.command("ask")
 def ask(
-    prompt: str = typer.Argument(
-        ...,
+    prompt: str | None = typer.Argument(
+        None,
         help="The prompt to send to Tab as a single-turn question.",
         show_default=False,
     ),
@@ -230,6 +302,26 @@ def ask(
         ),
         show_default=False,
     ),
+    batch: str | None = typer.Option(
+        None,
+        "--batch",
+        help=(
+            "JSONL file of prompts (strings or {\"prompt\", \"id\"} objects) "
+            "to answer instead of PROMPT; - reads stdin."
+        ),
+        show_default=False,
+    ),
+    out: str = typer.Option(
+        "-",
+        "--out",
+        help="Where --batch writes its JSONL results; - is stdout.",
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        help="Most --batch prompts in flight at once.",
+    ),
     humor: int | None = _DIAL_OPTS["humor"],
     directness: int | None = _DIAL_OPTS["directness"],
     warmth: int | None = _DIAL_OPTS["warmth"],
@@ -246,7 +338,21 @@ def ask(
     ``--autonomy``, ``--verbosity``) accept ints in 0-100. Out-of-range
     values exit non-zero with a one-line ``<dial> must be 0-100, got
     <value>`` message.
+
+    With ``--batch in.jsonl`` the agent is compiled once and every
+    prompt in the file is answered, up to ``--concurrency`` at a time.
+    Each result streams to ``--out`` as a JSON line with ``index``,
+    ``prompt``, ``output``, ``error`` and ``latency_ms`` as soon as it
+    finishes. Failed prompts are recorded, not fatal; the exit code is
+    non-zero if any failed.
     """
+    if prompt is None and batch is None:
+        typer.echo("tab: pass a PROMPT, or --batch FILE for many", err=True)
+        raise typer.Exit(code=1)
+    if prompt is not None and batch is not None:
+        typer.echo("tab: pass either PROMPT or --batch FILE, not both", err=True)
+        raise typer.Exit(code=1)
+
     for name, value in (
         ("humor", humor),
         ("directness", directness),
@@ -259,6 +365,25 @@ def ask(
     settings = _resolve_settings(humor, directness, warmth, autonomy, verbosity)
     resolved_model = _resolve_model_or_exit(model)
 
+    if batch is not None:
+        _ask_batch(
+            batch,
+            out,
+            concurrency=concurrency,
+            settings=settings,
+            model=resolved_model,
+        )
+        return
+
+    # Fast path: a running ``tab serve`` already holds the compiled agent
+    # and a warm model connection.
+    served = _forward_to_daemon(
+        _turn_request(prompt, settings=settings, model=resolved_model)
+    )
+    if served is not None:
+        typer.echo(served)
+        return
+
     # Imported lazily so `tab --help` and unrelated subcommands don't pay
     # for pydantic-ai's import cost (and don't fail in environments where
     # the personality file isn't reachable from cwd).
@@ -281,6 +406,123 @@ def ask(
     typer.echo(result.output)
 
 
+def _ask_batch(
+    batch: str,
+    out: str,
+    *,
+    concurrency: int,
+    settings: TabSettings,
+    model: str,
+) -> None:
+    """Body of ``tab ask --batch``; same error contract as the one-shot path."""
+    import sys
+    from contextlib import ExitStack
+
+    from tab_cli.batch import run_batch
+    from tab_cli.personality import compile_tab_agent
+
+    try:
+        with ExitStack() as stack:
+            source = (
+                sys.stdin
+                if batch == "-"
+                else stack.enter_context(open(batch, encoding="utf-8"))
+            )
+            sink = (
+                sys.stdout
+                if out == "-"
+                else stack.enter_context(open(out, "w", encoding="utf-8"))
+            )
+
+            def write(record: str) -> None:
+                sink.write(record)
+                sink.flush()
+
+            agent = compile_tab_agent(settings=settings, model=model)
+            summary = run_batch(agent, source, write, concurrency=concurrency)
+    except Exception as exc:  # noqa: BLE001 — collapse to readable error
+        typer.echo(f"tab: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    if summary.failed:
+        typer.echo(
+            f"tab: {summary.failed} of {summary.total} prompts failed; "
+            "see the error field in the results",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+
+@app.command("route")
+def route(
+    source: str = typer.Argument(
+        "-",
+        help="File of queries, one per line; - (the default) reads stdin.",
+    ),
+    out: str = typer.Option(
+        "-",
+        "--out",
+        help="Where the JSONL routing rows go; - is stdout.",
+    ),
+    jsonl: bool = typer.Option(
+        False,
+        "--jsonl",
+        help='Treat each line as JSON: a string or {"query", "id"} object.',
+    ),
+    batch_size: int = typer.Option(
+        DEFAULT_ROUTE_BATCH_SIZE,
+        "--batch-size",
+        min=1,
+        help="Queries embedded per embedder call.",
+    ),
+) -> None:
+    """Run queries through the skill gate without calling any model.
+
+    For auditing routing offline: each input line is scored against the
+    personality skills exactly as ``tab chat`` would score it, and one
+    JSON row per query is written with ``query``, ``skill``,
+    ``similarity``, ``threshold`` and ``passed``. Queries are embedded
+    ``--batch-size`` at a time, one embedder call per batch. With
+    ``tab serve`` running, batches are scored by the daemon's
+    already-loaded registry. Errors collapse to the same readable
+    one-line stderr / non-zero exit contract as ``tab ask``.
+    """
+    import sys
+    from contextlib import ExitStack
+    from pathlib import Path
+
+    from tab_cli.route import route_lines
+
+    served = _forward_to_daemon({"op": "ping"}) is not None
+
+    try:
+        with ExitStack() as stack:
+            lines = (
+                sys.stdin
+                if source == "-"
+                else stack.enter_context(open(source, encoding="utf-8"))
+            )
+            sink = (
+                sys.stdout
+                if out == "-"
+                else stack.enter_context(open(out, "w", encoding="utf-8"))
+            )
+            if served:
+                from tab_cli.daemon import DaemonRegistry
+
+                registry = DaemonRegistry()
+            else:
+                from tab_cli.registry import load_skill_registry
+
+                # Same plugins-dir resolution as chat.py.
+                plugins_dir = Path(__file__).resolve().parents[3] / "plugins"
+                registry = load_skill_registry(plugins_dir)
+            route_lines(registry, lines, sink.write, jsonl=jsonl, batch_size=batch_size)
+    except Exception as exc:  # noqa: BLE001 — collapse to readable error
+        typer.echo(f"tab: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
 @app.command("mcp")
 def mcp(
     model: str | None = typer.Option(
@@ -293,6 +535,18 @@ def mcp(
         ),
         show_default=False,
     ),
+    max_concurrency: int = typer.Option(
+        DEFAULT_MAX_CONCURRENCY,
+        "--max-concurrency",
+        min=1,
+        help="Most ask_tab calls allowed to run a model turn at once.",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        "--timeout",
+        min=0.0,
+        help="Seconds one ask_tab call may take before it errors. 0 disables.",
+    ),
     humor: int | None = _DIAL_OPTS["humor"],
     directness: int | None = _DIAL_OPTS["directness"],
     warmth: int | None = _DIAL_OPTS["warmth"],
@@ -305,8 +559,10 @@ def mcp(
     ``search_memory(query)`` — for MCP-aware hosts (Claude Code et al.)
     to call. The personality settings established at startup apply to
     every ``ask_tab`` turn for the lifetime of the server; restart with
-    new flags to change them. Errors collapse to the same readable
-    one-line stderr / non-zero exit contract as ``tab ask``.
+    new flags to change them. Concurrent ``ask_tab`` calls run in
+    parallel up to ``--max-concurrency``, each bounded by ``--timeout``.
+    Errors collapse to the same readable one-line stderr / non-zero
+    exit contract as ``tab ask``.
     """
     for name, value in (
         ("humor", humor),
@@ -325,7 +581,55 @@ def mcp(
     from tab_cli.mcp_server import run_server
 
     try:
-        run_server(settings=settings, model=resolved_model)
+        run_server(
+            settings=settings,
+            model=resolved_model,
+            max_concurrency=max_concurrency,
+            request_timeout=timeout if timeout > 0 else None,
+        )
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"tab: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
+@app.command("serve")
+def serve(
+    max_concurrency: int = typer.Option(
+        DEFAULT_MAX_CONCURRENCY,
+        "--max-concurrency",
+        min=1,
+        help="Most turns the daemon runs against a model at once.",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        "--timeout",
+        min=0.0,
+        help="Seconds one request may take before it errors. 0 disables.",
+    ),
+) -> None:
+    """Run a local daemon that ``tab ask`` and the skill commands reuse.
+
+    Listens on ``~/.tab/serve.sock`` until interrupted. While it runs,
+    ``tab ask``, ``tab draw-dino``, ``tab listen``, ``tab think``,
+    ``tab teach`` and ``tab route`` forward their work to it instead of
+    building agents, model clients and the skill registry per
+    invocation; with no daemon they run in-process as usual. Turns use
+    the daemon's environment for API keys and ``OLLAMA_HOST``; dials
+    and ``--model`` still come from each client invocation. Errors
+    collapse to the same one-line stderr / non-zero exit contract as
+    ``tab ask``.
+    """
+    from tab_cli.daemon import run_daemon, socket_path
+
+    def ready() -> None:
+        typer.echo(f"tab serve: listening on {socket_path()}", err=True)
+
+    try:
+        run_daemon(
+            max_concurrency=max_concurrency,
+            request_timeout=timeout if timeout > 0 else None,
+            ready=ready,
+        )
     except Exception as exc:  # noqa: BLE001
         typer.echo(f"tab: {exc}", err=True)
         raise typer.Exit(code=1) from exc
@@ -389,6 +693,15 @@ def draw_dino(
     # need to fabricate a default prompt here.
     user_input = " ".join(request) if request else ""
 
+    served = _forward_to_daemon(
+        _turn_request(
+            user_input, settings=settings, model=resolved_model, skill="draw-dino"
+        )
+    )
+    if served is not None:
+        typer.echo(served)
+        return
+
     # Lazy import: keeps `tab --help` and unrelated subcommands from
     # paying for pydantic-ai's import cost. Same pattern as `tab ask`.
     from tab_cli.skills import run_skill
@@ -467,6 +780,15 @@ def listen(
     # entry path covers the "no specific topic" case explicitly.
     user_input = " ".join(topic) if topic else ""
 
+    served = _forward_to_daemon(
+        _turn_request(
+            user_input, settings=settings, model=resolved_model, skill="listen"
+        )
+    )
+    if served is not None:
+        typer.echo(served)
+        return
+
     # Lazy import: keeps ``tab --help`` and unrelated subcommands from
     # paying for pydantic-ai's import cost. Same pattern as
     # ``tab draw-dino``.
@@ -545,6 +867,15 @@ def think(
     # "no argument" branch covers the open-ended prompt path.
     user_input = " ".join(idea) if idea else ""
 
+    served = _forward_to_daemon(
+        _turn_request(
+            user_input, settings=settings, model=resolved_model, skill="think"
+        )
+    )
+    if served is not None:
+        typer.echo(served)
+        return
+
     # Lazy import: keeps ``tab --help`` and unrelated subcommands from
     # paying for pydantic-ai's import cost. Same pattern as
     # ``tab draw-dino`` and ``tab listen``.
@@ -595,10 +926,10 @@ def teach(
     """Teach a topic — direct port of the ``teach`` skill, with web search.
 
     Runs ``plugins/tab/skills/teach/SKILL.md`` as the system-prompt
-    delta on top of the Tab persona, with a ``web_search`` tool wired
-    into the pydantic-ai agent so the SKILL body's research phase can
-    query the web during the session. Prints the result to stdout and
-    exits.
+    delta on top of the Tab persona, with ``web_search`` and
+    ``web_search_many`` tools wired into the pydantic-ai agent so the
+    SKILL body's research phase can query the web during the session.
+    Prints the result to stdout and exits.
 
     Web search uses Exa when ``EXA_API_KEY`` is set. Without the key
     the tool runs in a graceful no-op mode and the SKILL body falls
@@ -630,11 +961,20 @@ def teach(
     # "no argument" branch covers the open-ended prompt path.
     user_input = " ".join(topic) if topic else ""
 
+    served = _forward_to_daemon(
+        _turn_request(
+            user_input, settings=settings, model=resolved_model, skill="teach"
+        )
+    )
+    if served is not None:
+        typer.echo(served)
+        return
+
     # Lazy imports: keep ``tab --help`` and unrelated subcommands from
     # paying for pydantic-ai or httpx import cost. Same pattern as the
     # other personality-skill ports.
     from tab_cli.skills import run_skill
-    from tab_cli.web_search import default_web_search
+    from tab_cli.web_search import default_web_search, default_web_search_many
 
     try:
         output = run_skill(
@@ -642,7 +982,7 @@ def teach(
             user_input,
             settings=settings,
             model=resolved_model,
-            tools=[default_web_search()],
+            tools=[default_web_search(), default_web_search_many()],
         )
     except Exception as exc:  # noqa: BLE001 — collapse to readable error
         typer.echo(f"tab: {exc}", err=True)
@@ -874,10 +1214,14 @@ def chat(
 
     Each turn: read input, route through the grimoire skill registry,
     dispatch a matched skill or stream an agent response. ``Ctrl-D``,
-    ``/exit``, and ``/quit`` end the session cleanly. Personality
+    ``/exit``, and ``/quit`` end the session cleanly; ``/stats`` shows
+    the last turn's token counts and Ollama timings. Personality
     settings can be adjusted mid-session (e.g. "set humor to 90%") on
     top of whatever ``--humor`` etc. established at startup.
 
+    ``tab --trace PATH chat`` (or ``TAB_TRACE``) appends one span per
+    phase of each turn to ``PATH`` — see :mod:`tab_cli.tracing`.
+
     Errors loading the agent or registry collapse to a readable stderr
     line plus exit code 1, matching ``tab ask``.
     """
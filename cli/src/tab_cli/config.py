@@ -5,11 +5,25 @@ The flag-mergers live elsewhere; this module exposes:
 - :func:`load_settings_from_config` — `[settings]` table for personality dials
 - :func:`load_default_model_from_config` — `[model].default` for the default
   model identifier when no `--model` flag is passed
+- :func:`load_grimoire_backend_from_config` — `[grimoire].backend` for the
+  skill registry's vector store
+- :func:`load_chat_history_tokens_from_config` — `[chat].history_tokens`
+  for the REPL's history budget
+- :func:`load_chat_speculate_from_config` — `[chat].speculate` for
+  whether the REPL starts the agent turn while routing is still running
+- :func:`load_ollama_options_from_config` — `[ollama]` `keep_alive` and
+  `num_ctx`, sent with every request to an ``ollama:`` model
 
-Both honor the same conventions: missing file is fine (returns nothing),
+All of them honor the same conventions: missing file is fine (returns nothing),
 malformed file warns once to stderr and falls through, individual invalid
 values warn and get dropped.
 
+The file is read and parsed once per process (:func:`_load_section`),
+however many loaders ask and however often — ``tab chat`` consults
+``[ollama]`` on every agent compile, and a settings nudge or skill
+dispatch shouldn't cost a disk read or repeat a warning. Edits take
+effect on the next ``tab`` invocation (or ``tab serve`` restart).
+
 All Tab user state lives under ``~/.tab/``: this config plus the
 grimoire-threshold overrides written by :mod:`tab_cli.grimoire_overrides`.
 The XDG_CONFIG_HOME env var is intentionally not honored — Tab uses the
@@ -20,15 +34,22 @@ indirection.
 
 from __future__ import annotations
 
+import functools
 import sys
 import tomllib
 from pathlib import Path
+from typing import Any
 
 # Personality settings the Tab agent accepts. Keys outside this set in the
 # config file are ignored silently — they may belong to a future setting
 # or a typo we don't want to be noisy about.
 _VALID_KEYS = ("humor", "directness", "warmth", "autonomy", "verbosity")
 
+# Vector stores the skill registry can seed. ``pgvector`` is grimoire's
+# shared Postgres pool (the default); ``memory`` is the in-process NumPy
+# index in :mod:`tab_cli.vector_index`, which needs no database.
+GRIMOIRE_BACKENDS = ("pgvector", "memory")
+
 
 def _config_path() -> Path:
     """Resolve the config path: ``~/.tab/config.toml``."""
@@ -39,17 +60,13 @@ def _warn(message: str) -> None:
     print(f"tab: {message}", file=sys.stderr)
 
 
-def load_settings_from_config() -> dict[str, int]:
-    """Load the `[settings]` table from the user's tab config.
+@functools.cache
+def _load_document(path: Path) -> dict[str, Any]:
+    """Parse the config at ``path``; ``{}`` when missing or unusable.
 
-    Returns a dict containing only keys that parsed and validated as
-    ints in [0, 100]. Missing file → empty dict, no warning. Malformed
-    TOML → empty dict with one stderr warning. Per-key validation
-    failures emit one stderr warning each and drop only the offending
-    key.
+    Cached per path, so a malformed file warns once per process rather
+    than once per loader.
     """
-    path = _config_path()
-
     try:
         raw = path.read_bytes()
     except FileNotFoundError:
@@ -59,12 +76,51 @@ def load_settings_from_config() -> dict[str, int]:
         return {}
 
     try:
-        data = tomllib.loads(raw.decode("utf-8"))
+        return tomllib.loads(raw.decode("utf-8"))
     except (tomllib.TOMLDecodeError, UnicodeDecodeError) as exc:
         _warn(f"ignoring malformed config {path}: {exc}")
         return {}
 
-    settings = data.get("settings")
+
+@functools.cache
+def _section(path: Path, name: str) -> dict[str, Any] | None:
+    section = _load_document(path).get(name)
+    if section is None:
+        return None
+    if not isinstance(section, dict):
+        _warn(f"ignoring invalid [{name}] section in {path} (must be a TOML table)")
+        return None
+    return section
+
+
+def _load_section(name: str) -> dict[str, Any] | None:
+    """Return the ``[name]`` table of the config, or ``None``.
+
+    ``None`` covers a missing file, a malformed file and an absent
+    section; a section that isn't a table warns once, like a malformed
+    file. Callers must not mutate the returned table — it is shared.
+    """
+    return _section(_config_path(), name)
+
+
+def _clear_cache() -> None:
+    """Forget everything read so far. For tests that rewrite the file."""
+    _load_document.cache_clear()
+    _section.cache_clear()
+    _ollama_options.cache_clear()
+
+
+def load_settings_from_config() -> dict[str, int]:
+    """Load the `[settings]` table from the user's tab config.
+
+    Returns a dict containing only keys that parsed and validated as
+    ints in [0, 100]. Missing file → empty dict, no warning. Malformed
+    TOML → empty dict with one stderr warning. Per-key validation
+    failures emit one stderr warning each and drop only the offending
+    key.
+    """
+    path = _config_path()
+    settings = _load_document(path).get("settings")
     if not isinstance(settings, dict):
         return {}
 
@@ -106,39 +162,156 @@ def load_default_model_from_config() -> str | None:
     error fires only when neither source resolves a model.
     """
     path = _config_path()
+    model_section = _load_section("model")
+    if model_section is None:
+        return None
 
-    try:
-        raw = path.read_bytes()
-    except FileNotFoundError:
+    default = model_section.get("default")
+    if default is None:
         return None
-    except OSError as exc:
-        _warn(f"could not read {path}: {exc}")
+    if not isinstance(default, str) or not default.strip():
+        _warn(
+            f"ignoring invalid model.default={default!r} in {path} "
+            "(must be a non-empty string like 'anthropic:claude-sonnet-4-5')"
+        )
         return None
 
-    try:
-        data = tomllib.loads(raw.decode("utf-8"))
-    except (tomllib.TOMLDecodeError, UnicodeDecodeError) as exc:
-        _warn(f"ignoring malformed config {path}: {exc}")
+    return default.strip()
+
+
+def load_grimoire_backend_from_config() -> str | None:
+    """Load `[grimoire].backend` from the user's tab config.
+
+    Returns one of :data:`GRIMOIRE_BACKENDS` when the key is present and
+    valid, ``None`` otherwise. Same conventions as
+    :func:`load_default_model_from_config`: silent on a missing file or
+    section, one stderr warning for a malformed file or value.
+    """
+    path = _config_path()
+    section = _load_section("grimoire")
+    if section is None:
         return None
 
-    model_section = data.get("model")
-    if model_section is None:
+    backend = section.get("backend")
+    if backend is None:
         return None
-    if not isinstance(model_section, dict):
+    if not isinstance(backend, str) or backend.strip() not in GRIMOIRE_BACKENDS:
         _warn(
-            f"ignoring invalid [model] section in {path} "
-            "(must be a TOML table)"
+            f"ignoring invalid grimoire.backend={backend!r} in {path} "
+            f"(must be one of: {', '.join(GRIMOIRE_BACKENDS)})"
         )
         return None
 
-    default = model_section.get("default")
-    if default is None:
+    return backend.strip()
+
+
+def load_chat_history_tokens_from_config() -> int | None:
+    """Load `[chat].history_tokens` from the user's tab config.
+
+    Returns the configured budget when it is a positive int, ``None``
+    otherwise. Same conventions as the loaders above: silent on a
+    missing file or section, one stderr warning for a malformed file or
+    value.
+    """
+    path = _config_path()
+    section = _load_section("chat")
+    if section is None:
         return None
-    if not isinstance(default, str) or not default.strip():
+
+    budget = section.get("history_tokens")
+    if budget is None:
+        return None
+    # ``bool`` is a subclass of ``int``; reject it explicitly, as the
+    # settings loader does.
+    if isinstance(budget, bool) or not isinstance(budget, int) or budget <= 0:
         _warn(
-            f"ignoring invalid model.default={default!r} in {path} "
-            "(must be a non-empty string like 'anthropic:claude-sonnet-4-5')"
+            f"ignoring invalid chat.history_tokens={budget!r} in {path} "
+            "(must be a positive integer)"
         )
         return None
 
-    return default.strip()
+    return budget
+
+
+def load_chat_speculate_from_config() -> bool | None:
+    """Load `[chat].speculate` from the user's tab config.
+
+    Returns the configured bool, or ``None`` when the file, section, or
+    key is absent — the REPL then picks its own default (on for
+    ``ollama:`` models, off for hosted ones). Same warning conventions
+    as the loaders above.
+    """
+    path = _config_path()
+    section = _load_section("chat")
+    if section is None:
+        return None
+
+    speculate = section.get("speculate")
+    if speculate is None:
+        return None
+    if not isinstance(speculate, bool):
+        _warn(
+            f"ignoring invalid chat.speculate={speculate!r} in {path} "
+            "(must be true or false)"
+        )
+        return None
+
+    return speculate
+
+
+def load_ollama_options_from_config() -> dict[str, float | str | int]:
+    """Load `[ollama]` `keep_alive` and `num_ctx` from the user's tab config.
+
+    Returns a dict with whichever of the two keys are present and valid,
+    ready to splat into :func:`tab_cli.models.shared_ollama_model`:
+
+    - ``keep_alive``: how long Ollama keeps the model loaded after a
+      request — a duration string (``"30m"``, ``"2h"``) or a number of
+      seconds; negative means indefinitely. A non-empty string or a
+      non-bool number.
+    - ``num_ctx``: context window in tokens. A positive int.
+
+    Same conventions as :func:`load_settings_from_config`: missing file
+    or section → empty dict; malformed file or value → one stderr
+    warning per process, offending key dropped. Returns a fresh dict
+    each call.
+    """
+    return dict(_ollama_options(_config_path()))
+
+
+@functools.cache
+def _ollama_options(path: Path) -> dict[str, float | str | int]:
+    # Cached on top of the section: this runs on every ``ollama:``
+    # agent compile, and an invalid value should warn once, not once
+    # per settings nudge.
+    section = _section(path, "ollama")
+    if section is None:
+        return {}
+
+    options: dict[str, float | str | int] = {}
+
+    keep_alive = section.get("keep_alive")
+    if keep_alive is not None:
+        if isinstance(keep_alive, str) and keep_alive.strip():
+            options["keep_alive"] = keep_alive.strip()
+        elif isinstance(keep_alive, (int, float)) and not isinstance(
+            keep_alive, bool
+        ):
+            options["keep_alive"] = keep_alive
+        else:
+            _warn(
+                f"ignoring invalid ollama.keep_alive={keep_alive!r} in {path} "
+                "(must be a duration like '30m' or a number of seconds)"
+            )
+
+    num_ctx = section.get("num_ctx")
+    if num_ctx is not None:
+        if isinstance(num_ctx, bool) or not isinstance(num_ctx, int) or num_ctx <= 0:
+            _warn(
+                f"ignoring invalid ollama.num_ctx={num_ctx!r} in {path} "
+                "(must be a positive integer)"
+            )
+        else:
+            options["num_ctx"] = num_ctx
+
+    return options
@@ -0,0 +1,470 @@
+"""``tab serve``: a long-lived local daemon, and the thin client that uses it.
+
+Every ``tab ask`` pays the whole cold start before the first token
+leaves: Python startup, Typer, pydantic-ai's import, ``tab.md`` and
+SKILL.md reads, agent construction, and a fresh HTTP pool to the
+model. ``tab serve`` pays that once. It listens on a Unix socket at
+``~/.tab/serve.sock`` and keeps, for its lifetime:
+
+- **Compiled agents**, in an LRU keyed by (skill, settings, model) —
+  the same per-model caching ``tab mcp`` does, widened to the dials
+  because each client resolves its own flags and config.
+- **Pooled model clients.** Every turn runs on the daemon's one event
+  loop, so the process-wide Ollama models
+  (:func:`tab_cli.models.shared_ollama_model`) keep their keep-alive
+  connections between invocations.
+- **The skill registry**, loaded on the first ``route`` request, so
+  ``tab route`` skips registry construction and the corpus seed check.
+
+The client half is stdlib-only on purpose. ``tab ask`` and the skill
+subcommands call :func:`forward` before importing anything heavy; when
+no daemon is listening it returns ``None`` within a ``connect()`` and
+the command runs in-process exactly as before. A daemon that *is*
+listening but fails the turn raises :class:`DaemonError`, which the
+CLI surfaces as the usual ``tab: <reason>`` line — the turn is not
+silently re-run locally, since it may already have spent tokens.
+
+Wire format: one JSON object per line each way, one request per
+connection::
+
+    -> {"v": 1, "op": "ask", "prompt": "...", "model": "...", "settings": {...}}
+    -> {"v": 1, "op": "skill", "skill": "teach", "prompt": "...", ...}
+    -> {"v": 1, "op": "route", "queries": ["...", ...]}
+    -> {"v": 1, "op": "ping"}
+    <- {"ok": true, "output": "..."}        (ask / skill; the pid for ping)
+    <- {"ok": true, "hits": [{...} | null]} (route)
+    <- {"ok": false, "error": "..."}
+
+A request with a different ``v`` gets ``{"ok": false, "unsupported":
+true}``, which the client treats like "no daemon" — an old daemon left
+running across an upgrade degrades to in-process execution rather
+than misreading requests.
+
+Agents run with the daemon's environment, not the client's: provider
+API keys, ``EXA_API_KEY`` and ``OLLAMA_HOST`` are read where
+``tab serve`` was started. Personality settings and the model name do
+travel with each request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import socket
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from tab_cli.registry import SkillRegistry
+
+# Bumped whenever a request or reply changes shape.
+PROTOCOL_VERSION = 1
+
+# Turn limits for both long-lived servers, ``tab serve`` and ``tab
+# mcp`` (:mod:`tab_cli.mcp_server` imports them from here, since this
+# module must stay stdlib-only and that one needn't).
+#
+# How many turns may run against a model at once. Extra requests queue
+# on the semaphore rather than failing. Four keeps a local Ollama
+# (which serialises generation per model unless ``OLLAMA_NUM_PARALLEL``
+# says otherwise) from being buried, while letting hosted providers
+# overlap network waits.
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Wall-clock cap on one request, queueing included. Generous on
+# purpose: a cold local model can take a while to load, and the point
+# is to stop one wedged call from holding a slot forever, not to race
+# healthy ones.
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 300.0
+
+# Distinct (skill, settings, model) combinations kept compiled. A
+# client's dials rarely change between invocations, so a handful covers
+# ``tab ask`` plus the four skill ports.
+DEFAULT_AGENT_CACHE_SIZE = 16
+
+# Longest request line the daemon reads. Prompts are user text plus a
+# route batch at most; 16 MiB leaves ``tab route --batch-size`` room.
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# How long the client waits for ``connect()``. A live daemon accepts
+# immediately; anything slower is treated as absent.
+_CONNECT_TIMEOUT_SECONDS = 1.0
+
+_SKILL_NAME = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+
+
+class DaemonError(RuntimeError):
+    """The daemon was reached but could not complete the request."""
+
+
+def socket_path() -> Path:
+    """Resolve the daemon socket: ``~/.tab/serve.sock``."""
+    return Path.home() / ".tab" / "serve.sock"
+
+
+# ------------------------------------------------------------------ client
+
+
+def forward(request: dict[str, Any], *, path: Path | None = None) -> Any | None:
+    """Send ``request`` to a running daemon and return its payload.
+
+    Returns ``None`` when no daemon is listening (no socket file, a
+    stale socket, or a daemon speaking another protocol version) so the
+    caller can run the request in-process. Returns the reply's
+    ``output`` for ``ask``/``skill`` and its ``hits`` for ``route``.
+
+    Raises:
+        DaemonError: the daemon answered with an error, or dropped the
+            connection mid-request.
+    """
+    target = path if path is not None else socket_path()
+    if not target.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(str(target))
+        except OSError:
+            # Refused / timed out: a socket file left behind by a
+            # daemon that died without cleaning up.
+            return None
+        # The turn itself is bounded by the daemon's request timeout.
+        sock.settimeout(None)
+        payload = {"v": PROTOCOL_VERSION, **request}
+        try:
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            reply = _read_line(sock)
+        except OSError as exc:
+            # Connected, so the daemon may already be running the turn:
+            # a reset or broken pipe here is its failure, not absence.
+            raise DaemonError(f"lost the connection to tab serve: {exc}") from exc
+    finally:
+        sock.close()
+
+    if not reply:
+        raise DaemonError("tab serve closed the connection without replying")
+    try:
+        message = json.loads(reply)
+    except json.JSONDecodeError as exc:
+        raise DaemonError(f"unreadable reply from tab serve: {exc.msg}") from exc
+    if not isinstance(message, dict):
+        raise DaemonError("unreadable reply from tab serve: expected a JSON object")
+    if message.get("unsupported"):
+        return None
+    if not message.get("ok"):
+        raise DaemonError(str(message.get("error") or "tab serve request failed"))
+    if "hits" in message:
+        return message["hits"]
+    return message.get("output")
+
+
+def _read_line(sock: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return b"".join(chunks).strip()
+
+
+class DaemonRegistry:
+    """``match_many`` over the daemon, for :func:`tab_cli.route.route_lines`.
+
+    Hits come back as plain :class:`RoutedHit` rows — ``route_lines``
+    reads only their four fields.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+
+    def match_many(self, queries: list[str]) -> list[RoutedHit | None]:
+        hits = forward({"op": "route", "queries": list(queries)}, path=self._path)
+        if hits is None:
+            raise DaemonError("tab serve stopped while routing")
+        return [RoutedHit(**hit) if hit is not None else None for hit in hits]
+
+
+@dataclass(frozen=True, slots=True)
+class RoutedHit:
+    """One gate verdict as it crosses the socket."""
+
+    name: str
+    similarity: float
+    threshold: float
+    passed: bool
+
+
+# ------------------------------------------------------------------ server
+
+
+class TabDaemon:
+    """Request handling for ``tab serve``, independent of the socket.
+
+    :meth:`handle` takes one decoded request and returns the reply
+    dict, so tests drive it directly; :meth:`serve` wraps it in the
+    Unix-socket listener.
+    """
+
+    def __init__(
+        self,
+        *,
+        compile_agent: Callable[..., Any] | None = None,
+        compile_skill: Callable[..., Any] | None = None,
+        load_registry: Callable[[], SkillRegistry] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        request_timeout: float | None = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        agent_cache_size: int = DEFAULT_AGENT_CACHE_SIZE,
+    ) -> None:
+        from functools import lru_cache
+
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        if request_timeout is not None and request_timeout <= 0:
+            raise ValueError(
+                f"request_timeout must be positive, got {request_timeout}"
+            )
+
+        self._compile_agent = compile_agent
+        self._compile_skill = compile_skill
+        self._load_registry = load_registry
+        self._max_concurrency = max_concurrency
+        self._request_timeout = request_timeout
+        self._slots: asyncio.Semaphore | None = None
+        self._registry: SkillRegistry | None = None
+        # Keyed on hashable snapshots so the cache never holds a live
+        # ``TabSettings``; the agent itself carries no per-run state.
+        self._agent_for = lru_cache(maxsize=agent_cache_size)(self._build_agent)
+
+    async def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one request. Never raises; failures become error replies."""
+        import asyncio
+
+        if request.get("v") != PROTOCOL_VERSION:
+            return {
+                "ok": False,
+                "unsupported": True,
+                "error": f"protocol version {request.get('v')!r} not supported",
+            }
+        op = request.get("op")
+        try:
+            if op == "ping":
+                return {"ok": True, "output": os.getpid()}
+            if op == "route":
+                return {"ok": True, "hits": await self._route(request)}
+            if op in ("ask", "skill"):
+                return {
+                    "ok": True,
+                    "output": await asyncio.wait_for(
+                        self._turn(request), timeout=self._request_timeout
+                    ),
+                }
+            return {"ok": False, "error": f"unknown op {op!r}"}
+        except TimeoutError:
+            return {
+                "ok": False,
+                "error": f"tab serve timed out after {self._request_timeout:g}s",
+            }
+        except Exception as exc:  # noqa: BLE001 — a bad request mustn't kill the daemon
+            return {"ok": False, "error": str(exc)}
+
+    async def _turn(self, request: dict[str, Any]) -> str:
+        import asyncio
+
+        prompt = request.get("prompt")
+        if not isinstance(prompt, str):
+            raise ValueError("request needs a string 'prompt'")
+        skill = request.get("skill") if request.get("op") == "skill" else None
+        if skill is not None and (
+            not isinstance(skill, str) or not _SKILL_NAME.match(skill)
+        ):
+            raise ValueError(f"invalid skill name {skill!r}")
+        settings = request.get("settings") or {}
+        if not isinstance(settings, dict):
+            raise ValueError("'settings' must be an object")
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_concurrency)
+        async with self._slots:
+            agent = self._agent_for(
+                skill, tuple(sorted(settings.items())), request.get("model")
+            )
+            result = await agent.run(prompt)
+        return result.output
+
+    def _build_agent(
+        self,
+        skill: str | None,
+        settings: tuple[tuple[str, int], ...],
+        model: str | None,
+    ) -> Any:
+        from tab_cli.settings import TabSettings
+
+        active = TabSettings(**dict(settings))
+        if skill is None:
+            compile_agent = self._compile_agent
+            if compile_agent is None:
+                from tab_cli.personality import compile_tab_agent as compile_agent
+            return compile_agent(settings=active, model=model)
+
+        compile_skill = self._compile_skill
+        if compile_skill is None:
+            from tab_cli.skills import compile_skill_agent as compile_skill
+        return compile_skill(
+            skill, settings=active, model=model, tools=_tools_for(skill)
+        )
+
+    async def _route(self, request: dict[str, Any]) -> list[dict[str, Any] | None]:
+        import asyncio
+
+        queries = request.get("queries")
+        if not isinstance(queries, list) or not all(
+            isinstance(query, str) for query in queries
+        ):
+            raise ValueError("request needs a 'queries' list of strings")
+        if self._registry is None:
+            self._registry = await asyncio.to_thread(self._registry_loader())
+        # The embedder call is blocking I/O; keep the loop free for turns.
+        hits = await asyncio.to_thread(self._registry.match_many, queries)
+        return [
+            {
+                "name": hit.name,
+                "similarity": float(hit.similarity),
+                "threshold": float(hit.threshold),
+                "passed": bool(hit.passed),
+            }
+            if hit is not None
+            else None
+            for hit in hits
+        ]
+
+    def _registry_loader(self) -> Callable[[], SkillRegistry]:
+        if self._load_registry is not None:
+            return self._load_registry
+
+        def load() -> SkillRegistry:
+            from tab_cli.registry import load_skill_registry
+
+            return load_skill_registry(Path(__file__).resolve().parents[3] / "plugins")
+
+        return load
+
+    async def serve(
+        self, path: Path, *, ready: Callable[[], None] | None = None
+    ) -> None:
+        """Listen on ``path`` until cancelled; remove the socket on the way out."""
+        import asyncio
+
+        _claim_socket(path)
+        # Owner-only from the moment it exists: the socket runs turns
+        # with this user's keys, and a chmod after bind would leave a
+        # window where anyone could connect. The umask is process-wide,
+        # so it is restored as soon as the bind is done.
+        previous_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._on_connection, path=str(path), limit=_MAX_REQUEST_BYTES
+            )
+        finally:
+            os.umask(previous_umask)
+        try:
+            if ready is not None:
+                ready()
+            async with server:
+                await server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+            from tab_cli.models import aclose_shared_models
+
+            await aclose_shared_models()
+
+    async def _on_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                reply: dict[str, Any] = {
+                    "ok": False,
+                    "error": f"invalid JSON: {exc.msg}",
+                }
+            else:
+                if isinstance(request, dict):
+                    reply = await self.handle(request)
+                else:
+                    reply = {"ok": False, "error": "request must be a JSON object"}
+            writer.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            # Client went away, or sent a line over the limit; nothing
+            # useful to say back.
+            pass
+        finally:
+            writer.close()
+
+
+def _tools_for(skill: str) -> list[Any]:
+    """Per-skill tools, matching what ``tab teach`` and ``tab chat`` register."""
+    if skill != "teach":
+        return []
+    from tab_cli.web_search import default_web_search, default_web_search_many
+
+    return [default_web_search(), default_web_search_many()]
+
+
+def _claim_socket(path: Path) -> None:
+    """Make ``path`` free for a new listener, or fail if a daemon owns it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(_CONNECT_TIMEOUT_SECONDS)
+        probe.connect(str(path))
+    except OSError:
+        path.unlink(missing_ok=True)  # stale: its daemon is gone
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"tab serve is already running on {path}")
+
+
+def run_daemon(
+    *,
+    path: Path | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    request_timeout: float | None = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    ready: Callable[[], None] | None = None,
+) -> None:
+    """Run ``tab serve`` in the foreground until SIGINT / SIGTERM."""
+    import asyncio
+    import signal
+
+    daemon = TabDaemon(max_concurrency=max_concurrency, request_timeout=request_timeout)
+    target = path if path is not None else socket_path()
+
+    async def main() -> None:
+        task = asyncio.ensure_future(daemon.serve(target, ready=ready))
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
@@ -0,0 +1,296 @@
+"""Embedding plumbing for the skill registry: an Ollama embedder plus a disk cache.
+
+Every ``tab chat`` / ``tab mcp`` start seeds grimoire with one row per
+``SKILL.md`` description, and seeding means embedding. Against a local
+Ollama that is one ``/api/embed`` round-trip per skill before the first
+prompt is accepted — the dominant cold-start cost, and it grows with
+the skill count even though the descriptions almost never change
+between runs.
+
+This module owns the tab-side half of that story:
+
+- :class:`OllamaEmbedder` — a thin wrapper over ``ollama-python``'s
+  ``embed`` call. ``identity`` (``ollama:<model>``) is what grimoire
+  records as the corpus embedder, so a model swap reads as a corpus
+  mismatch rather than silently mixing vector spaces. ``warm_up``
+  preloads the model for :mod:`tab_cli.warmup`.
+- :class:`EmbeddingCache` — a content-addressed store under
+  ``~/.tab/embeddings/``. The key is a hash of the embedder identity
+  plus the exact text, so an edited description or a different model
+  is a miss by construction; there is no invalidation step to forget.
+- :class:`CachedEmbedder` — glues the two together. Only texts in the
+  ``cacheable`` set (the skill descriptions) go through the disk cache;
+  user queries pass straight to the inner embedder. Persisting every
+  chat line to disk would grow without bound and quietly keep a
+  transcript of the user's input, neither of which this cache is for.
+
+The cache is advisory. A missing, unreadable, or corrupt entry is a
+miss, and a failed write is dropped — worst case the loader re-embeds,
+which is exactly what it did before the cache existed. That is the
+opposite trade from :mod:`tab_cli.grimoire_overrides`, whose file is
+user-edited and therefore loud on malformed input.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:  # avoid forcing grimoire's import path at module load
+    from grimoire.embeddings import Embedder
+
+
+# Embedding model the registry's thresholds are calibrated against —
+# see :data:`tab_cli.registry.DEFAULT_THRESHOLD`. Changing it shifts
+# every cosine score, so it's a constant rather than a runtime knob.
+DEFAULT_EMBED_MODEL = "nomic-embed-text"
+
+
+# Format version of an on-disk cache entry. Bumped only when the shape
+# changes incompatibly; entries from another version read as misses.
+_CACHE_FORMAT_VERSION = 1
+
+
+class EmbedderLike(Protocol):
+    """The slice of an embedder the registry relies on.
+
+    Pinned as a Protocol so test fakes stay honest about the surface —
+    the same instinct as :mod:`tab_cli.web_search`'s HTTP client
+    protocols.
+    """
+
+    @property
+    def identity(self) -> str: ...
+
+    def embed(self, text: str) -> list[float]: ...
+
+    def embed_many(self, texts: Sequence[str]) -> list[list[float]]: ...
+
+
+class OllamaEmbedder:
+    """Embed text through Ollama's native ``/api/embed`` endpoint.
+
+    ``host=None`` lets ``ollama-python`` resolve the daemon the usual
+    way (``OLLAMA_HOST``, then ``localhost:11434``), matching
+    :class:`tab_cli.models.OllamaNativeModel`. ``client`` is a test
+    seam; production callers leave it unset and a sync
+    :class:`ollama.Client` is built on first use.
+
+    ``keep_alive`` is sent with every request, as the chat model does
+    with ``[ollama].keep_alive``: each request resets Ollama's unload
+    timer, so an embed without it would cut a longer warm-up back to
+    the daemon's five-minute default.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBED_MODEL,
+        *,
+        host: str | None = None,
+        keep_alive: float | str | None = None,
+        client: Any | None = None,
+    ) -> None:
+        self._model = model
+        self._host = host
+        self._keep_alive = keep_alive
+        self._client = client
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def identity(self) -> str:
+        return f"ollama:{self._model}"
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed ``texts`` in one ``/api/embed`` request, preserving order."""
+        if not texts:
+            return []
+        response = self._get_client().embed(
+            model=self._model, input=list(texts), keep_alive=self._keep_alive
+        )
+        return [list(vector) for vector in response.embeddings]
+
+    def warm_up(self) -> None:
+        """Load the embedding model without embedding anything.
+
+        An ``/api/embed`` with empty input loads the model and returns
+        no vectors — the embed-side twin of
+        :meth:`tab_cli.models.OllamaNativeModel.warm_up`.
+        """
+        self._get_client().embed(
+            model=self._model, input="", keep_alive=self._keep_alive
+        )
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            # Lazy import: registry tests inject fakes and never need
+            # the ``ollama`` package on the import path.
+            from ollama import Client
+
+            self._client = Client(host=self._host)
+        return self._client
+
+
+def embedding_cache_dir() -> Path:
+    """Resolve the cache directory: ``~/.tab/embeddings/``.
+
+    Lives alongside :mod:`tab_cli.config`'s ``~/.tab/config.toml`` so
+    all Tab user state stays under one directory. Safe to delete at
+    any time; the next start re-embeds and repopulates it.
+    """
+    return Path.home() / ".tab" / "embeddings"
+
+
+class EmbeddingCache:
+    """Content-addressed on-disk store of embedding vectors.
+
+    One small JSON file per entry, named by
+    ``sha256(identity + NUL + text)``. Per-entry files keep writes
+    independent — two processes starting at once can both populate
+    the cache without a lock, and the atomic rename means a reader
+    never sees a torn entry.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self._root = root if root is not None else embedding_cache_dir()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @staticmethod
+    def key(identity: str, text: str) -> str:
+        """Return the content address for ``text`` under ``identity``."""
+        digest = hashlib.sha256()
+        digest.update(identity.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, identity: str, text: str) -> list[float] | None:
+        """Return the cached vector, or ``None`` on any kind of miss."""
+        path = self._path(identity, text)
+        try:
+            decoded = json.loads(path.read_bytes().decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(decoded, dict):
+            return None
+        if decoded.get("version") != _CACHE_FORMAT_VERSION:
+            return None
+        # The identity is already folded into the key; re-checking the
+        # stored value guards against a hand-copied cache directory.
+        if decoded.get("embedder") != identity:
+            return None
+
+        vector = decoded.get("vector")
+        if not isinstance(vector, list) or not vector:
+            return None
+        if not all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in vector
+        ):
+            return None
+        return [float(v) for v in vector]
+
+    def put(self, identity: str, text: str, vector: Sequence[float]) -> None:
+        """Persist ``vector``. Write failures are swallowed — see module docs."""
+        path = self._path(identity, text)
+        payload = {
+            "version": _CACHE_FORMAT_VERSION,
+            "embedder": identity,
+            "vector": [float(v) for v in vector],
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _path(self, identity: str, text: str) -> Path:
+        return self._root / f"{self.key(identity, text)}.json"
+
+
+class CachedEmbedder:
+    """An :class:`EmbedderLike` that consults an :class:`EmbeddingCache`.
+
+    Reports the inner embedder's ``identity`` unchanged: a cached vector
+    is bit-for-bit what the inner embedder produced, so grimoire's
+    corpus-level mismatch detection should see no difference.
+
+    ``cacheable`` is the set of texts allowed into the disk cache —
+    the loader passes the skill descriptions. Anything else is
+    embedded directly and never written.
+    """
+
+    def __init__(
+        self,
+        inner: EmbedderLike,
+        cache: EmbeddingCache,
+        *,
+        cacheable: Iterable[str] = (),
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._cacheable = frozenset(cacheable)
+
+    @property
+    def identity(self) -> str:
+        return self._inner.identity
+
+    def warm_up(self) -> None:
+        """Preload the inner embedder when it supports it."""
+        warm_up = getattr(self._inner, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> list[list[float]]:
+        """Serve cache hits from disk and embed every miss in one batch."""
+        identity = self.identity
+        out: list[list[float] | None] = []
+        missing: list[int] = []
+        for index, text in enumerate(texts):
+            vector = (
+                self._cache.get(identity, text) if text in self._cacheable else None
+            )
+            if vector is None:
+                missing.append(index)
+            out.append(vector)
+
+        if missing:
+            fresh = self._inner.embed_many([texts[i] for i in missing])
+            for index, vector in zip(missing, fresh, strict=True):
+                out[index] = vector
+                if texts[index] in self._cacheable:
+                    self._cache.put(identity, texts[index], vector)
+
+        return [vector for vector in out if vector is not None]
+
+
+def to_grimoire_embedder(embedder: EmbedderLike) -> Embedder:
+    """Adapt an :class:`EmbedderLike` to grimoire's embedder shape.
+
+    Goes through :func:`grimoire.embeddings.embedder_from_callable` —
+    the same seam the registry tests use for their fakes — so the
+    gate sees a plain single-text callable plus an identity string.
+    """
+    from grimoire.embeddings import embedder_from_callable
+
+    return embedder_from_callable(embedder.embed, identity=embedder.identity)
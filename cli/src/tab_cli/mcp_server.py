@@ -7,7 +7,12 @@ REPL — per the Tab CLI decision (KB doc 01KQ2YKTWGXQKYZZS56Y29KT0C):
 
 - ``ask_tab(prompt, model?)`` — one-shot wrap around the same agent
   the ``tab ask`` subcommand drives. Compile the personality, run a
-  single turn, return the response string.
+  single turn, return the response string. The tool is async
+  (``agent.run``, not ``run_sync``), so a host can fan several calls
+  out in parallel against one ``tab mcp`` process; a semaphore caps
+  how many reach the model at once and each call has a timeout.
+  Compiled agents are kept in a small LRU keyed by the effective model,
+  so repeat calls skip prompt assembly and model construction.
 - ``search_memory(query)`` — v0 placeholder. The decision keeps the
   KB inside the tab-for-projects MCP and grimoire as a routing layer;
   CLI-side memory search isn't in scope yet, but the surface is
@@ -28,9 +33,16 @@ single-sourced.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
-from tab_cli.personality import TabSettings
+# How many ``ask_tab`` calls may run a model turn at once, and how long
+# one may take — the same limits ``tab serve`` applies, defined once in
+# :mod:`tab_cli.daemon` (with the reasoning) and re-exported here.
+from tab_cli.daemon import DEFAULT_MAX_CONCURRENCY, DEFAULT_REQUEST_TIMEOUT_SECONDS
+from tab_cli.settings import TabSettings
 
 if TYPE_CHECKING:  # pragma: no cover — typing-only imports
     from fastmcp import FastMCP
@@ -45,6 +57,31 @@ _SEARCH_MEMORY_STUB = (
 )
 
 
+
+
+# How many compiled agents ``build_server`` keeps, one per distinct
+# effective model. Settings are fixed for the server's lifetime, so the
+# model is the only thing that varies; hosts rarely use more than a
+# couple, and an evicted agent just recompiles on next use.
+DEFAULT_AGENT_CACHE_SIZE = 8
+
+
+@asynccontextmanager
+async def _close_models_on_shutdown(_server: Any) -> AsyncIterator[None]:
+    """Server lifespan: close pooled Ollama clients when the server stops.
+
+    ``ask_tab`` runs on the server's event loop, so the shared models'
+    HTTP pools live there too and must be closed before that loop goes
+    away — see :func:`tab_cli.models.aclose_shared_models`.
+    """
+    try:
+        yield
+    finally:
+        from tab_cli.models import aclose_shared_models
+
+        await aclose_shared_models()
+
+
 def _default_compile() -> Callable[..., Any]:
     """Return the real ``compile_tab_agent`` callable.
 
@@ -63,6 +100,9 @@ def build_server(
     model: str | None = None,
     compile_agent: Callable[..., Any] | None = None,
     name: str = "tab",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    request_timeout: float | None = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    agent_cache_size: int = DEFAULT_AGENT_CACHE_SIZE,
 ) -> FastMCP:
     """Build a FastMCP server with the two Tab tools registered.
 
@@ -71,7 +111,8 @@ def build_server(
             :class:`TabSettings`'s field defaults (which mirror the
             tab.md Settings table). The same settings are reused for
             every ``ask_tab`` call within a server lifetime — recompile
-            by restarting the server.
+            by restarting the server. That is what makes the compiled
+            agent cacheable per model.
         model: Default pydantic-ai model name in ``provider:name``
             form. Calls to ``ask_tab`` may override this per-call via
             their own ``model`` argument; otherwise this value is used.
@@ -80,6 +121,13 @@ def build_server(
             Production callers leave this ``None``.
         name: Server name advertised over MCP. Defaults to ``"tab"`` —
             what Claude Code et al. will see in their MCP tool listing.
+        max_concurrency: Upper bound on ``ask_tab`` calls running a
+            model turn at once; the rest wait their turn.
+        request_timeout: Seconds one ``ask_tab`` call may take, waiting
+            for a slot included, before it fails with a tool error.
+            ``None`` disables the limit.
+        agent_cache_size: How many compiled agents to keep, keyed by
+            effective model name, least recently used evicted first.
 
     Returns:
         A configured :class:`fastmcp.FastMCP` server with ``ask_tab``
@@ -90,6 +138,14 @@ def build_server(
     # of FastMCP's import cost. Same instinct as the personality and
     # chat lazy imports in ``cli.py``.
     from fastmcp import FastMCP
+    from fastmcp.exceptions import ToolError
+
+    if max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency must be at least 1, got {max_concurrency}"
+        )
+    if request_timeout is not None and request_timeout <= 0:
+        raise ValueError(f"request_timeout must be positive, got {request_timeout}")
 
     active_settings = settings if settings is not None else TabSettings()
     compile_fn = compile_agent if compile_agent is not None else _default_compile()
@@ -98,7 +154,18 @@ def build_server(
     # ``model_default`` unambiguously.
     model_default = model
 
-    mcp: FastMCP = FastMCP(name=name)
+    # One compiled agent per effective model. ``lru_cache`` is
+    # thread-safe, and pydantic-ai agents hold no per-run state, so
+    # concurrent calls can share one. Two racing first calls for the
+    # same model may both compile; the loser's agent is simply dropped.
+    @lru_cache(maxsize=agent_cache_size)
+    def agent_for(effective_model: str | None) -> Any:
+        return compile_fn(settings=active_settings, model=effective_model)
+
+    # Created here, bound to the server's loop on first ``acquire``.
+    slots = asyncio.Semaphore(max_concurrency)
+
+    mcp: FastMCP = FastMCP(name=name, lifespan=_close_models_on_shutdown)
 
     @mcp.tool(
         name="ask_tab",
@@ -109,7 +176,7 @@ def build_server(
             "``anthropic:claude-sonnet-4``)."
         ),
     )
-    def ask_tab(prompt: str, model: str | None = None) -> str:
+    async def ask_tab(prompt: str, model: str | None = None) -> str:
         """Run a single Tab turn and return the response text.
 
         Mirrors ``tab ask`` exactly: compile the personality, run one
@@ -118,11 +185,26 @@ def build_server(
         of dials are deliberately not exposed — clients that want to
         change Tab's voice should restart the server with new flags
         (or use ``tab ask`` directly), keeping the MCP surface narrow.
+
+        Runs on the server's event loop via ``agent.run``, so other
+        requests keep flowing while the model works. The timeout
+        covers the wait for a slot as well as the turn itself — from
+        the host's side, both are "Tab hasn't answered yet".
         """
         effective_model = model if model is not None else model_default
-        agent = compile_fn(settings=active_settings, model=effective_model)
-        result = agent.run_sync(prompt)
-        return result.output
+
+        async def _turn() -> str:
+            async with slots:
+                agent = agent_for(effective_model)
+                result = await agent.run(prompt)
+                return result.output
+
+        try:
+            return await asyncio.wait_for(_turn(), timeout=request_timeout)
+        except TimeoutError as exc:
+            raise ToolError(
+                f"ask_tab timed out after {request_timeout:g}s"
+            ) from exc
 
     @mcp.tool(
         name="search_memory",
@@ -153,6 +235,8 @@ def run_server(
     *,
     settings: TabSettings | None = None,
     model: str | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    request_timeout: float | None = DEFAULT_REQUEST_TIMEOUT_SECONDS,
 ) -> None:
     """Run the Tab MCP server on stdio until the client disconnects.
 
@@ -161,9 +245,26 @@ def run_server(
     and reaps the process on shutdown. We don't expose HTTP or SSE at
     v0; that's a deferred surface decision.
 
+    A local default model is preloaded in the background as the server
+    starts — see :mod:`tab_cli.warmup`.
+
     Errors during build or run propagate so the Typer wrapper in
     ``cli.py`` can collapse them to the standard ``tab: <reason>``
     one-line stderr message.
     """
-    mcp = build_server(settings=settings, model=model)
+    mcp = build_server(
+        settings=settings,
+        model=model,
+        max_concurrency=max_concurrency,
+        request_timeout=request_timeout,
+    )
+
+    # Preload the default model while the host is still initialising
+    # the session, so the first ``ask_tab`` doesn't pay for the load.
+    # Per-call ``model`` overrides are loaded on demand as before; the
+    # server never routes skills, so there is no embedder to warm.
+    from tab_cli.personality import resolve_model
+    from tab_cli.warmup import start_warm_up
+
+    start_warm_up(resolve_model(model))
     mcp.run(transport="stdio", show_banner=False)
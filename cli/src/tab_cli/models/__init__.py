@@ -8,6 +8,18 @@ extends ``OpenAIChatModel`` and routes through Ollama's ``/v1`` OpenAI-compat
 endpoint, which has model-registration drift on some installs.
 """
 
-from tab_cli.models.ollama_native import OllamaNativeModel
+from tab_cli.models.ollama_native import (
+    OllamaNativeModel,
+    OllamaTurnMetrics,
+    aclose_shared_models,
+    close_shared_models,
+    shared_ollama_model,
+)
 
-__all__ = ("OllamaNativeModel",)
+__all__ = (
+    "OllamaNativeModel",
+    "OllamaTurnMetrics",
+    "aclose_shared_models",
+    "close_shared_models",
+    "shared_ollama_model",
+)
@@ -17,14 +17,37 @@ talks to Ollama natively. Callers stay uniform: every backend looks like
 Tools, message-history threading, and structured output ride on pydantic-ai's
 abstractions — Ollama's ``/api/chat`` supports tool calls in the same shape,
 so the translation layer here is mechanical rather than inventive.
+
+Generation settings travel the same way. pydantic-ai's ``ModelSettings``
+(``max_tokens``, ``temperature``, ``top_p``, ``seed``, ``stop_sequences``,
+the two penalties) map onto Ollama's ``options``. ``num_ctx`` and
+``keep_alive`` are per-model rather than per-request — they come from
+``[ollama]`` in ``~/.tab/config.toml`` via :func:`shared_ollama_model` —
+because they decide whether the daemon reloads the weights: a request
+with a different ``num_ctx`` forces a reload, and the default
+five-minute ``keep_alive`` unloads the model between CLI invocations.
+
+Usage comes back the same way. Ollama reports token counts
+(``prompt_eval_count``, ``eval_count``) and a nanosecond timing
+breakdown (``load_duration``, ``prompt_eval_duration``,
+``eval_duration``, ``total_duration``) on every final response; the
+counts land in ``RequestUsage.input_tokens`` / ``output_tokens`` and
+the timings in ``RequestUsage.details`` under Ollama's own names.
+:class:`OllamaTurnMetrics` folds one turn's responses into the numbers
+worth reading — tokens per second, time to first token, load time.
 """
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterable, AsyncIterator
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
+from operator import attrgetter
 from typing import Any, cast
 
 from ollama import AsyncClient as _OllamaAsyncClient
@@ -44,6 +67,55 @@ from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
 from pydantic_ai.profiles import ModelProfileSpec
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.tools import ToolDefinition
+from pydantic_ai.usage import RequestUsage
+
+from tab_cli import tracing
+
+# pydantic-ai ``ModelSettings`` key → Ollama ``options`` key. Settings
+# Ollama has no equivalent for (``timeout``, ``logit_bias``,
+# ``parallel_tool_calls``, ...) are dropped.
+_OPTION_NAMES = {
+    "max_tokens": "num_predict",
+    "temperature": "temperature",
+    "top_p": "top_p",
+    "seed": "seed",
+    "stop_sequences": "stop",
+    "presence_penalty": "presence_penalty",
+    "frequency_penalty": "frequency_penalty",
+}
+
+# Ollama's per-response timings, all in nanoseconds. Copied into
+# ``RequestUsage.details`` verbatim when present.
+_TIMING_FIELDS = (
+    "load_duration",
+    "prompt_eval_duration",
+    "eval_duration",
+    "total_duration",
+)
+
+
+def _usage_attributes(response: _OllamaChatResponse) -> dict[str, int]:
+    """Ollama's counts and timings as ``model.request`` span attributes."""
+    usage = _request_usage(response)
+    return {
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        **usage.details,
+    }
+
+
+def _request_usage(response: _OllamaChatResponse) -> RequestUsage:
+    """Map a final Ollama response's counts and timings onto ``RequestUsage``."""
+    details: dict[str, int] = {}
+    for name in _TIMING_FIELDS:
+        value = getattr(response, name, None)
+        if value:
+            details[name] = int(value)
+    return RequestUsage(
+        input_tokens=response.prompt_eval_count or 0,
+        output_tokens=response.eval_count or 0,
+        details=details,
+    )
 
 
 class OllamaNativeModel(Model):
@@ -60,6 +132,11 @@ class OllamaNativeModel(Model):
     The ``host`` argument lets callers point at a non-default Ollama daemon;
     when ``None`` (the default), ``ollama-python`` resolves the host from
     its environment-aware logic (``OLLAMA_HOST``, then ``localhost:11434``).
+
+    ``keep_alive`` (seconds, or a duration string like ``"30m"``; negative
+    keeps the model loaded indefinitely) and ``num_ctx`` (context window,
+    in tokens) are sent with every request. ``None`` leaves each at the
+    Ollama daemon's default.
     """
 
     def __init__(
@@ -69,15 +146,37 @@ class OllamaNativeModel(Model):
         host: str | None = None,
         settings: ModelSettings | None = None,
         profile: ModelProfileSpec | None = None,
+        keep_alive: float | str | None = None,
+        num_ctx: int | None = None,
     ) -> None:
         super().__init__(settings=settings, profile=profile)
         self._model_name = model_name
         self._host = host
+        self._keep_alive = keep_alive
+        self._num_ctx = num_ctx
         # ``ollama-python`` constructs an ``httpx.AsyncClient`` lazily and
-        # honors ``OLLAMA_HOST`` when ``host=None``. We keep one instance
-        # per model — pydantic-ai's ``Agent`` holds the model for the
-        # session, so the client lifetime matches.
+        # honors ``OLLAMA_HOST`` when ``host=None``. :func:`shared_ollama_model`
+        # keeps one model per (name, host, keep_alive, num_ctx), so agent
+        # recompiles reuse the same connection pool. ``_client`` is the
+        # pool of the first event loop to use the model.
         self._client = _OllamaAsyncClient(host=host)
+        # One client per event loop. httpx connections are bound to the
+        # loop that opened them, and a shared model can be in use on
+        # several loops at once — the REPL's turn loop, ``tab mcp``'s
+        # worker threads, a batch run — so each loop gets its own pool
+        # and keeps it while the loop is open. Keyed by weak reference
+        # so a finished loop isn't kept alive, but in a plain dict rather
+        # than a ``WeakKeyDictionary``: an entry must outlive its loop
+        # long enough for :meth:`_bound_client` to close the pool, not
+        # vanish with it.
+        self._clients: dict[
+            weakref.ref[asyncio.AbstractEventLoop], _OllamaAsyncClient
+        ] = {}
+        self._clients_lock = threading.Lock()
+        self._client_claimed = False
+        # Per-message translations, reused across turns. See
+        # :class:`_TranslationMemo` for why this is safe to share.
+        self._translations = _TranslationMemo(self._translate_message)
 
     # --- pydantic-ai Model abstract surface ---
 
@@ -103,21 +202,173 @@ class OllamaNativeModel(Model):
         # class's ``__aenter__/__aexit__`` no-op cleanly.
         return None
 
+    def close(self) -> None:
+        """Close the underlying HTTP connection pools.
+
+        Runs each client's ``aclose`` on the loop the client was used
+        on, which is only possible from outside that loop — the REPL and
+        ``tab mcp`` call this once their loops have gone idle at
+        shutdown. A client whose loop is gone, closed or still running
+        is simply dropped; the sockets die with the process either way.
+        """
+        with self._clients_lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for ref, client in clients:
+            loop = ref()
+            http_client = getattr(client, "_client", None)
+            if loop is None or loop.is_closed() or loop.is_running():
+                continue
+            if http_client is None or not hasattr(http_client, "aclose"):
+                continue
+            loop.run_until_complete(http_client.aclose())
+
+    async def aclose(self) -> None:
+        """Async counterpart of :meth:`close`, for callers on a client's loop.
+
+        ``tab mcp`` runs ``ask_tab`` on the server's own loop, so by the
+        time :meth:`close` could run, that loop is gone; the server's
+        lifespan awaits this instead while the loop is still alive.
+        Closes the running loop's pool and those of loops that have
+        finished; a loop still running elsewhere keeps its own.
+        """
+        running = asyncio.get_running_loop()
+        with self._clients_lock:
+            retired = [
+                self._clients.pop(ref)
+                for ref in list(self._clients)
+                if ref() is running or _finished(ref)
+            ]
+        for client in retired:
+            http_client = getattr(client, "_client", None)
+            if http_client is not None and hasattr(http_client, "aclose"):
+                await _aclose_quietly(http_client)
+
+    def warm_up(self) -> None:
+        """Load the model into Ollama's memory without generating anything.
+
+        ``/api/chat`` with no messages is Ollama's documented preload: it
+        loads the weights and holds them for ``keep_alive``. ``num_ctx``
+        is sent too, because a later request with a different context
+        size would reload the model and throw the warm-up away.
+
+        Blocking, and deliberately on a throwaway sync client rather than
+        :attr:`_client`: :func:`tab_cli.warmup.start_warm_up` calls this
+        from its own thread, and the async pool is bound to the loop the
+        turns run on (see :meth:`_bound_client`).
+        """
+        from ollama import Client
+
+        options = {"num_ctx": self._num_ctx} if self._num_ctx is not None else None
+        client = Client(host=self._host)
+        try:
+            client.chat(
+                model=self._model_name,
+                messages=[],
+                options=options,
+                keep_alive=self._keep_alive,
+            )
+        finally:
+            # ``ollama.Client`` isn't a context manager; its httpx pool
+            # is closed directly, as :meth:`close` does for the async one.
+            http_client = getattr(client, "_client", None)
+            if http_client is not None and hasattr(http_client, "close"):
+                http_client.close()
+
+    def _bound_client(self) -> _OllamaAsyncClient:
+        """Return the running loop's client, creating it on first use.
+
+        The first loop ever to ask gets :attr:`_client`; each later one
+        a fresh client. Binding a new loop is also when the pools of
+        finished loops (closed, or collected) are closed — never a live
+        loop's, which may have requests in flight.
+        """
+        loop = asyncio.get_running_loop()
+        key = weakref.ref(loop)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is not None:
+                return client
+            retired = [
+                self._clients.pop(ref) for ref in list(self._clients) if _finished(ref)
+            ]
+            if self._client_claimed:
+                client = _OllamaAsyncClient(host=self._host)
+            else:
+                client = self._client
+                self._client_claimed = True
+            self._clients[key] = client
+        for stale in retired:
+            self._retire_client(stale)
+        return client
+
+    @staticmethod
+    def _retire_client(client: _OllamaAsyncClient) -> None:
+        """Close a finished loop's pool from the running loop.
+
+        The loop it belonged to will never run again, so the close is
+        scheduled here; connections bound to that loop may not shut down
+        cleanly from another, and :func:`_aclose_quietly` drops whatever
+        they raise — the pool is emptied either way, which is what stops
+        it leaking.
+        """
+        http_client = getattr(client, "_client", None)
+        if http_client is None or not hasattr(http_client, "aclose"):
+            return
+        task = asyncio.get_running_loop().create_task(_aclose_quietly(http_client))
+        _RETIRING.add(task)
+        task.add_done_callback(_RETIRING.discard)
+
+    def _request_options(
+        self, model_settings: ModelSettings | None
+    ) -> tuple[dict[str, Any] | None, float | str | None]:
+        """Return ``(options, keep_alive)`` for one ``/api/chat`` call.
+
+        ``model_settings`` is the merged view from :meth:`prepare_request`
+        (model, agent and run settings). A mapping under ``extra_body`` is
+        the escape hatch for Ollama-only knobs (``top_k``, ``num_ctx`` per
+        call, ...): its entries land in ``options`` last, and a
+        ``keep_alive`` entry there overrides the model's.
+        """
+        options: dict[str, Any] = {}
+        if self._num_ctx is not None:
+            options["num_ctx"] = self._num_ctx
+        keep_alive = self._keep_alive
+        if model_settings:
+            for setting, option in _OPTION_NAMES.items():
+                value = model_settings.get(setting)
+                if value is not None:
+                    options[option] = value
+            extra = model_settings.get("extra_body")
+            if isinstance(extra, dict):
+                extra = dict(extra)
+                keep_alive = extra.pop("keep_alive", keep_alive)
+                options.update(extra)
+        return options or None, keep_alive
+
     async def request(
         self,
         messages: list[ModelMessage],
         model_settings: ModelSettings | None,
         model_request_parameters: ModelRequestParameters,
     ) -> ModelResponse:
-        ollama_messages = self._translate_messages(messages)
-        ollama_tools = self._translate_tools(model_request_parameters.function_tools)
-
-        response = await self._client.chat(
-            model=self._model_name,
-            messages=ollama_messages,
-            tools=ollama_tools,
-            stream=False,
+        model_settings, model_request_parameters = self.prepare_request(
+            model_settings, model_request_parameters
         )
+        ollama_messages = self._translations.translate(messages)
+        ollama_tools = self._translate_tools(model_request_parameters.function_tools)
+        options, keep_alive = self._request_options(model_settings)
+
+        with tracing.span("model.request", model=self._model_name) as span:
+            response = await self._bound_client().chat(
+                model=self._model_name,
+                messages=ollama_messages,
+                tools=ollama_tools,
+                stream=False,
+                options=options,
+                keep_alive=keep_alive,
+            )
+            span.set(**_usage_attributes(response))
         return self._translate_response(response)
 
     @asynccontextmanager
@@ -138,24 +389,34 @@ class OllamaNativeModel(Model):
         ``ModelResponseStreamEvent`` shape via the parts manager.
 
         The ``run_context`` parameter mirrors pydantic-ai's signature but
-        isn't used here — Ollama doesn't accept a run context, and the
-        per-call overrides we'd need it for (model-settings tweaks,
-        cancellation tokens) aren't wired through yet. Tracking as
-        deliberate: when a caller surfaces a real need for run-context
-        plumbing on the Ollama path, it lands here.
+        isn't used here — Ollama doesn't accept a run context. Model
+        settings arrive through ``model_settings`` like the non-streamed
+        path; cancellation is closing the stream, which stops generation.
         """
-        ollama_messages = self._translate_messages(messages)
+        model_settings, model_request_parameters = self.prepare_request(
+            model_settings, model_request_parameters
+        )
+        ollama_messages = self._translations.translate(messages)
         ollama_tools = self._translate_tools(model_request_parameters.function_tools)
+        options, keep_alive = self._request_options(model_settings)
 
         # ``ollama-python`` returns the iterator directly when
         # ``stream=True``; the await is for the request setup, not for
         # the full response body.
-        response_iter = await self._client.chat(
+        with tracing.span(
+            "model.request_setup",
             model=self._model_name,
-            messages=ollama_messages,
-            tools=ollama_tools,
-            stream=True,
-        )
+            messages=len(ollama_messages),
+            tools=len(ollama_tools or ()),
+        ):
+            response_iter = await self._bound_client().chat(
+                model=self._model_name,
+                messages=ollama_messages,
+                tools=ollama_tools,
+                stream=True,
+                options=options,
+                keep_alive=keep_alive,
+            )
 
         yield _OllamaStreamedResponse(
             model_request_parameters=model_request_parameters,
@@ -178,64 +439,77 @@ class OllamaNativeModel(Model):
         """
         out: list[dict[str, Any]] = []
         for msg in messages:
-            if isinstance(msg, ModelRequest):
-                for part in msg.parts:
-                    if isinstance(part, SystemPromptPart):
-                        out.append({"role": "system", "content": part.content})
-                    elif isinstance(part, UserPromptPart):
-                        # ``content`` is ``str | Sequence[UserContent]``;
-                        # multi-modal support is out of scope for v0, so we
-                        # flatten any sequence by stringifying parts. Real
-                        # multi-modal handling lands when Tab grows image
-                        # support.
-                        if isinstance(part.content, str):
-                            text = part.content
-                        else:
-                            text = "".join(
-                                p if isinstance(p, str) else "" for p in part.content
-                            )
-                        out.append({"role": "user", "content": text})
-                    elif isinstance(part, ToolReturnPart):
-                        out.append(
-                            {
-                                "role": "tool",
-                                "content": part.model_response_str(),
-                                "tool_name": part.tool_name,
-                            }
+            out.extend(OllamaNativeModel._translate_message(msg))
+        return out
+
+    @staticmethod
+    def _translate_message(msg: ModelMessage) -> list[dict[str, Any]]:
+        """Translate one pydantic-ai message into its Ollama wire messages.
+
+        A ``ModelRequest`` fans out to one wire message per part; a
+        ``ModelResponse`` collapses to a single assistant message. The
+        result depends only on ``msg``, which is what lets
+        :class:`_TranslationMemo` reuse it across turns.
+        """
+        out: list[dict[str, Any]] = []
+        if isinstance(msg, ModelRequest):
+            for part in msg.parts:
+                if isinstance(part, SystemPromptPart):
+                    out.append({"role": "system", "content": part.content})
+                elif isinstance(part, UserPromptPart):
+                    # ``content`` is ``str | Sequence[UserContent]``;
+                    # multi-modal support is out of scope for v0, so we
+                    # flatten any sequence by stringifying parts. Real
+                    # multi-modal handling lands when Tab grows image
+                    # support.
+                    if isinstance(part.content, str):
+                        text = part.content
+                    else:
+                        text = "".join(
+                            p if isinstance(p, str) else "" for p in part.content
                         )
-                    # Other request-side parts (e.g. RetryPromptPart) are
-                    # dropped here — Ollama doesn't have a representation
-                    # for retry-context, so the agent loop has to surface
-                    # those issues via the user-content path. Tracking
-                    # this as an explicit limitation rather than silently
-                    # carrying potentially-misleading data.
-            elif isinstance(msg, ModelResponse):
-                # Reconstruct the assistant turn from pydantic-ai's parts.
-                content_segments: list[str] = []
-                tool_calls: list[dict[str, Any]] = []
-                for part in msg.parts:
-                    if isinstance(part, TextPart):
-                        content_segments.append(part.content)
-                    elif isinstance(part, ToolCallPart):
-                        tool_calls.append(
-                            {
-                                "function": {
-                                    "name": part.tool_name,
-                                    "arguments": part.args_as_dict(),
-                                }
+                    out.append({"role": "user", "content": text})
+                elif isinstance(part, ToolReturnPart):
+                    out.append(
+                        {
+                            "role": "tool",
+                            "content": part.model_response_str(),
+                            "tool_name": part.tool_name,
+                        }
+                    )
+                # Other request-side parts (e.g. RetryPromptPart) are
+                # dropped here — Ollama doesn't have a representation
+                # for retry-context, so the agent loop has to surface
+                # those issues via the user-content path. Tracking
+                # this as an explicit limitation rather than silently
+                # carrying potentially-misleading data.
+        elif isinstance(msg, ModelResponse):
+            # Reconstruct the assistant turn from pydantic-ai's parts.
+            content_segments: list[str] = []
+            tool_calls: list[dict[str, Any]] = []
+            for part in msg.parts:
+                if isinstance(part, TextPart):
+                    content_segments.append(part.content)
+                elif isinstance(part, ToolCallPart):
+                    tool_calls.append(
+                        {
+                            "function": {
+                                "name": part.tool_name,
+                                "arguments": part.args_as_dict(),
                             }
-                        )
-                    # ThinkingPart, FilePart, etc. are dropped — Ollama
-                    # doesn't roundtrip them. If a model emitted thinking
-                    # in a previous turn, Ollama will regenerate its own
-                    # for the next turn anyway.
-                msg_dict: dict[str, Any] = {
-                    "role": "assistant",
-                    "content": "".join(content_segments),
-                }
-                if tool_calls:
-                    msg_dict["tool_calls"] = tool_calls
-                out.append(msg_dict)
+                        }
+                    )
+                # ThinkingPart, FilePart, etc. are dropped — Ollama
+                # doesn't roundtrip them. If a model emitted thinking
+                # in a previous turn, Ollama will regenerate its own
+                # for the next turn anyway.
+            msg_dict: dict[str, Any] = {
+                "role": "assistant",
+                "content": "".join(content_segments),
+            }
+            if tool_calls:
+                msg_dict["tool_calls"] = tool_calls
+            out.append(msg_dict)
         return out
 
     @staticmethod
@@ -267,12 +541,8 @@ class OllamaNativeModel(Model):
         """Convert an Ollama ``ChatResponse`` back into a pydantic-ai
         ``ModelResponse`` so the agent loop can consume it normally.
 
-        Token-usage accounting is intentionally minimal here — Ollama
-        returns ``prompt_eval_count`` and ``eval_count`` on the response,
-        but pydantic-ai's ``RequestUsage`` shape includes more fields than
-        Ollama exposes. We leave usage at the default zero values; if a
-        caller starts depending on token-usage telemetry, this is the spot
-        to wire it in.
+        Usage carries Ollama's token counts and timings — see the module
+        docstring and :func:`_request_usage`.
         """
         parts: list[Any] = []
         msg = response.message
@@ -294,11 +564,268 @@ class OllamaNativeModel(Model):
                 )
         return ModelResponse(
             parts=parts,
+            usage=_request_usage(response),
             model_name=self._model_name,
             provider_name="ollama",
         )
 
 
+@dataclass(slots=True)
+class _MemoEntry:
+    message: weakref.ref[ModelMessage]
+    parts: tuple[Any, ...]
+    translated: list[dict[str, Any]]
+
+
+def _flat_parts(messages: Sequence[ModelMessage]) -> tuple[Any, ...]:
+    # All-C iteration (``chain`` / ``map`` / ``attrgetter``): snapshotting
+    # a few thousand messages costs tens of microseconds.
+    return tuple(chain.from_iterable(map(attrgetter("parts"), messages)))
+
+
+class _TranslationMemo:
+    """Reuse wire translations across requests.
+
+    pydantic-ai threads the same message objects from turn to turn —
+    ``run_chat`` feeds ``all_messages()`` back in as ``message_history``
+    — so translating the whole history on every request is quadratic
+    over a session. Two layers keep each request down to the new tail:
+
+    - **Prefix.** The previous request's messages, a flat snapshot of
+      their parts, and the wire output. When the new history starts
+      with the same messages holding the same parts, the previous
+      output is reused wholesale. Both comparisons run as tuple ``==``,
+      which short-circuits on identity in C, so this check stays in the
+      tens of microseconds even for thousands of messages.
+    - **Per message.** Translations keyed on message identity and
+      revalidated against a snapshot of the message's ``parts``. This
+      covers what the prefix can't: interleaved conversations sharing
+      one model (concurrent ``tab mcp`` requests) and histories whose
+      head changed. Entries drop when their message is collected.
+
+    Either way, a message whose part list was replaced or edited in
+    place (pydantic-ai does this for dynamic system prompts) or a new
+    message object (its history cleaning merges consecutive requests)
+    is translated afresh.
+    """
+
+    def __init__(
+        self,
+        translate_one: Callable[[ModelMessage], list[dict[str, Any]]],
+    ) -> None:
+        self._translate_one = translate_one
+        self._entries: dict[int, _MemoEntry] = {}
+        self._prefix: tuple[
+            tuple[ModelMessage, ...], tuple[Any, ...], list[dict[str, Any]]
+        ] = ((), (), [])
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def translate(self, messages: list[ModelMessage]) -> list[dict[str, Any]]:
+        with self._lock:
+            prev_messages, prev_parts, prev_out = self._prefix
+        count = len(prev_messages)
+        head = tuple(messages[:count])
+        if count and head == prev_messages and _flat_parts(head) == prev_parts:
+            out = list(prev_out)
+            tail = messages[count:]
+            parts = prev_parts + _flat_parts(tail)
+        else:
+            out = []
+            tail = messages
+            parts = _flat_parts(messages)
+
+        for msg in tail:
+            out.extend(self._lookup(msg))
+
+        with self._lock:
+            self._prefix = (tuple(messages), parts, out)
+        return list(out)
+
+    def _lookup(self, msg: ModelMessage) -> list[dict[str, Any]]:
+        key = id(msg)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry.message() is msg
+            and entry.parts == tuple(msg.parts)
+        ):
+            return entry.translated
+
+        translated = self._translate_one(msg)
+        entries = self._entries
+
+        def _forget(_ref: weakref.ref[ModelMessage], key: int = key) -> None:
+            stale = entries.get(key)
+            if stale is not None and stale.message is _ref:
+                entries.pop(key, None)
+
+        entries[key] = _MemoEntry(
+            message=weakref.ref(msg, _forget),
+            parts=tuple(msg.parts),
+            translated=translated,
+        )
+        return translated
+
+
+# Close tasks for retired clients (see
+# :meth:`OllamaNativeModel._retire_client`). The loop only holds tasks
+# weakly, so without this one could be collected before it ran.
+_RETIRING: set[asyncio.Task[None]] = set()
+
+
+def _finished(ref: weakref.ref[asyncio.AbstractEventLoop]) -> bool:
+    """Whether the loop behind ``ref`` is collected or closed."""
+    loop = ref()
+    return loop is None or loop.is_closed()
+
+
+async def _aclose_quietly(http_client: Any) -> None:
+    try:
+        await http_client.aclose()
+    except Exception:
+        pass
+
+
+# Process-wide models keyed by (bare model name, host, keep_alive,
+# num_ctx). Every
+# ``compile_tab_agent`` / ``compile_skill_agent`` call resolves its
+# ``ollama:`` string through here, so a settings nudge or a skill
+# dispatch in the REPL reuses the model — and its warm keep-alive
+# connection — instead of opening a new client per recompile.
+_SHARED_MODELS: dict[
+    tuple[str, str | None, float | str | None, int | None], OllamaNativeModel
+] = {}
+_SHARED_MODELS_LOCK = threading.Lock()
+
+
+def shared_ollama_model(
+    model_name: str,
+    *,
+    host: str | None = None,
+    keep_alive: float | str | None = None,
+    num_ctx: int | None = None,
+) -> OllamaNativeModel:
+    """Return the process-wide :class:`OllamaNativeModel` for ``(model_name, host)``.
+
+    Built on first request and reused afterwards. The model carries no
+    per-agent state — system prompts, tools, and settings all arrive
+    per request — so sharing it across agents is safe. ``keep_alive``
+    and ``num_ctx`` are part of the key: a config change seen by a
+    long-lived process (``tab serve``) gets a model that sends it.
+    """
+    key = (model_name, host, keep_alive, num_ctx)
+    with _SHARED_MODELS_LOCK:
+        model = _SHARED_MODELS.get(key)
+        if model is None:
+            model = OllamaNativeModel(
+                model_name, host=host, keep_alive=keep_alive, num_ctx=num_ctx
+            )
+            _SHARED_MODELS[key] = model
+        return model
+
+
+def close_shared_models() -> None:
+    """Close and forget every model handed out by :func:`shared_ollama_model`.
+
+    Called on REPL exit and ``tab mcp`` shutdown. Idempotent; a later
+    :func:`shared_ollama_model` call simply builds a fresh model.
+    """
+    with _SHARED_MODELS_LOCK:
+        models = list(_SHARED_MODELS.values())
+        _SHARED_MODELS.clear()
+    for model in models:
+        model.close()
+
+
+async def aclose_shared_models() -> None:
+    """Async :func:`close_shared_models`, for shutdown on a running loop.
+
+    Closes the pools that were opened on the calling loop; models used
+    from other loops are dropped, as :meth:`OllamaNativeModel.aclose`
+    describes.
+    """
+    with _SHARED_MODELS_LOCK:
+        models = list(_SHARED_MODELS.values())
+        _SHARED_MODELS.clear()
+    for model in models:
+        await model.aclose()
+
+
+@dataclass(frozen=True, slots=True)
+class OllamaTurnMetrics:
+    """Where one turn's Ollama time went, from its responses' usage.
+
+    A turn is every model request it made — more than one when the
+    model called tools. Token counts and ``load_time`` sum across them;
+    ``time_to_first_token`` is the first request's, since that is the
+    wait the user sees. All times are seconds, measured by the Ollama
+    server: ``time_to_first_token`` is load plus prompt evaluation, and
+    excludes network and any queueing in front of the daemon.
+
+    ``None`` rates mean Ollama reported no duration to divide by — a
+    response from a cache, or an older daemon.
+    """
+
+    requests: int
+    input_tokens: int
+    output_tokens: int
+    load_time: float
+    time_to_first_token: float | None
+    prompt_tokens_per_second: float | None
+    tokens_per_second: float | None
+
+    @classmethod
+    def from_messages(cls, messages: Sequence[Any]) -> OllamaTurnMetrics | None:
+        """Summarise the Ollama responses in ``messages``, or ``None`` if none."""
+        usages = [
+            message.usage
+            for message in messages
+            if isinstance(message, ModelResponse) and message.provider_name == "ollama"
+        ]
+        if not usages:
+            return None
+
+        def total(name: str) -> int:
+            return sum(usage.details.get(name, 0) for usage in usages)
+
+        first = usages[0].details
+        first_token_ns = first.get("load_duration", 0) + first.get(
+            "prompt_eval_duration", 0
+        )
+        input_tokens = sum(usage.input_tokens for usage in usages)
+        output_tokens = sum(usage.output_tokens for usage in usages)
+        return cls(
+            requests=len(usages),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            load_time=total("load_duration") / 1e9,
+            time_to_first_token=first_token_ns / 1e9 if first_token_ns else None,
+            prompt_tokens_per_second=_rate(input_tokens, total("prompt_eval_duration")),
+            tokens_per_second=_rate(output_tokens, total("eval_duration")),
+        )
+
+    def summary(self) -> str:
+        """One line for the REPL: ``412 in / 128 out, 41.3 tok/s, ...``."""
+        parts = [f"{self.input_tokens} in / {self.output_tokens} out"]
+        if self.tokens_per_second is not None:
+            parts.append(f"{self.tokens_per_second:.1f} tok/s")
+        if self.prompt_tokens_per_second is not None:
+            parts.append(f"prompt {self.prompt_tokens_per_second:.1f} tok/s")
+        if self.time_to_first_token is not None:
+            parts.append(f"first token {self.time_to_first_token:.2f}s")
+        parts.append(f"load {self.load_time:.2f}s")
+        if self.requests > 1:
+            parts.append(f"{self.requests} requests")
+        return ", ".join(parts)
+
+
+def _rate(tokens: int, duration_ns: int) -> float | None:
+    return tokens / (duration_ns / 1e9) if duration_ns else None
+
+
 @dataclass
 class _OllamaStreamedResponse(StreamedResponse):
     """pydantic-ai ``StreamedResponse`` adapter for ``ollama-python`` streams.
@@ -376,6 +903,10 @@ class _OllamaStreamedResponse(StreamedResponse):
                     if event is not None:
                         yield event
 
+            # Counts and timings arrive once, on the closing chunk.
+            if chunk.done:
+                self._usage = _request_usage(chunk)
+
     @property
     def model_name(self) -> str:
         return self._model_name
@@ -10,29 +10,26 @@ defaults baked into the table.
 
 `TabSettings` is a pydantic model with the five 0-100 ints. Defaults
 match the Settings table in `tab.md`. Overrides happen at compile time:
-to change a setting mid-session, recompile the agent.
+to change a setting mid-session, recompile the agent. The model itself
+lives in :mod:`tab_cli.settings` (so the CLI layer can use it without
+importing pydantic-ai) and is re-exported here.
+
+Recompiles are cheap: the stripped ``tab.md`` body is held in a
+:class:`~tab_cli.prompt_cache.PromptFileCache` that re-reads the file
+whenever its mtime or size changes, and the assembled prompt is
+memoized per (settings, body). Edits to ``tab.md`` still show up on the
+next compile — there is no stale copy to invalidate by hand.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
-from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
-
-class TabSettings(BaseModel):
-    """Personality dials for the Tab agent.
-
-    Each field is an int in [0, 100]. Defaults mirror the Settings
-    table in `plugins/tab/agents/tab.md`.
-    """
-
-    humor: int = Field(default=65, ge=0, le=100)
-    directness: int = Field(default=80, ge=0, le=100)
-    warmth: int = Field(default=70, ge=0, le=100)
-    autonomy: int = Field(default=50, ge=0, le=100)
-    verbosity: int = Field(default=35, ge=0, le=100)
+from tab_cli.prompt_cache import PromptFileCache
+from tab_cli.settings import TabSettings
 
 
 def _repo_root() -> Path:
@@ -72,9 +69,15 @@ def _strip_frontmatter(text: str) -> str:
     return text
 
 
+_TAB_MD_CACHE = PromptFileCache(_strip_frontmatter)
+
+
 def _load_tab_md_body() -> str:
-    """Read `plugins/tab/agents/tab.md` and return the body sans frontmatter."""
-    return _strip_frontmatter(_tab_md_path().read_text(encoding="utf-8"))
+    """Read `plugins/tab/agents/tab.md` and return the body sans frontmatter.
+
+    Served from :data:`_TAB_MD_CACHE` while the file's stat is unchanged.
+    """
+    return _TAB_MD_CACHE.read(_tab_md_path())
 
 
 def _settings_preamble(settings: TabSettings) -> str:
@@ -97,7 +100,35 @@ def build_system_prompt(settings: TabSettings | None = None) -> str:
     without instantiating an `Agent`.
     """
     s = settings if settings is not None else TabSettings()
-    return f"{_settings_preamble(s)}\n\n{_load_tab_md_body()}"
+    return _compose_system_prompt(
+        s.humor, s.directness, s.warmth, s.autonomy, s.verbosity, _load_tab_md_body()
+    )
+
+
+@lru_cache(maxsize=64)
+def _compose_system_prompt(
+    humor: int,
+    directness: int,
+    warmth: int,
+    autonomy: int,
+    verbosity: int,
+    body: str,
+) -> str:
+    """Assemble preamble + body, memoized on the dial values and body.
+
+    Keyed on the five ints rather than :class:`TabSettings` itself
+    because pydantic models aren't hashable. ``body`` is the cached
+    string object, whose hash Python computes once and keeps, so a
+    lookup never rescans the markdown.
+    """
+    settings = TabSettings(
+        humor=humor,
+        directness=directness,
+        warmth=warmth,
+        autonomy=autonomy,
+        verbosity=verbosity,
+    )
+    return f"{_settings_preamble(settings)}\n\n{body}"
 
 
 def compile_tab_agent(
@@ -135,8 +166,12 @@ def resolve_model(model: str | None):
 
     The two prefixes Tab supports are:
 
-    - ``ollama:<name>`` — peeled and passed to :class:`OllamaNativeModel`,
-      which uses ``ollama-python``'s native ``/api/chat`` endpoint.
+    - ``ollama:<name>`` — peeled and resolved to the process-wide
+      :class:`OllamaNativeModel` for that name (see
+      :func:`tab_cli.models.shared_ollama_model`), which uses
+      ``ollama-python``'s native ``/api/chat`` endpoint. Recompiling an
+      agent therefore reuses the model and its HTTP connection pool.
+      ``[ollama].keep_alive`` / ``num_ctx`` from the config ride along.
     - ``anthropic:<name>`` — passed through verbatim. pydantic-ai's
       ``Agent`` constructor parses the prefix and instantiates
       ``AnthropicModel`` itself, so we don't intercept.
@@ -152,7 +187,10 @@ def resolve_model(model: str | None):
     if model.startswith("ollama:"):
         # Lazy import: keeps callers that never use Ollama from paying
         # the ``ollama`` package's import cost.
-        from tab_cli.models import OllamaNativeModel
+        from tab_cli.config import load_ollama_options_from_config
+        from tab_cli.models import shared_ollama_model
 
-        return OllamaNativeModel(model.removeprefix("ollama:"))
+        return shared_ollama_model(
+            model.removeprefix("ollama:"), **load_ollama_options_from_config()
+        )
     return model
@@ -0,0 +1,146 @@
+"""Lexical pre-gate for chat routing.
+
+Every ordinary ``tab chat`` line goes to :meth:`SkillRegistry.match`,
+which means an embedding round-trip before the agent even starts —
+including for lines that can't plausibly trigger a skill: "thanks",
+"ok, got it", a pasted stack trace, a 200-line log. The
+:class:`LexicalPrefilter` answers "could this possibly match?" from the
+text alone and lets the REPL skip the embed when the answer is no.
+
+It is deliberately one-sided. A ``False`` skips routing, so every rule
+here has to be one a real skill trigger can't trip; anything uncertain
+returns ``True`` and the embedder decides as before. The rules:
+
+- **Too long or too many lines.** Skill triggers are one-line requests
+  ("teach me how OAuth works"). Pastes and logs route to the agent.
+  (A sticky skill's own dumps never reach routing — the REPL hands
+  them straight to the active skill.)
+- **Code-shaped.** A high share of ``{}[]();=<>`` and friends.
+- **Nothing but an acknowledgement.** Every word is on the explicit
+  :data:`_SMALL_TALK` list ("ok", "thanks", "lol", "got it") or a
+  stopword. "thanks, that worked" stops here. Short is not enough on
+  its own: "explain monads", "t-rex pls" and "hello" are all real
+  skill requests in two words or fewer, so brevity never rules a line
+  out — only a closed list of words that can't name a skill does.
+
+A line that shares a word with any skill's name, description or
+argument hint always routes, so the small-talk list can't shadow a
+skill that later adopts one of its words. The vocabulary is built from
+the same :class:`SkillRecord` objects the gate is seeded with, so it
+tracks SKILL.md edits automatically. The false-negative rate is pinned
+at zero by ``tests/test_prefilter.py``, against
+``tests/fixtures/dispatch_eval.json`` and a paraphrase corpus that
+covers every skill.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tab_cli.registry import SkillRecord
+
+# Longest line, in characters, that is still worth routing. The longest
+# trigger in the eval set is under 50; this leaves a wide margin.
+_MAX_ROUTABLE_CHARS = 600
+
+# More lines than this is a paste, not a request.
+_MAX_ROUTABLE_LINES = 4
+
+# Share of code punctuation above which a line is treated as code.
+# Prose rarely passes 5%; a line of Python or JSON sits well above 15%.
+_CODE_SYMBOL_RATIO = 0.15
+_CODE_SYMBOLS = frozenset("{}[]();=<>$\\|`")
+
+# Acknowledgements and small talk: a line made only of these (and
+# stopwords) is a reply to the last turn, never a skill request. Kept
+# closed and explicit — greetings stay off it, since "hey" / "hello"
+# are how people reach /hey-tab.
+_SMALL_TALK = frozenset(
+    {
+        "ok", "okay", "k", "kk", "thanks", "thank", "thx", "ty", "cheers",
+        "lol", "lmao", "haha", "cool", "nice", "great", "perfect",
+        "awesome", "yes", "yeah", "yep", "yup", "sure", "nope", "nah",
+        "got", "gotcha", "fine", "alright", "good", "worked", "works", "np",
+    }
+)
+
+_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "the", "is", "are", "was", "were", "be", "been",
+        "to", "of", "in", "on", "at", "for", "with", "by", "from", "as",
+        "or", "but", "so", "if", "me", "my", "you", "your", "we", "our",
+        "i", "it", "its", "this", "that", "these", "those", "do", "does",
+        "did", "can", "could", "would", "should", "will", "just", "please",
+        "what", "when", "where", "why", "how", "who", "which", "there",
+        "s", "t", "m", "d", "ll", "re", "ve", "not", "no", "all", "some",
+    }
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def content_tokens(text: str) -> set[str]:
+    """Lowercased, lightly stemmed, stopword-free tokens of ``text``."""
+    return {
+        _stem(token)
+        for token in _TOKEN.findall(text.lower())
+        if token not in _STOPWORDS
+    }
+
+
+def _stem(token: str) -> str:
+    """Strip one common English suffix so "listening"/"listen" collide."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+# Words every SKILL.md description uses ("Use when the user invokes
+# /x"). Leaving them in the vocabulary would anchor any line that
+# mentions a user or Tab. Stemmed the same way as the vocabulary.
+_BOILERPLATE = frozenset(
+    content_tokens("use uses user users invoke invokes tab trigger mode")
+)
+
+
+class LexicalPrefilter:
+    """Cheap "could any skill match this?" check built from skill records."""
+
+    def __init__(self, vocabulary: Iterable[str]) -> None:
+        self._vocabulary = frozenset(vocabulary) - _BOILERPLATE
+
+    @classmethod
+    def from_records(cls, records: Iterable[SkillRecord]) -> LexicalPrefilter:
+        vocabulary: set[str] = set()
+        for record in records:
+            vocabulary |= content_tokens(record.name.replace("-", " "))
+            vocabulary |= content_tokens(record.description)
+            if record.argument_hint:
+                vocabulary |= content_tokens(record.argument_hint)
+        return cls(vocabulary)
+
+    @property
+    def vocabulary(self) -> frozenset[str]:
+        return self._vocabulary
+
+    def could_match(self, query: str) -> bool:
+        """``False`` only when no skill can plausibly match ``query``."""
+        text = query.strip()
+        if not text:
+            return False
+        if len(text) > _MAX_ROUTABLE_CHARS:
+            return False
+        if text.count("\n") >= _MAX_ROUTABLE_LINES:
+            return False
+        symbols = sum(1 for char in text if char in _CODE_SYMBOLS)
+        if symbols / len(text) > _CODE_SYMBOL_RATIO:
+            return False
+
+        if content_tokens(text) & self._vocabulary:
+            return True
+        words = set(_TOKEN.findall(text.lower()))
+        return not (words & _SMALL_TALK and words <= _SMALL_TALK | _STOPWORDS)
@@ -0,0 +1,71 @@
+"""Stat-validated cache for prompt files read off disk.
+
+``tab.md`` and every ``SKILL.md`` are deliberately *not* baked into the
+package: the personality plugin evolves, and a Python-side copy would
+silently drift from the markdown. So the prompt compilers read the files
+at compile time — and the chat REPL compiles constantly (every settings
+nudge, every skill dispatch), re-reading and re-stripping the same
+unchanged markdown each turn.
+
+:class:`PromptFileCache` keeps the "no stale copy" property while
+skipping the redundant work. Every lookup still ``stat``s the file; the
+cached body is served only when ``(st_mtime_ns, st_size)`` match what
+was recorded at read time. An edit changes the stamp, so the next
+compile reads the new text.
+
+One edge the stamp alone can't see: a same-size edit landing inside the
+filesystem's mtime granularity of the original read. Git calls this the
+"racily clean" case and solves it the same way we do — a file modified
+within :data:`_RACY_WINDOW_NS` of being read is not cached at all, so it
+keeps being re-read until its mtime is safely in the past.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# How recently a file may have been modified and still be cached. Two
+# seconds covers the coarsest mtime granularity in common use (FAT's
+# 2 s); ext4/APFS resolve to nanoseconds and never come near it.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class PromptFileCache:
+    """Memoize ``transform(path.read_text())`` per path, revalidated by stat.
+
+    ``transform`` must be a pure function of the file text (the callers
+    pass their frontmatter stripper). ``stat`` and ``read_text`` errors
+    propagate unchanged, so a missing file raises
+    :class:`FileNotFoundError` exactly as an uncached read would.
+    """
+
+    def __init__(self, transform: Callable[[str], str]) -> None:
+        self._transform = transform
+        self._entries: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def read(self, path: Path) -> str:
+        """Return the transformed body of ``path``, from memory if unchanged."""
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        body = self._transform(path.read_text(encoding="utf-8"))
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[path] = (stamp, body)
+        else:
+            with self._lock:
+                self._entries.pop(path, None)
+        return body
+
+    def clear(self) -> None:
+        """Forget every cached body."""
+        with self._lock:
+            self._entries.clear()
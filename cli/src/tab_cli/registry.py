@@ -24,11 +24,43 @@ What the loader does **not** do:
 Per-skill thresholds are read from each SKILL.md's optional
 ``grimoire-threshold`` frontmatter key (a float in ``[0, 1]``); a skill
 that omits the key inherits :data:`DEFAULT_THRESHOLD`.
+
+Description embeddings are cached on disk (see
+:mod:`tab_cli.embeddings`), so a start with unchanged SKILL.md files
+seeds the gate without a single embedding round-trip. On top of that,
+the loader records a corpus fingerprint — a hash over every record's
+name, description, and threshold plus the embedder identity — in
+``~/.tab/skill-corpus.json`` after seeding the persistent pgvector
+corpus, stamped with the ``embedded_at`` grimoire wrote into the
+corpus meta alongside the rows. A later start whose fingerprint
+matches — and whose database still reports that same seed — skips the
+seed write entirely. The state file isn't keyed by database, so the
+stamp is what catches a fresh, wiped, repointed or since-reseeded
+Postgres; it is read straight off the corpus meta, never through a
+similarity query whose recall depends on the index type. A mismatch on
+either reseeds, and the embedding cache keeps that down to re-embedding
+only the rows that actually changed.
+
+The vector store is selectable: ``[grimoire].backend = "memory"`` in
+``~/.tab/config.toml`` swaps pgvector for the in-process NumPy index in
+:mod:`tab_cli.vector_index`, so routing works with no Postgres at all.
+
+Bulk routing (``tab route``) goes through :meth:`SkillRegistry.match_many`
+instead of the gate: one ``embed_many`` call per batch of queries, scored
+in a single matrix product against the registry's own copy of the
+description vectors — cosine similarity, the same score pgvector and the
+in-process index compute.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -36,8 +68,11 @@ from typing import TYPE_CHECKING
 import yaml
 
 if TYPE_CHECKING:  # avoid forcing grimoire's Postgres import path at module load
+    import numpy as np
     from grimoire import Gate, Hit
 
+    from tab_cli.embeddings import EmbedderLike, EmbeddingCache
+
 
 # The corpus key under which all v0 personality-skill rows live. Single
 # corpus is the right shape today — every skill is a peer, threshold is
@@ -60,6 +95,19 @@ SKILL_CORPUS = "tab-cli-skills"
 DEFAULT_THRESHOLD = 0.55
 
 
+# Routing decisions remembered per registry. Real chat traffic repeats
+# itself ("thanks", "ok", the same skill trigger twice) and every miss
+# costs an embed plus a similarity search; a thousand short strings and
+# their hits are a few hundred KB.
+DEFAULT_HIT_CACHE_SIZE = 1024
+
+
+# Format version of ``~/.tab/skill-corpus.json``. Bumped only when the
+# shape changes incompatibly; a file from another version reads as
+# "never seeded", which costs one reseed and nothing else.
+_SEED_STATE_FORMAT_VERSION = 1
+
+
 @dataclass(frozen=True, slots=True)
 class SkillRecord:
     """One parsed ``SKILL.md`` ready to seed grimoire.
@@ -92,18 +140,34 @@ class SkillRegistry:
 
     The registry is what ``tab chat`` and ``tab ask`` consult per turn:
     given user input, did anything match? The wrapper is intentionally
-    thin — it exposes :meth:`match` (gating) and :attr:`records` (what
-    was registered, for diagnostics and the ``tab list`` surface that
-    will follow). Any deeper grimoire call (``explain``, ``neighbors``)
+    thin — it exposes :meth:`match` (gating), :meth:`match_many` (the
+    batched form bulk routing uses) and :attr:`records` (what was
+    registered, for diagnostics and the ``tab list`` surface that will
+    follow). Any deeper grimoire call (``explain``, ``neighbors``)
     can reach :attr:`gate` directly.
     """
 
-    def __init__(self, gate: Gate, records: Iterable[SkillRecord]) -> None:
+    def __init__(
+        self,
+        gate: Gate,
+        records: Iterable[SkillRecord],
+        *,
+        fingerprint: str | None = None,
+        embedder: EmbedderLike | None = None,
+        hit_cache_size: int = DEFAULT_HIT_CACHE_SIZE,
+    ) -> None:
         self._gate = gate
+        self._embedder = embedder
+        self._hits = _HitCache(hit_cache_size)
+        self._description_matrix: np.ndarray | None = None
+        self._thresholds: np.ndarray | None = None
         # Tuple, not list: the registry is read-mostly post-load and
         # downstream callers shouldn't be able to mutate the snapshot
         # they got back.
         self._records: tuple[SkillRecord, ...] = tuple(records)
+        self._fingerprint = (
+            fingerprint if fingerprint is not None else corpus_fingerprint(self._records)
+        )
 
     @property
     def gate(self) -> Gate:
@@ -115,6 +179,21 @@ class SkillRegistry:
         """Every skill registered in load order."""
         return self._records
 
+    @property
+    def fingerprint(self) -> str:
+        """The :func:`corpus_fingerprint` of what was seeded."""
+        return self._fingerprint
+
+    def warm_up(self) -> None:
+        """Preload the routing embedder; see :mod:`tab_cli.warmup`.
+
+        A no-op without an embedder or with one that can't preload —
+        an injected test gate embeds in-process.
+        """
+        warm_up = getattr(self._embedder, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
+
     def match(self, query: str) -> Hit | None:
         """Return the top-1 :class:`grimoire.Hit` for ``query``.
 
@@ -123,8 +202,168 @@ class SkillRegistry:
         and ``threshold`` to log diagnostics ("almost matched X with
         0.51 vs 0.55"). The chat wiring decides what to do with a
         non-passing hit; the registry just relays.
+
+        Decisions are memoised per :func:`normalize_routing_query` in a
+        ``hit_cache_size``-entry LRU, so a repeated line skips the embed
+        and the search. The cache lives and dies with the registry, so
+        it is keyed by the corpus fingerprint: a changed SKILL.md means
+        a new registry and an empty cache. ``tab grimoire`` overrides
+        don't enter into it — they only change what ``tab grimoire``
+        displays, never the gate's verdicts.
+        """
+        key = normalize_routing_query(query)
+        cached = self._hits.get(key)
+        if cached is not _MISSING:
+            return cached
+        hit = self._gate.match(query)
+        self._hits.put(key, hit)
+        return hit
+
+    def match_many(self, queries: Sequence[str]) -> list[Hit | None]:
+        """Return the top-1 :class:`grimoire.Hit` for each query, in input order.
+
+        With an embedder (the loader always passes one), the distinct
+        queries go to the embedder in a single ``embed_many`` call — one
+        Ollama ``/api/embed`` request — and are scored against every
+        description in one matrix product: ``(queries × dims) @ (dims ×
+        skills)``, then a row-wise argmax. Repeated queries are embedded
+        once and share a hit. The description vectors are embedded once
+        per registry (cache hits after seeding).
+
+        Without an embedder — an injected test gate — this is
+        :meth:`match` per query. Either way, queries already in the hit
+        cache are answered from it and only the rest are embedded.
         """
-        return self._gate.match(query)
+        if self._embedder is None:
+            return [self.match(query) for query in queries]
+        if not queries or not self._records:
+            return [None] * len(queries)
+
+        keys = [normalize_routing_query(query) for query in queries]
+        known = self._hits.get_many(keys)
+        # First spelling of each uncached key is the one embedded.
+        misses = {
+            key: query
+            for key, query in zip(keys, queries, strict=True)
+            if known[key] is _MISSING
+        }
+        if misses:
+            fresh = self._score_many(self._embedder, list(misses.values()))
+            for key, hit in zip(misses, fresh, strict=True):
+                known[key] = hit
+                self._hits.put(key, hit)
+        return [known[key] for key in keys]
+
+    def _score_many(self, embedder: EmbedderLike, queries: list[str]) -> list[Hit]:
+        """Embed ``queries`` in one call and score them in one matrix product."""
+        import numpy as np
+        from grimoire import Hit
+
+        from tab_cli.vector_index import normalise_rows
+
+        matrix, thresholds = self._descriptions(embedder)
+        unique = list(dict.fromkeys(queries))
+        vectors = normalise_rows(
+            np.asarray(embedder.embed_many(unique), dtype=np.float32)
+        )
+
+        scores = vectors @ matrix.T
+        best = scores.argmax(axis=1)
+        similarities = scores[np.arange(len(unique)), best]
+        passed = similarities >= thresholds[best]
+
+        hits = {
+            query: Hit(
+                name=self._records[index].name,
+                similarity=float(similarity),
+                threshold=self._records[index].threshold,
+                passed=bool(ok),
+            )
+            for query, index, similarity, ok in zip(
+                unique, best.tolist(), similarities, passed, strict=True
+            )
+        }
+        return [hits[query] for query in queries]
+
+    def _descriptions(self, embedder: EmbedderLike) -> tuple[np.ndarray, np.ndarray]:
+        """Normalised description vectors (one row per record) and thresholds."""
+        if self._description_matrix is None:
+            import numpy as np
+
+            from tab_cli.vector_index import normalise_rows
+
+            vectors = embedder.embed_many(
+                [record.description for record in self._records]
+            )
+            self._description_matrix = normalise_rows(
+                np.asarray(vectors, dtype=np.float32)
+            )
+            # float64, matching the float thresholds match() compares against.
+            self._thresholds = np.asarray(
+                [record.threshold for record in self._records], dtype=np.float64
+            )
+        return self._description_matrix, self._thresholds
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Sentinel for "not cached"; ``None`` is a legitimate cached decision
+# (empty or unseeded corpus).
+_MISSING: object = object()
+
+
+def normalize_routing_query(query: str) -> str:
+    """Fold ``query`` onto its hit-cache key: lowercase, whitespace collapsed.
+
+    Lossless for the default ``nomic-embed-text`` embedder, whose BERT
+    tokenizer lowercases and splits on whitespace runs anyway — so
+    "Thanks!" and "thanks!" already embed identically and can share a
+    decision.
+    """
+    return _WHITESPACE.sub(" ", query).strip().lower()
+
+
+class _HitCache:
+    """Thread-safe LRU of routing decisions for one registry's corpus.
+
+    Nothing to invalidate: a registry's corpus is fixed for its
+    lifetime, so a lookup is a dict probe with no stat or stamp check
+    on the hot path.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Hit | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Hit | None | object:
+        return self.get_many([key])[key]
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Hit | None | object]:
+        """Look up every key under one lock acquisition."""
+        if self._maxsize <= 0:
+            return dict.fromkeys(keys, _MISSING)
+        with self._lock:
+            found: dict[str, Hit | None | object] = {}
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+                else:
+                    found[key] = _MISSING
+            return found
+
+    def put(self, key: str, hit: Hit | None) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = hit
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 def parse_skill_frontmatter(path: Path) -> SkillRecord:
@@ -179,6 +418,10 @@ def load_skill_registry(
     plugins_dir: Path,
     *,
     gate: Gate | None = None,
+    embedder: EmbedderLike | None = None,
+    cache: EmbeddingCache | None = None,
+    seed_state: Path | None = None,
+    backend: str | None = None,
 ) -> SkillRegistry:
     """Walk ``plugins_dir/tab/skills/*/SKILL.md`` and seed a grimoire gate.
 
@@ -186,9 +429,27 @@ def load_skill_registry(
     SkillRegistry``; the keyword-only ``gate=`` is a test seam mirroring
     grimoire's own ``Gate(repository=None)`` shape. When omitted, the
     function constructs the canonical gate via
-    :meth:`grimoire.Gate.from_settings` (Ollama + the shared pgvector
-    pool). When provided, the caller has already wired an embedder and
-    repository — typically a fake pair for unit tests.
+    :meth:`grimoire.Gate.from_settings` (the shared pgvector pool) with
+    a cache-wrapped embedder. When provided, the caller has already
+    wired an embedder and repository — typically a fake pair for unit
+    tests — and ``embedder`` / ``cache`` are ignored.
+
+    ``embedder`` defaults to :class:`tab_cli.embeddings.OllamaEmbedder`
+    and ``cache`` to the ``~/.tab/embeddings/`` store. Only the skill
+    descriptions go through the cache; per-turn queries are embedded
+    fresh.
+
+    ``seed_state`` is the fingerprint file consulted before seeding the
+    default gate (``~/.tab/skill-corpus.json`` when omitted). An
+    injected gate is always seeded — test fakes start empty, so a
+    fingerprint match would leave them with nothing to match against.
+
+    ``backend`` picks the default gate's vector store: ``"pgvector"``
+    or ``"memory"`` (see :data:`tab_cli.config.GRIMOIRE_BACKENDS`).
+    ``None`` reads ``[grimoire].backend`` from the config file and
+    falls back to ``"pgvector"``. The in-memory store starts empty
+    every process, so it is always seeded and never consults
+    ``seed_state``.
 
     Returns a :class:`SkillRegistry` ready to answer ``match(query)``.
 
@@ -216,23 +477,222 @@ def load_skill_registry(
     skill_md_paths = sorted(skills_dir.glob("*/SKILL.md"))
     records = [parse_skill_frontmatter(path) for path in skill_md_paths]
 
-    if gate is None:
-        # Lazy import: grimoire's top-level ``Gate.from_settings`` pulls
-        # in pgvector and ollama at first call. Tests that pass an
-        # injected gate avoid the import entirely, which keeps the
-        # ``tab_cli.registry`` module cheap to import in environments
-        # that don't have the runtime stack wired up yet.
-        from grimoire import Gate
+    if gate is not None:
+        if records:
+            gate.seed(
+                (record.name, record.description, record.threshold)
+                for record in records
+            )
+        return SkillRegistry(gate=gate, records=records)
+
+    from tab_cli.config import GRIMOIRE_BACKENDS, load_grimoire_backend_from_config
+
+    if backend is None:
+        backend = load_grimoire_backend_from_config() or "pgvector"
+    if backend not in GRIMOIRE_BACKENDS:
+        raise ValueError(
+            f"unknown grimoire backend {backend!r} "
+            f"(expected one of: {', '.join(GRIMOIRE_BACKENDS)})",
+        )
+
+    # Lazy import: grimoire's top-level ``Gate.from_settings`` pulls in
+    # pgvector and ollama at first call. Tests that pass an injected
+    # gate avoid the import entirely, which keeps the
+    # ``tab_cli.registry`` module cheap to import in environments that
+    # don't have the runtime stack wired up yet.
+    from grimoire import Gate
+
+    from tab_cli.embeddings import (
+        CachedEmbedder,
+        EmbeddingCache,
+        OllamaEmbedder,
+        to_grimoire_embedder,
+    )
+
+    if embedder is None:
+        # The routing embedder stays loaded as long as the chat model.
+        from tab_cli.config import load_ollama_options_from_config
+
+        keep_alive = load_ollama_options_from_config().get("keep_alive")
+        embedder = OllamaEmbedder(keep_alive=keep_alive)
+    cached = CachedEmbedder(
+        embedder,
+        cache if cache is not None else EmbeddingCache(),
+        cacheable=(record.description for record in records),
+    )
+    fingerprint = corpus_fingerprint(records, embedder_identity=cached.identity)
 
-        gate = Gate.from_settings(corpus=SKILL_CORPUS)
+    if backend == "memory":
+        from tab_cli.vector_index import InMemoryRepository
 
-    if records:
+        gate = Gate(
+            corpus=SKILL_CORPUS,
+            embedder=to_grimoire_embedder(cached),
+            repository=InMemoryRepository(),
+        )
+        if records:
+            gate.seed(
+                (record.name, record.description, record.threshold)
+                for record in records
+            )
+        return SkillRegistry(
+            gate=gate, records=records, fingerprint=fingerprint, embedder=cached
+        )
+
+    # ``to_grimoire_embedder`` hands grimoire its own adapter type
+    # (``embedder_from_callable``); the keyword surface is pinned by
+    # ``test_pinned_grimoire_accepts_the_default_gate_wiring``.
+    gate = Gate.from_settings(
+        corpus=SKILL_CORPUS,
+        embedder=to_grimoire_embedder(cached),
+    )
+
+    # The pgvector corpus outlives the process, so a matching
+    # fingerprint means the rows we last wrote are exactly the ones
+    # we'd write now — provided they're still in the database this
+    # gate points at. Deleting the state file forces a reseed.
+    state_path = seed_state if seed_state is not None else seed_state_path()
+    stamp = _seed_stamp(gate, fingerprint)
+    if records and (
+        stamp is None or load_seeded_fingerprint(SKILL_CORPUS, state_path) != stamp
+    ):
         gate.seed(
             (record.name, record.description, record.threshold)
             for record in records
         )
+        stamp = _seed_stamp(gate, fingerprint)
+        if stamp is not None:
+            save_seeded_fingerprint(SKILL_CORPUS, stamp, state_path)
+
+    return SkillRegistry(
+        gate=gate, records=records, fingerprint=fingerprint, embedder=cached
+    )
 
-    return SkillRegistry(gate=gate, records=records)
+
+def _seed_stamp(gate: Gate, fingerprint: str) -> str | None:
+    """Pair ``fingerprint`` with the seed ``gate``'s database holds now.
+
+    grimoire writes a corpus's rows and its meta row together in
+    ``seed_corpus``, and the meta's ``embedded_at`` is set on every
+    write, so it identifies that row set the way an id would: a fresh
+    or wiped database has no meta, and a repointed or since-reseeded
+    one reports a different timestamp. This reads one meta row rather
+    than listing the corpus through ``top_k_in_corpus`` — an approximate
+    index can return fewer rows than it stores, which would read as a
+    stale corpus. ``None`` means there's nothing to compare against;
+    the caller reseeds, which costs a write and nothing else.
+    """
+    repository = getattr(gate, "repository", None)
+    if repository is None:
+        return None
+    meta = repository.get_corpus_meta(SKILL_CORPUS)
+    if meta is None:
+        return None
+    return f"{fingerprint}@{meta.embedded_at.isoformat()}"
+
+
+def corpus_fingerprint(
+    records: Iterable[SkillRecord],
+    *,
+    embedder_identity: str = "",
+) -> str:
+    """Hash everything that determines the seeded corpus.
+
+    Covers each record's ``name``, ``description``, and ``threshold``
+    plus the embedder identity — the full input to
+    :meth:`grimoire.Gate.seed`. Records are sorted by name so the
+    digest is independent of load order; ``path`` and
+    ``argument_hint`` are left out because the gate never sees them.
+    """
+    digest = hashlib.sha256()
+    digest.update(embedder_identity.encode("utf-8"))
+    for record in sorted(records, key=lambda r: r.name):
+        digest.update(b"\0")
+        digest.update(
+            json.dumps(
+                [record.name, record.description, record.threshold],
+                ensure_ascii=False,
+            ).encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+def seed_state_path() -> Path:
+    """Resolve the seed-state path: ``~/.tab/skill-corpus.json``.
+
+    Lives alongside the rest of Tab's user state under ``~/.tab/`` (see
+    :mod:`tab_cli.config`). Machine-written and safe to delete.
+    """
+    return Path.home() / ".tab" / "skill-corpus.json"
+
+
+def load_seeded_fingerprint(corpus_key: str, path: Path | None = None) -> str | None:
+    """Return the fingerprint last recorded for ``corpus_key``, if any.
+
+    A missing or unreadable file is ``None`` rather than an error: the
+    only consequence is a reseed, which is what every start did before
+    the fingerprint existed.
+    """
+    target = path if path is not None else seed_state_path()
+    try:
+        decoded = json.loads(target.read_bytes().decode("utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(decoded, dict):
+        return None
+    if decoded.get("version") != _SEED_STATE_FORMAT_VERSION:
+        return None
+    corpora = decoded.get("corpora")
+    if not isinstance(corpora, dict):
+        return None
+    fingerprint = corpora.get(corpus_key)
+    return fingerprint if isinstance(fingerprint, str) else None
+
+
+def save_seeded_fingerprint(
+    corpus_key: str,
+    fingerprint: str,
+    path: Path | None = None,
+) -> None:
+    """Record ``fingerprint`` as the seeded state of ``corpus_key``.
+
+    The loader passes the fingerprint already stamped with the corpus
+    meta it just wrote (see :func:`_seed_stamp`); this layer stores
+    whatever string it is given.
+
+    Other corpora in the file are preserved. Write failures are
+    swallowed — the seed itself already succeeded, and an unwritten
+    fingerprint only means the next start reseeds.
+    """
+    target = path if path is not None else seed_state_path()
+    corpora: dict[str, str] = {}
+    try:
+        decoded = json.loads(target.read_bytes().decode("utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        decoded = None
+    if isinstance(decoded, dict) and isinstance(decoded.get("corpora"), dict):
+        corpora = {
+            key: value
+            for key, value in decoded["corpora"].items()
+            if isinstance(key, str) and isinstance(value, str)
+        }
+    corpora[corpus_key] = fingerprint
+
+    payload = {
+        "version": _SEED_STATE_FORMAT_VERSION,
+        "corpora": dict(sorted(corpora.items())),
+    }
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 # --------------------------------------------------------------- internals
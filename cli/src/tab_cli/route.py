@@ -0,0 +1,107 @@
+"""``tab route``: run inputs through the skill gate in bulk, no model.
+
+Auditing routing on real traffic — which chat lines would have fired
+which skill, and how close the misses came — means scoring thousands
+of inputs. Doing that through ``tab chat`` costs a model turn per
+line; doing it through :meth:`SkillRegistry.match` costs one embedder
+round-trip per line. :func:`route_lines` reads the inputs in batches
+of ``batch_size`` and sends each batch through
+:meth:`SkillRegistry.match_many`, so the embedder is called once per
+batch.
+
+Input is one query per line. With ``jsonl=True`` each line is instead
+a JSON string or an object with a ``query`` string (an ``id`` is
+echoed back). Blank lines are skipped either way.
+
+Output is one JSON row per query, in input order::
+
+    {"query": ..., "skill": ..., "similarity": ..., "threshold": ...,
+     "passed": ...}
+
+``skill``/``similarity``/``threshold`` are ``null`` when the corpus is
+empty. A JSONL line that doesn't parse gets an ``error`` field instead
+of a match, so one bad log line doesn't abort an audit.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tab_cli.registry import SkillRegistry
+
+# Queries per ``embed_many`` call. Ollama's /api/embed takes the whole
+# list in one request; 64 short lines is a small payload that still
+# amortises the HTTP round-trip well.
+DEFAULT_ROUTE_BATCH_SIZE = 64
+
+
+def route_lines(
+    registry: SkillRegistry,
+    lines: Iterable[str],
+    write: Callable[[str], None],
+    *,
+    jsonl: bool = False,
+    batch_size: int = DEFAULT_ROUTE_BATCH_SIZE,
+) -> int:
+    """Route every query in ``lines``; return how many rows were written."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+    written = 0
+    for batch in _batches(_parse(lines, jsonl=jsonl), batch_size):
+        queries = [row["query"] for row in batch if "error" not in row]
+        hits = iter(registry.match_many(queries))
+        for row in batch:
+            if "error" not in row:
+                hit = next(hits)
+                row.update(
+                    skill=hit.name if hit is not None else None,
+                    similarity=round(hit.similarity, 4) if hit is not None else None,
+                    threshold=hit.threshold if hit is not None else None,
+                    passed=bool(hit is not None and hit.passed),
+                )
+            write(json.dumps(row, ensure_ascii=False) + "\n")
+            written += 1
+    return written
+
+
+def _parse(lines: Iterable[str], *, jsonl: bool) -> Iterator[dict[str, Any]]:
+    for line in lines:
+        if not line.strip():
+            continue
+        if not jsonl:
+            yield {"query": line.strip()}
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield {"query": None, "error": f"invalid JSON: {exc.msg}"}
+            continue
+        if isinstance(value, str):
+            yield {"query": value}
+        elif isinstance(value, dict) and isinstance(value.get("query"), str):
+            row: dict[str, Any] = {"query": value["query"]}
+            if "id" in value:
+                row = {"id": value["id"], **row}
+            yield row
+        else:
+            yield {
+                "query": None,
+                "error": 'each line must be a JSON string or {"query": "..."}',
+            }
+
+
+def _batches(
+    rows: Iterable[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
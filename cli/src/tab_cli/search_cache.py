@@ -0,0 +1,195 @@
+"""Persistent cache of ``web_search`` results under ``~/.tab/search-cache/``.
+
+The teach skill's research phase tends to ask Exa the same things for
+the same topic across sessions — "event sourcing trade-offs", then next
+week "Event sourcing trade-offs?" — and every one of those is a paid,
+multi-second round-trip. :class:`SearchCache` sits in front of the HTTP
+call in :func:`tab_cli.web_search.build_web_search_tool`:
+
+- **Key.** ``sha256`` of the normalised query plus ``num_results``.
+  Normalisation casefolds, collapses whitespace, and drops trailing
+  ``?``/``.``/``!`` — enough to fold the near-duplicates a model
+  produces without pretending to be semantic matching.
+- **TTL.** Entries older than ``ttl_seconds`` read as misses and are
+  removed; search results go stale, and a teach session is better off
+  paying for a fresh query than quoting last month's landscape.
+- **Size bound.** At most ``max_entries`` files. A hit bumps the
+  entry's mtime, so mtime order is recency order and eviction drops the
+  least recently used first.
+- **Counters.** ``hits`` / ``misses`` count lookups for the life of the
+  instance, for tests and ad-hoc benchmarking.
+
+Same advisory contract as :mod:`tab_cli.embeddings`: a missing,
+unreadable, or corrupt entry is a miss, and a failed write is dropped.
+Only successful, non-empty result lists are stored — errors and the
+no-key fallback never are.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Format version of an on-disk entry; other versions read as misses.
+_CACHE_FORMAT_VERSION = 1
+
+# Three days: long enough to span a multi-session dig into one topic,
+# short enough that "what's the current thinking on X" stays current.
+DEFAULT_TTL_SECONDS = 3 * 24 * 60 * 60
+
+# Each entry is a few KB of trimmed snippets, so this caps the
+# directory at a couple of MB.
+DEFAULT_MAX_ENTRIES = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def search_cache_dir() -> Path:
+    """Resolve the cache directory: ``~/.tab/search-cache/``."""
+    return Path.home() / ".tab" / "search-cache"
+
+
+def normalize_query(query: str) -> str:
+    """Fold trivially different phrasings of a query onto one key."""
+    folded = _WHITESPACE.sub(" ", query.casefold()).strip()
+    return folded.rstrip("?.! ")
+
+
+class SearchCache:
+    """TTL + LRU-bounded on-disk store of ``web_search`` result lists."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._root = root if root is not None else search_cache_dir()
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @staticmethod
+    def key(query: str, num_results: int) -> str:
+        """Return the content address for ``query`` at ``num_results``."""
+        digest = hashlib.sha256()
+        digest.update(normalize_query(query).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(str(num_results).encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, query: str, num_results: int) -> list[dict[str, str]] | None:
+        """Return cached results, or ``None`` on any kind of miss."""
+        results = self._read(self._path(query, num_results))
+        with self._lock:
+            if results is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return results
+
+    def put(
+        self,
+        query: str,
+        num_results: int,
+        results: list[dict[str, str]],
+    ) -> None:
+        """Store ``results`` and evict down to ``max_entries``."""
+        if not results:
+            return
+        path = self._path(query, num_results)
+        payload = {
+            "version": _CACHE_FORMAT_VERSION,
+            "query": normalize_query(query),
+            "num_results": num_results,
+            "stored_at": time.time(),
+            "results": results,
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _read(self, path: Path) -> list[dict[str, str]] | None:
+        try:
+            decoded = json.loads(path.read_bytes().decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(decoded, dict):
+            return None
+        if decoded.get("version") != _CACHE_FORMAT_VERSION:
+            return None
+        stored_at = decoded.get("stored_at")
+        if not isinstance(stored_at, (int, float)) or isinstance(stored_at, bool):
+            return None
+        if time.time() - stored_at > self._ttl:
+            _unlink_quietly(path)
+            return None
+
+        results = decoded.get("results")
+        if not isinstance(results, list) or not all(
+            isinstance(item, dict) for item in results
+        ):
+            return None
+
+        # Bump mtime so eviction treats this entry as recently used.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return [_as_result(item) for item in results]
+
+    def _evict(self) -> None:
+        try:
+            entries = [
+                (entry.stat().st_mtime_ns, entry)
+                for entry in self._root.glob("*.json")
+            ]
+        except OSError:
+            return
+        excess = len(entries) - self._max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, entry in entries[:excess]:
+            _unlink_quietly(entry)
+
+    def _path(self, query: str, num_results: int) -> Path:
+        return self._root / f"{self.key(query, num_results)}.json"
+
+
+def _as_result(item: dict[str, Any]) -> dict[str, str]:
+    return {
+        "title": str(item.get("title") or ""),
+        "url": str(item.get("url") or ""),
+        "snippet": str(item.get("snippet") or ""),
+    }
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -0,0 +1,28 @@
+"""The :class:`TabSettings` personality-dial model.
+
+Split out of :mod:`tab_cli.personality` so the Typer layer can resolve
+and validate dials without importing pydantic-ai. ``cli.py`` needs
+``TabSettings`` at module load for its signatures, and
+``personality.py`` imports ``pydantic_ai.Agent`` at the top; keeping
+the model here means ``tab --help``, ``tab setup`` and ``tab grimoire
+show`` start without paying for the agent stack. The personality
+module re-exports the class, so existing imports keep working.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class TabSettings(BaseModel):
+    """Personality dials for the Tab agent.
+
+    Each field is an int in [0, 100]. Defaults mirror the Settings
+    table in `plugins/tab/agents/tab.md`.
+    """
+
+    humor: int = Field(default=65, ge=0, le=100)
+    directness: int = Field(default=80, ge=0, le=100)
+    warmth: int = Field(default=70, ge=0, le=100)
+    autonomy: int = Field(default=50, ge=0, le=100)
+    verbosity: int = Field(default=35, ge=0, le=100)
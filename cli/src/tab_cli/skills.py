@@ -15,11 +15,13 @@ Design choices that aren't obvious from the call sites:
   appended underneath. That keeps personality dials live during a skill
   turn — a 5%-warmth dino is still a Tab dino — and matches what the
   task body calls "a delta on top of the Tab persona prompt."
-- **No prompt cache in source.** The body is read off disk on every
-  ``run_skill`` / ``compile_skill_agent`` call. Skill prompts change as
-  the personality plugin evolves and a stale cached copy would silently
-  drift. The cost is one ``read_text`` per invocation, which is a
-  rounding error next to the model call.
+- **No prompt copy in source.** The body comes off disk, not out of a
+  Python string: skill prompts change as the personality plugin evolves
+  and a baked-in copy would silently drift. Reads go through a
+  :class:`~tab_cli.prompt_cache.PromptFileCache`, which serves the
+  stripped body from memory only while the file's mtime and size are
+  unchanged — the chat REPL dispatches skills every few turns, and an
+  edit to ``SKILL.md`` still lands on the very next one.
 - **Same plugins-dir resolution as the registry / personality compiler.**
   Default is ``<repo>/plugins`` derived from this file's location. Tests
   pass a tmp dir to exercise loader edges; production code can omit.
@@ -28,10 +30,12 @@ Design choices that aren't obvious from the call sites:
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from tab_cli.personality import TabSettings, build_system_prompt
+from tab_cli.prompt_cache import PromptFileCache
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
@@ -89,6 +93,9 @@ def _strip_frontmatter(text: str) -> str:
     return text
 
 
+_SKILL_MD_CACHE = PromptFileCache(_strip_frontmatter)
+
+
 def read_skill_body(skill_name: str, plugins_dir: Path | None = None) -> str:
     """Return the SKILL.md body (sans frontmatter) for ``skill_name``.
 
@@ -104,12 +111,11 @@ def read_skill_body(skill_name: str, plugins_dir: Path | None = None) -> str:
     plugins_dir = plugins_dir if plugins_dir is not None else _default_plugins_dir()
     path = _skill_md_path(plugins_dir, skill_name)
     try:
-        text = path.read_text(encoding="utf-8")
+        return _SKILL_MD_CACHE.read(path)
     except FileNotFoundError as exc:
         raise SkillNotFoundError(
             f"no SKILL.md for skill {skill_name!r} at {path}",
         ) from exc
-    return _strip_frontmatter(text)
 
 
 def build_skill_system_prompt(
@@ -126,6 +132,14 @@ def build_skill_system_prompt(
     """
     base = build_system_prompt(settings)
     body = read_skill_body(skill_name, plugins_dir=plugins_dir)
+    return _join_prompt(base, body)
+
+
+@lru_cache(maxsize=64)
+def _join_prompt(base: str, body: str) -> str:
+    """Join persona + skill body. Both inputs are cached strings, so the
+    memo key hashes in constant time and repeat dispatches get the same
+    assembled prompt back without re-concatenating."""
     return f"{base}\n\n{body}"
 
 
@@ -149,7 +163,9 @@ def compile_skill_agent(
     skill is the first that needs one — ``web_search`` is wired in by
     its caller. Anything pydantic-ai accepts in ``Agent(tools=...)``
     works: a plain function, a :class:`pydantic_ai.Tool`, or a list
-    mixing both. ``None`` and ``()`` are equivalent — no tools.
+    mixing both. ``None`` and ``()`` are equivalent — no tools. With
+    tracing on, plain-function tools record a ``tool.call`` span per
+    call (:func:`tab_cli.tracing.traced_tools`).
 
     Raises:
         SkillNotFoundError: when the skill has no SKILL.md on disk.
@@ -160,6 +176,7 @@ def compile_skill_agent(
     # the package follows.
     from pydantic_ai import Agent
 
+    from tab_cli import tracing
     from tab_cli.personality import resolve_model
 
     prompt = build_skill_system_prompt(
@@ -176,7 +193,7 @@ def compile_skill_agent(
         model=resolved_model,
         system_prompt=prompt,
         defer_model_check=True,
-        tools=tuple(tools) if tools else (),
+        tools=tuple(tracing.traced_tools(tools)) if tools else (),
     )
 
 
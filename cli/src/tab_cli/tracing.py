@@ -0,0 +1,276 @@
+"""Opt-in per-turn latency tracing.
+
+When a ``tab chat`` turn feels slow, the question is which phase paid
+for it: the settings-nudge check, the grimoire match (an embedding
+round-trip), compiling a skill agent, the model's request setup, the
+wait for the first token, the stream itself, or a tool call in the
+middle. This module records each of those as a span and appends it to
+a local file, one JSON object per line.
+
+Off by default. ``tab --trace PATH`` (any subcommand) or
+``TAB_TRACE=PATH`` turns it on for the process; :func:`enable` is the
+programmatic form. Disabled, :func:`span` hands back a shared no-op
+span, so the instrumented call sites cost a global lookup and nothing
+else.
+
+The line format borrows OpenTelemetry's span field names —
+``trace_id`` (32 hex), ``span_id`` / ``parent_span_id`` (16 hex),
+``name``, ``start_time_unix_nano``, ``end_time_unix_nano``,
+``attributes``, ``status`` — so a trace file can be read with ``jq``
+as-is or mapped field-for-field onto an OTLP exporter later without
+Tab taking an OpenTelemetry dependency now. Each REPL line is one
+trace: ``chat.turn`` is the root and every phase nests under it.
+
+Parenting rides on a :class:`contextvars.ContextVar`, which asyncio
+tasks and :func:`asyncio.to_thread` copy — so the speculative turn's
+registry match on a worker thread and the model's request setup on
+the turn loop still land under the right ``chat.turn``. A span opened
+with no parent (agent compile at session start, a tool run on an
+executor that doesn't carry context) starts a trace of its own.
+
+Like :mod:`tab_cli.embeddings`' cache, the trace file is advisory: a
+failed write is dropped rather than breaking the turn it describes.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed phase. Written to the trace file when it ends."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_time_unix_nano: int
+    end_time_unix_nano: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes discovered while the span is open."""
+        self.attributes.update(attributes)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+class _NullSpan:
+    """What :func:`span` yields while tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Appends finished spans to ``path`` as JSON lines.
+
+    The file is opened per span rather than held: a turn produces a
+    handful of spans, and an append-and-close leaves a complete file
+    behind however the process exits. The lock keeps lines whole when
+    spans end on several threads at once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_json(), default=str)
+        with self._lock:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                with self._path.open("a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+            except OSError:
+                pass
+
+
+_tracer: Tracer | None = None
+_current: ContextVar[Span | None] = ContextVar("tab_trace_span", default=None)
+
+
+def enable(path: str | os.PathLike[str]) -> Tracer:
+    """Start appending spans to ``path`` for the rest of the process."""
+    global _tracer
+    _tracer = Tracer(Path(path).expanduser())
+    return _tracer
+
+
+def disable() -> None:
+    global _tracer
+    _tracer = None
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def now() -> int:
+    """Wall-clock nanoseconds, the unit every span timestamp uses."""
+    return time.time_ns()
+
+
+def _open(name: str, start: int, attributes: dict[str, Any]) -> Span:
+    parent = _current.get()
+    return Span(
+        name=name,
+        trace_id=parent.trace_id if parent is not None else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        parent_span_id=parent.span_id if parent is not None else None,
+        start_time_unix_nano=start,
+        attributes=attributes,
+    )
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | _NullSpan]:
+    """Time the ``with`` body as ``name``, nested under the current span.
+
+    An exception marks the span ``"error"`` (with the exception type as
+    ``error.type``) and propagates unchanged.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+
+    current = _open(name, now(), attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.status = "error"
+        current.set(**{"error.type": type(exc).__name__})
+        raise
+    finally:
+        _current.reset(token)
+        current.end_time_unix_nano = now()
+        tracer.export(current)
+
+
+def record(name: str, start: int, end: int, **attributes: Any) -> None:
+    """Write a span whose bounds were measured by the caller.
+
+    For phases that don't fit a ``with`` block — the wait for a
+    stream's first chunk ends inside the loop that consumes it.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return
+    finished = _open(name, start, attributes)
+    finished.end_time_unix_nano = end
+    tracer.export(finished)
+
+
+def stream(chunks: Iterator[str], started: int) -> Iterator[str]:
+    """Pass ``chunks`` through, recording first-token and stream spans.
+
+    ``model.first_token`` runs from ``started`` — taken just before the
+    run was started — to the first chunk; ``model.stream`` from there to
+    the last. A stream that yields nothing records neither.
+    """
+    if _tracer is None:
+        yield from chunks
+        return
+    first = 0
+    count = 0
+    chars = 0
+    for chunk in chunks:
+        if not count:
+            first = now()
+            record("model.first_token", started, first)
+        count += 1
+        chars += len(chunk)
+        yield chunk
+    if count:
+        record("model.stream", first, now(), chunks=count, chars=chars)
+
+
+async def astream(chunks: AsyncIterator[str], started: int) -> AsyncIterator[str]:
+    """Async :func:`stream`, for the speculative turn."""
+    first = 0
+    count = 0
+    chars = 0
+    async for chunk in chunks:
+        if not count:
+            first = now()
+            record("model.first_token", started, first)
+        count += 1
+        chars += len(chunk)
+        yield chunk
+    if count:
+        record("model.stream", first, now(), chunks=count, chars=chars)
+
+
+def traced_tools(tools: Sequence[Any]) -> list[Any]:
+    """Wrap plain-function tools so each call records a ``tool.call`` span.
+
+    Returned as-is when tracing is off. Only bare callables are wrapped;
+    a pydantic-ai ``Tool`` already carries its own schema, and wrapping
+    its function would mean rebuilding it. ``functools.wraps`` keeps the
+    name, docstring and signature pydantic-ai builds the tool schema
+    from.
+    """
+    if _tracer is None:
+        return list(tools)
+    from pydantic_ai import Tool
+
+    return [
+        tool if isinstance(tool, Tool) or not callable(tool) else _traced_tool(tool)
+        for tool in tools
+    ]
+
+
+def _traced_tool(function: Callable[..., Any]) -> Callable[..., Any]:
+    name = getattr(function, "__name__", type(function).__name__)
+
+    # pydantic-ai awaits coroutine functions and runs the rest on a
+    # worker thread, deciding by inspection — the wrapper must match.
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span("tool.call", tool=name):
+                return await function(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with span("tool.call", tool=name):
+            return function(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,137 @@
+"""In-process vector repository for the skill gate.
+
+Grimoire's default repository is Postgres + pgvector: every
+:meth:`SkillRegistry.match` is a network round-trip to a database for
+a corpus that holds a handful of skill descriptions. At that size the
+whole corpus fits in one small matrix, and a top-1 search is a single
+matrix-vector product — microseconds, no daemon, no connection pool.
+
+:class:`InMemoryRepository` implements the slice of grimoire's
+repository surface the :class:`grimoire.Gate` drives
+(``get_corpus_meta``, ``seed_corpus``, ``top_k_in_corpus``), the same
+slice the registry tests' fakes cover. ``load_skill_registry`` selects
+it when ``[grimoire].backend = "memory"`` is set in
+``~/.tab/config.toml``.
+
+Storage per corpus:
+
+- ``matrix`` — ``float32`` array of shape ``(rows, dims)``, each row
+  L2-normalised at seed time so cosine similarity is a plain dot
+  product.
+- ``thresholds`` — ``float64`` array of per-row gate bars, carried
+  back on every :class:`grimoire.db.repository.ItemMatch`. Kept at
+  full precision so a bar read back compares exactly against the
+  SKILL.md or override value it was seeded from (``0.55`` doesn't
+  survive a float32 round-trip).
+- ``names`` — row labels in seed order.
+
+Nothing persists. The corpus is rebuilt from the embedding cache on
+every start (see :mod:`tab_cli.embeddings`), which is a few file reads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # avoid forcing grimoire's import path at module load
+    from grimoire.db.repository import CorpusMeta, ItemMatch, ItemSeed
+
+
+@dataclass(frozen=True, slots=True)
+class _Corpus:
+    names: tuple[str, ...]
+    matrix: np.ndarray
+    thresholds: np.ndarray
+    meta: CorpusMeta
+
+
+def normalise_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise each row; all-zero rows stay zero (similarity 0).
+
+    Also used by :meth:`tab_cli.registry.SkillRegistry.match_many`, so
+    bulk routing and the memory backend score identically.
+    """
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
+class InMemoryRepository:
+    """A NumPy-backed stand-in for grimoire's pgvector repository."""
+
+    def __init__(self) -> None:
+        self._corpora: dict[str, _Corpus] = {}
+
+    def get_corpus_meta(self, corpus_key: str) -> CorpusMeta | None:
+        corpus = self._corpora.get(corpus_key)
+        return corpus.meta if corpus is not None else None
+
+    def seed_corpus(
+        self,
+        corpus_key: str,
+        rows: list[ItemSeed],
+        *,
+        embedder_identity: str,
+        embedding_dimensions: int,
+    ) -> None:
+        """Replace ``corpus_key`` with ``rows`` — same semantics as pgvector."""
+        from grimoire.db.repository import CorpusMeta
+
+        if rows:
+            matrix = np.asarray([row.embedding for row in rows], dtype=np.float32)
+        else:
+            matrix = np.zeros((0, embedding_dimensions), dtype=np.float32)
+        if matrix.shape[1] != embedding_dimensions:
+            raise ValueError(
+                f"corpus {corpus_key!r}: expected {embedding_dimensions}-dim "
+                f"embeddings, got {matrix.shape[1]}",
+            )
+
+        self._corpora[corpus_key] = _Corpus(
+            names=tuple(row.name for row in rows),
+            matrix=normalise_rows(matrix),
+            thresholds=np.asarray([row.threshold for row in rows], dtype=np.float64),
+            meta=CorpusMeta(
+                corpus_key=corpus_key,
+                embedder=embedder_identity,
+                embedding_dimensions=embedding_dimensions,
+                embedded_at=datetime.now(UTC),
+            ),
+        )
+
+    def top_k_in_corpus(
+        self,
+        corpus_key: str,
+        query_vec: Sequence[float],
+        k: int,
+    ) -> list[ItemMatch]:
+        """Return the ``k`` most similar rows, best first."""
+        from grimoire.db.repository import ItemMatch
+
+        corpus = self._corpora.get(corpus_key)
+        if corpus is None or not corpus.names or k <= 0:
+            return []
+
+        query = normalise_rows(np.asarray(query_vec, dtype=np.float32))
+        scores = corpus.matrix @ query
+
+        if k == 1:
+            order = [int(np.argmax(scores))]
+        else:
+            k = min(k, len(corpus.names))
+            top = np.argpartition(-scores, k - 1)[:k]
+            order = top[np.argsort(-scores[top])].tolist()
+
+        return [
+            ItemMatch(
+                name=corpus.names[index],
+                threshold=float(corpus.thresholds[index]),
+                similarity=float(scores[index]),
+            )
+            for index in order
+        ]
@@ -0,0 +1,54 @@
+"""Background preloading of local models at session start.
+
+The first ``tab chat --model ollama:...`` turn used to pay for loading
+the weights into memory — often several seconds — while the user
+waited on a blank line. Ollama loads a model on any request naming it,
+including an empty one (``/api/chat`` with no messages,
+``/api/embed`` with no input), and keeps it resident for
+``keep_alive``. :func:`start_warm_up` sends those empty requests on a
+daemon thread as the session starts, so the load overlaps with the
+user typing their first line instead of following it.
+
+Targets are duck-typed: anything with a ``warm_up()`` method —
+:class:`tab_cli.models.OllamaNativeModel`,
+:class:`tab_cli.embeddings.OllamaEmbedder` and the wrappers that
+delegate to it. Hosted models (an ``anthropic:`` string) and test
+stubs have no such method and are skipped, so callers can hand over
+whatever they hold without asking "is this Ollama?" first.
+
+Warm-up is advisory, like :mod:`tab_cli.embeddings`' disk cache. A
+failed preload (daemon not running, model not pulled) is dropped
+silently: the first real request hits the same problem and reports it
+through the usual ``tab: <reason>`` path, where the user can act on it.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+
+def start_warm_up(*targets: Any) -> threading.Thread | None:
+    """Call ``warm_up()`` on each target, in order, on a daemon thread.
+
+    Returns the started thread — tests join it — or ``None`` when no
+    target can be warmed. Daemon, so a user who exits before the load
+    finishes isn't kept waiting on it.
+    """
+    warmable = [target for target in targets if hasattr(target, "warm_up")]
+    if not warmable:
+        return None
+    thread = threading.Thread(
+        target=_warm_all, args=(warmable,), name="tab-warm-up", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _warm_all(targets: list[Any]) -> None:
+    for target in targets:
+        try:
+            target.warm_up()
+        except Exception:
+            # See module docs: the first real request surfaces it.
+            continue
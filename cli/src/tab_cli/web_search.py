@@ -25,26 +25,53 @@ Design choices that aren't obvious from the call site:
   not an error — the tool returns an empty list and a one-line
   explanatory snippet so the model can decide to fall through to its
   own knowledge instead of failing the turn.
-- **Builder, not module-level state.** :func:`build_web_search_tool`
+- **Builder, not module-level config.** :func:`build_web_search_tool`
   takes the API key + http client as arguments so tests can pin a fake
   client without monkey-patching ``os.environ``. The default
   :func:`default_web_search` reads ``EXA_API_KEY`` at call time so the
   config picture is also "do nothing ahead of time."
+- **One pooled connection, shared.** The one piece of module state is
+  the transport: when no client is injected, every tool built here
+  posts through a single lazily-built :class:`httpx.Client` with
+  keep-alive (and HTTP/2 when the optional ``h2`` package is
+  installed), closed at interpreter exit. A fresh client per call paid
+  TCP + TLS setup to ``api.exa.ai`` on every search; the teach research
+  phase makes several in a row.
+- **Results cached on disk.** :func:`default_web_search` wires a
+  :class:`~tab_cli.search_cache.SearchCache` under
+  ``~/.tab/search-cache/`` in front of the request, so a query the
+  teach skill already ran this week (modulo case and trailing
+  punctuation) is answered without a paid round-trip to Exa.
+- **A batched sibling.** :func:`build_web_search_many_tool` wraps the
+  single-query tool in a thread pool: the research phase's several
+  angles on a topic go out concurrently under one global deadline
+  instead of queueing behind each other's timeouts, and the merged
+  list is deduplicated by URL before the model sees it.
 """
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import httpx
+
+    from tab_cli.search_cache import SearchCache
+
 
 # Exa's REST endpoint for /search. Documented at https://docs.exa.ai/.
-# Pinned here rather than parameterised — switching providers is a
-# deliberate change, not a runtime knob, and a constant keeps the call
-# site readable.
+# Switching providers is a deliberate change, not a runtime knob; the
+# ``EXA_SEARCH_URL`` environment variable exists only to point the tool
+# at a stand-in such as ``benchmarks/exa_stub.py`` for offline benchmarks.
 EXA_SEARCH_URL = "https://api.exa.ai/search"
 
 
@@ -89,6 +116,64 @@ _DEFAULT_TIMEOUT_SECONDS = 15.0
 _DEFAULT_NUM_RESULTS = 10
 
 
+# Connection-pool bounds for the shared client. Search traffic is a
+# handful of requests per teach turn, so a small pool is plenty; the
+# keep-alive expiry is long enough to span the model's think time
+# between consecutive tool calls in one research phase.
+_POOL_MAX_CONNECTIONS = 8
+_POOL_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# Most queries one ``web_search_many`` call will fan out. The research
+# phase wants "several angles", not a crawl; past this the extra
+# queries are dropped rather than queued behind the deadline.
+_MAX_PARALLEL_QUERIES = _POOL_MAX_CONNECTIONS
+
+# Per-query result count for the batched tool. Several angles at ten
+# results each would flood the context; five per angle keeps the
+# merged list near what one broad query returns.
+_DEFAULT_MANY_NUM_RESULTS = 5
+
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
+
+
+def _shared_http_client() -> httpx.Client:
+    """Return the process-wide pooled client, building it on first use.
+
+    ``httpx.Client`` is thread-safe, so one instance serves every tool
+    and thread. HTTP/2 is enabled only when ``h2`` is importable —
+    ``httpx`` raises at construction otherwise, and the extra is not a
+    hard dependency.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            # Local import: keeps ``httpx`` out of the import path for
+            # tests that pass a stub client.
+            import httpx
+
+            _shared_client = httpx.Client(
+                timeout=_DEFAULT_TIMEOUT_SECONDS,
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=_POOL_MAX_CONNECTIONS,
+                    keepalive_expiry=_POOL_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+            atexit.register(_close_shared_http_client)
+        return _shared_client
+
+
+def _close_shared_http_client() -> None:
+    """Close the pooled client if one was built. Safe to call twice."""
+    global _shared_client
+    with _shared_client_lock:
+        client, _shared_client = _shared_client, None
+    if client is not None:
+        client.close()
+
+
 def _trim(text: str, *, limit: int = 480) -> str:
     """Trim a snippet to a sensible upper bound.
 
@@ -114,6 +199,8 @@ def build_web_search_tool(
     http_client: _HttpClientLike | None = None,
     num_results: int = _DEFAULT_NUM_RESULTS,
     timeout_seconds: float = _DEFAULT_TIMEOUT_SECONDS,
+    cache: SearchCache | None = None,
+    search_url: str = EXA_SEARCH_URL,
 ) -> Callable[[str], list[dict[str, str]]]:
     """Return a ``web_search(query)`` callable wired with the given backend.
 
@@ -131,13 +218,20 @@ def build_web_search_tool(
       this short-circuit is the wire-level expression of that
       fallback. The teach agent sees a concrete answer instead of a
       tool error and can adjust the conversation accordingly.
-    - When ``api_key`` is set but ``http_client`` is ``None``, an
-      :class:`httpx.Client` is constructed at call time. Tests inject a
-      fake :class:`_HttpClientLike` to avoid the network.
+    - When ``api_key`` is set but ``http_client`` is ``None``, calls go
+      through the module's shared pooled :class:`httpx.Client`, built
+      on first use. Tests inject a fake :class:`_HttpClientLike` to
+      avoid the network.
     - HTTP errors are caught and surfaced as a single-entry result with
       ``snippet`` describing the failure. The teach agent should never
       see an unhandled exception — the model's recovery story is
       "search came back empty, fall back."
+    - ``search_url`` defaults to Exa; tests and benchmarks point it at
+      ``ExaStubServer`` in ``benchmarks/exa_stub.py``.
+    - When ``cache`` is given, it is consulted before the request and
+      filled after a successful, non-empty one. Error entries and the
+      no-key fallback are never cached, so a transient failure doesn't
+      stick for the TTL.
     """
 
     def web_search(query: str) -> list[dict[str, str]]:
@@ -172,50 +266,34 @@ def build_web_search_tool(
                 }
             ]
 
+        if cache is not None:
+            cached = cache.get(query, num_results)
+            if cached is not None:
+                return cached
+
         try:
-            client = http_client
-            close_after = False
-            if client is None:
-                # Local import: keeps ``httpx`` out of the import path
-                # for tests that pass a stub client. The real
-                # personality CLI ships httpx as a transitive of
-                # pydantic-ai so the import is free at session warm-up
-                # time, but skipping it keeps test isolation tidy.
-                import httpx
-
-                client = httpx.Client(timeout=timeout_seconds)
-                close_after = True
-
-            try:
-                response = client.post(
-                    EXA_SEARCH_URL,
-                    json={
-                        "query": query,
-                        "numResults": num_results,
-                        "contents": {
-                            # ``text`` gives a long passage; we
-                            # downscope on the way out so the model
-                            # doesn't drown in raw HTML extracts.
-                            "text": True,
-                        },
+            client = http_client if http_client is not None else _shared_http_client()
+            response = client.post(
+                search_url,
+                json={
+                    "query": query,
+                    "numResults": num_results,
+                    "contents": {
+                        # ``text`` gives a long passage; we downscope on
+                        # the way out so the model doesn't drown in raw
+                        # HTML extracts.
+                        "text": True,
                     },
-                    headers={
-                        "x-api-key": api_key,
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                    },
-                    timeout=timeout_seconds,
-                )
-                response.raise_for_status()
-                payload = response.json()
-            finally:
-                if close_after:
-                    # ``httpx.Client`` exposes ``.close()`` but the
-                    # Protocol doesn't, so fall back to ``getattr`` to
-                    # keep the type contract narrow.
-                    closer = getattr(client, "close", None)
-                    if callable(closer):
-                        closer()
+                },
+                headers={
+                    "x-api-key": api_key,
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+                timeout=timeout_seconds,
+            )
+            response.raise_for_status()
+            payload = response.json()
         except Exception as exc:  # noqa: BLE001 — collapse to tool result
             # The model's recovery story — "fall back to existing
             # knowledge" — is better served by a structured "this
@@ -253,11 +331,115 @@ def build_web_search_tool(
             if not (title or url or snippet):
                 continue
             out.append({"title": title, "url": url, "snippet": snippet})
+        if cache is not None:
+            cache.put(query, num_results, out)
         return out
 
     return web_search
 
 
+def build_web_search_many_tool(
+    *,
+    api_key: str | None,
+    http_client: _HttpClientLike | None = None,
+    num_results: int = _DEFAULT_MANY_NUM_RESULTS,
+    deadline_seconds: float = _DEFAULT_TIMEOUT_SECONDS,
+    cache: SearchCache | None = None,
+    search_url: str = EXA_SEARCH_URL,
+) -> Callable[[list[str]], list[dict[str, str]]]:
+    """Return a ``web_search_many(queries)`` callable for concurrent search.
+
+    Built on :func:`build_web_search_tool` — same backend, same cache,
+    same no-key and error entries — with each query run on its own
+    worker thread. Behaviour on top of the single-query tool:
+
+    - **One deadline for the batch.** ``deadline_seconds`` bounds the
+      whole call, and each request's own timeout is capped at it. A
+      query still in flight when the deadline passes contributes a
+      ``[web_search timeout]`` entry; whatever finished is returned.
+    - **Duplicates collapse.** Queries that normalise to the same key
+      run once, and results are merged in query order with the first
+      occurrence of each URL kept. URL-less entries (errors, the no-key
+      note) dedupe on their text, so five unconfigured searches yield
+      one explanation rather than five.
+    - Every entry carries a ``query`` key naming the query that
+      produced it, so the model can tell the angles apart.
+    """
+    from tab_cli.search_cache import normalize_query
+
+    search_one = build_web_search_tool(
+        api_key=api_key,
+        http_client=http_client,
+        num_results=num_results,
+        timeout_seconds=deadline_seconds,
+        cache=cache,
+        search_url=search_url,
+    )
+
+    def web_search_many(queries: list[str]) -> list[dict[str, str]]:
+        """Search the web for several queries at once.
+
+        Use this instead of repeated ``web_search`` calls when you
+        want several angles on a topic — the queries run in parallel.
+        Returns one merged list of results, each with ``title``,
+        ``url``, ``snippet``, and the ``query`` that found it. Results
+        repeated across queries appear once.
+
+        Args:
+            queries: Up to eight distinct, specific search phrases —
+                e.g. ["event sourcing trade-offs production",
+                "event sourcing schema versioning"].
+        """
+        unique: dict[str, str] = {}
+        for query in queries:
+            if query.strip():
+                unique.setdefault(normalize_query(query), query)
+        batch = list(unique.values())[:_MAX_PARALLEL_QUERIES]
+        if not batch:
+            return []
+
+        pool = ThreadPoolExecutor(
+            max_workers=len(batch), thread_name_prefix="web_search_many"
+        )
+        try:
+            futures = [pool.submit(search_one, query) for query in batch]
+            wait_futures(futures, timeout=deadline_seconds)
+        finally:
+            # Don't block on stragglers: their request timeout is
+            # already capped at the deadline, so they wind down alone.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        merged: list[dict[str, str]] = []
+        seen: set[tuple[str, ...]] = set()
+        for query, future in zip(batch, futures, strict=True):
+            if future.done() and not future.cancelled():
+                results = future.result()
+            else:
+                results = [
+                    {
+                        "title": "[web_search timeout]",
+                        "url": "",
+                        "snippet": (
+                            f"No results within the {deadline_seconds:g}s "
+                            "deadline for this query."
+                        ),
+                    }
+                ]
+            for result in results:
+                key = (
+                    (result["url"],)
+                    if result["url"]
+                    else (result["title"], result["snippet"])
+                )
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append({**result, "query": query})
+        return merged
+
+    return web_search_many
+
+
 def _join_highlights(highlights: Any) -> str:
     """Flatten Exa's ``highlights`` array into one snippet-shaped string."""
     if not isinstance(highlights, list):
@@ -273,5 +455,50 @@ def default_web_search() -> Callable[[str], list[dict[str, str]]]:
     callable still works — it just returns the explanatory no-op
     entry. This is the form the CLI wraps for ``tab teach`` and the
     chat REPL's grimoire-routed dispatch.
+
+    The tool is memoized per key, so repeated ``teach`` dispatches in
+    one REPL session get the same callable back instead of rebuilding
+    it; a changed ``EXA_API_KEY`` still yields a freshly wired tool.
+    Every keyed tool shares the on-disk result cache — except when
+    ``EXA_SEARCH_URL`` points somewhere other than Exa, whose results
+    must not be served later as real ones.
     """
-    return build_web_search_tool(api_key=os.environ.get("EXA_API_KEY"))
+    return _web_search_for_key(*_env_backend())
+
+
+def default_web_search_many() -> Callable[[list[str]], list[dict[str, str]]]:
+    """Batched counterpart of :func:`default_web_search`, memoized the same way."""
+    return _web_search_many_for_key(*_env_backend())
+
+
+def _env_backend() -> tuple[str | None, str]:
+    return (
+        os.environ.get("EXA_API_KEY"),
+        os.environ.get("EXA_SEARCH_URL") or EXA_SEARCH_URL,
+    )
+
+
+def _cache_for(search_url: str) -> SearchCache | None:
+    from tab_cli.search_cache import SearchCache
+
+    return SearchCache() if search_url == EXA_SEARCH_URL else None
+
+
+@lru_cache(maxsize=4)
+def _web_search_for_key(
+    api_key: str | None,
+    search_url: str = EXA_SEARCH_URL,
+) -> Callable[[str], list[dict[str, str]]]:
+    return build_web_search_tool(
+        api_key=api_key, cache=_cache_for(search_url), search_url=search_url
+    )
+
+
+@lru_cache(maxsize=4)
+def _web_search_many_for_key(
+    api_key: str | None,
+    search_url: str = EXA_SEARCH_URL,
+) -> Callable[[list[str]], list[dict[str, str]]]:
+    return build_web_search_many_tool(
+        api_key=api_key, cache=_cache_for(search_url), search_url=search_url
+    )
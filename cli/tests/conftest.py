@@ -1,6 +1,6 @@
 """Suite-wide fixtures for the Tab CLI.
 
-The single autouse fixture here neuters ``_resolve_model_or_exit`` so the
+The first autouse fixture here neuters ``_resolve_model_or_exit`` so the
 bulk of the suite — which tests dials, output formatting, error contracts,
 skill dispatch, etc. — doesn't have to wire a real model resolution path
 on every invocation. Production behavior (error early when no flag and no
@@ -13,10 +13,25 @@ config) is tested directly:
 
 Anything else that wants to test model-resolution behavior in
 context should re-patch the resolver inside the test itself.
+
+The second keeps the ``tab serve`` fast path out of the suite: a
+developer's running daemon would otherwise answer ``tab ask`` and the
+skill commands before their stubs are reached. ``test_daemon.py``
+re-patches it to exercise forwarding.
+
+The third keeps tracing off: a ``TAB_TRACE`` in the developer's
+environment would switch it on for every CLI test, and a test that
+enables it must not leak spans into the next one.
+
+The fourth forgets the parsed ``~/.tab/config.toml``: the loaders read
+it once per process, and each test points ``Path.home`` at a config of
+its own.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 
 
@@ -43,3 +58,30 @@ def _stub_model_resolver(monkeypatch: pytest.MonkeyPatch) -> None:
         return "anthropic:test-stub"
 
     monkeypatch.setattr("tab_cli.cli._resolve_model_or_exit", _stub)
+
+
+@pytest.fixture(autouse=True)
+def _no_daemon(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report "no ``tab serve`` running" to every CLI command."""
+    monkeypatch.setattr("tab_cli.cli._forward_to_daemon", lambda request: None)
+
+
+@pytest.fixture(autouse=True)
+def _no_tracing(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Start every test with tracing off and leave it off afterwards."""
+    from tab_cli import tracing
+
+    monkeypatch.delenv("TAB_TRACE", raising=False)
+    tracing.disable()
+    yield
+    tracing.disable()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config() -> Iterator[None]:
+    """Start and end every test with no cached config."""
+    from tab_cli import config
+
+    config._clear_cache()
+    yield
+    config._clear_cache()
@@ -54,6 +54,10 @@ class _StubAgent:
             raise self.raise_on_run
         return _StubResult(output=self.response)
 
+    async def run(self, *args: Any, **kwargs: Any) -> _StubResult:
+        """Async twin used by ``--batch``."""
+        return self.run_sync(*args, **kwargs)
+
 
 @dataclass
 class _CompileRecorder:
@@ -429,3 +433,90 @@ def test_ask_help_lists_dial_flags(runner: CliRunner) -> None:
     assert sub.exit_code == 0
     for dial in ("--humor", "--directness", "--warmth", "--autonomy", "--verbosity"):
         assert dial in sub.stdout, f"{dial} missing from `tab ask --help`"
+
+
+# --------------------------------------------------------------- --batch
+
+
+def test_ask_batch_compiles_once_and_writes_jsonl(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    import json
+
+    agent = _StubAgent(response="ok")
+    recorder = _patch_compile(monkeypatch, agent)
+    source = tmp_path / "in.jsonl"
+    source.write_text('"one"\n{"prompt": "two", "id": "b"}\n\n"three"\n')
+    target = tmp_path / "out.jsonl"
+
+    result = runner.invoke(
+        app, ["ask", "--batch", str(source), "--out", str(target), "--concurrency", "2"]
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert len(recorder.calls) == 1
+    records = [json.loads(line) for line in target.read_text().splitlines()]
+    assert sorted(r["prompt"] for r in records) == ["one", "three", "two"]
+    assert all(r["output"] == "ok" and r["error"] is None for r in records)
+    assert result.stdout == ""
+
+
+def test_ask_batch_defaults_to_stdout(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    _patch_compile(monkeypatch, _StubAgent(response="ok"))
+    source = tmp_path / "in.jsonl"
+    source.write_text('"one"\n')
+
+    result = runner.invoke(app, ["ask", "--batch", str(source)])
+
+    assert result.exit_code == 0, result.stderr
+    assert '"output": "ok"' in result.stdout
+
+
+def test_ask_batch_exits_non_zero_when_any_prompt_failed(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    _patch_compile(monkeypatch, _StubAgent(raise_on_run=RuntimeError("no key")))
+    source = tmp_path / "in.jsonl"
+    source.write_text('"one"\n"two"\n')
+
+    result = runner.invoke(app, ["ask", "--batch", str(source)])
+
+    assert result.exit_code == 1
+    assert "tab: 2 of 2 prompts failed" in result.stderr
+    assert result.stdout.count('"error": "no key"') == 2
+
+
+def test_ask_batch_missing_file_is_a_readable_error(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    _patch_compile(monkeypatch, _StubAgent())
+    result = runner.invoke(app, ["ask", "--batch", str(tmp_path / "nope.jsonl")])
+    assert result.exit_code == 1
+    assert result.stderr.startswith("tab: ")
+    assert "Traceback" not in result.stderr
+
+
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["ask"], "tab: pass a PROMPT, or --batch FILE for many"),
+        (
+            ["ask", "hi", "--batch", "x.jsonl"],
+            "tab: pass either PROMPT or --batch FILE, not both",
+        ),
+    ],
+)
+def test_ask_requires_exactly_one_of_prompt_or_batch(
+    runner: CliRunner,
+    monkeypatch: pytest.MonkeyPatch,
+    argv: list[str],
+    message: str,
+) -> None:
+    agent = _StubAgent()
+    _patch_compile(monkeypatch, agent)
+    result = runner.invoke(app, argv)
+    assert result.exit_code == 1
+    assert result.stderr.strip() == message
+    assert agent.runs == []
@@ -0,0 +1,138 @@
+"""Tests for :mod:`tab_cli.batch` — ``tab ask --batch``'s runner.
+
+The agent is an async stub with a per-prompt delay, so the tests can
+pin the properties the batch mode exists for: turns overlap up to the
+concurrency cap and no further, records stream out in completion order
+as each turn lands, and one bad line or failed turn is recorded without
+stopping the rest. The CLI wiring lives in ``test_ask.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from tab_cli.batch import run_batch
+
+
+@dataclass
+class _StubResult:
+    output: str
+
+
+@dataclass
+class _StubAgent:
+    """Async ``run`` that answers after ``delays[prompt]`` seconds."""
+
+    delays: dict[str, float] = field(default_factory=dict)
+    fail_on: set[str] = field(default_factory=set)
+    in_flight: int = 0
+    peak: int = 0
+    prompts: list[str] = field(default_factory=list)
+
+    async def run(self, prompt: str) -> _StubResult:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(prompt, 0.01))
+            if prompt in self.fail_on:
+                raise RuntimeError(f"model refused {prompt!r}")
+            return _StubResult(output=f"answer to {prompt}")
+        finally:
+            self.in_flight -= 1
+
+
+def _batch(agent: _StubAgent, lines: list[str], **kwargs: Any) -> list[dict]:
+    written: list[str] = []
+    run_batch(agent, lines, written.append, **kwargs)
+    assert all(chunk.endswith("\n") for chunk in written)
+    return [json.loads(chunk) for chunk in written]
+
+
+def test_batch_answers_string_and_object_lines() -> None:
+    records = _batch(
+        _StubAgent(),
+        ['"plain prompt"\n', '{"prompt": "with id", "id": "row-7"}\n'],
+        concurrency=1,
+    )
+
+    assert records[0] == {
+        "index": 0,
+        "prompt": "plain prompt",
+        "output": "answer to plain prompt",
+        "error": None,
+        "latency_ms": records[0]["latency_ms"],
+    }
+    assert records[1]["id"] == "row-7"
+    assert records[1]["output"] == "answer to with id"
+    assert all(r["latency_ms"] >= 0 for r in records)
+
+
+def test_batch_caps_turns_in_flight_at_concurrency() -> None:
+    agent = _StubAgent()
+    lines = [json.dumps(f"p{n}") for n in range(10)]
+
+    records = _batch(agent, lines, concurrency=3)
+
+    assert agent.peak == 3
+    assert sorted(r["index"] for r in records) == list(range(10))
+
+
+def test_batch_streams_in_completion_order() -> None:
+    agent = _StubAgent(delays={"slow": 0.2, "fast": 0.0})
+    records = _batch(agent, ['"slow"', '"fast"'], concurrency=2)
+    assert [r["prompt"] for r in records] == ["fast", "slow"]
+    assert [r["index"] for r in records] == [1, 0]
+
+
+def test_batch_records_failures_and_bad_lines_without_stopping() -> None:
+    agent = _StubAgent(fail_on={"boom"})
+    written: list[str] = []
+
+    summary = run_batch(
+        agent,
+        ['"ok"', "not json", '{"id": 3}', '"boom"', "   \n"],
+        written.append,
+        concurrency=2,
+    )
+
+    records = sorted((json.loads(c) for c in written), key=lambda r: r["index"])
+    assert [r["error"] is None for r in records] == [True, False, False, False]
+    assert records[1]["error"].startswith("invalid JSON")
+    assert "prompt" in records[2]["error"]
+    assert records[3]["error"] == "model refused 'boom'"
+    assert (summary.total, summary.failed) == (4, 3)
+    assert agent.prompts == ["ok", "boom"]
+
+
+def test_batch_reads_lines_lazily() -> None:
+    """Input is pulled only as slots free up — a generator is never drained early."""
+    agent = _StubAgent()
+    pulled: list[int] = []
+
+    def lines():
+        for n in range(6):
+            pulled.append(n)
+            yield json.dumps(f"p{n}")
+
+    written: list[str] = []
+
+    def write(record: str) -> None:
+        # When the first record lands, at most concurrency + 1 lines
+        # have been read (the one waiting on a slot).
+        if not written:
+            assert len(pulled) <= 3
+        written.append(record)
+
+    run_batch(agent, lines(), write, concurrency=2)
+    assert len(written) == 6
+
+
+def test_batch_rejects_non_positive_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        run_batch(_StubAgent(), [], lambda _: None, concurrency=0)
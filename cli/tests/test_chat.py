@@ -8,6 +8,9 @@ The REPL has four moving parts and the tests pin each one:
   match (no agent call); a miss falls through to the agent.
 - Streaming + history: ``run_stream_sync`` chunks reach stdout; the
   conversation history carries forward across turns.
+- Speculation: with ``speculate=True`` the default agent turn starts
+  while the registry match runs, streams only once routing falls
+  through, and is cancelled when a skill wins.
 - Settings adjustment: "set humor to 90%" mutates the active
   :class:`TabSettings`, recompiles the agent, and continues the loop
   with history intact.
@@ -20,10 +23,12 @@ chat``) gets its own integration-shaped test using
 
 from __future__ import annotations
 
+import asyncio
 import io
-from contextlib import contextmanager
+import threading
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Iterator
+from typing import Any, AsyncIterator, Iterator
 from unittest.mock import patch
 
 import pytest
@@ -65,6 +70,24 @@ class _StubStreamResult:
         return list(self.messages)
 
 
+@dataclass
+class _StubAsyncStreamResult:
+    """Async counterpart of :class:`_StubStreamResult` for ``run_stream``."""
+
+    chunks: list[str]
+    messages: list[Any]
+    delay: float = 0.0
+
+    async def stream_text(self, *, delta: bool = False) -> AsyncIterator[str]:
+        assert delta is True, "REPL must request deltas, not cumulative text"
+        for chunk in self.chunks:
+            await asyncio.sleep(self.delay)
+            yield chunk
+
+    def all_messages(self) -> list[Any]:
+        return list(self.messages)
+
+
 @dataclass
 class _StubAgent:
     """Stand-in for ``pydantic_ai.Agent`` for the REPL's needs.
@@ -78,6 +101,9 @@ class _StubAgent:
 
     response_stream: list[tuple[list[str], list[Any]]] = field(default_factory=list)
     runs: list[dict[str, Any]] = field(default_factory=list)
+    chunk_delay: float = 0.0
+    cancelled: list[str] = field(default_factory=list)
+    streams_opened: threading.Event = field(default_factory=threading.Event)
 
     def run_stream_sync(
         self,
@@ -102,6 +128,24 @@ class _StubAgent:
             chunks, messages = (["ok"], [object()])
         return _StubStreamResult(chunks=chunks, messages=messages)
 
+    @asynccontextmanager
+    async def run_stream(
+        self,
+        user_prompt: str,
+        *,
+        message_history: list[Any] | None = None,
+    ) -> AsyncIterator[_StubAsyncStreamResult]:
+        """Async path the speculative turn uses; records like the sync one."""
+        sync = self.run_stream_sync(user_prompt, message_history=message_history)
+        self.streams_opened.set()
+        try:
+            yield _StubAsyncStreamResult(
+                sync.chunks, sync.messages, delay=self.chunk_delay
+            )
+        except asyncio.CancelledError:
+            self.cancelled.append(user_prompt)
+            raise
+
 
 @dataclass
 class _StubHit:
@@ -185,6 +229,8 @@ def _run_chat_with_input(
     registry: _StubRegistry | None = None,
     model: str | None = None,
     skill_agent: _StubAgent | None = None,
+    history_token_budget: int | None = None,
+    speculate: bool = False,
 ) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
     """Drive the REPL with stdin=``text`` and return ``(stdout, tab_calls, skill_calls)``."""
     from tab_cli.chat import run_chat
@@ -197,6 +243,8 @@ def _run_chat_with_input(
             registry=registry if registry is not None else _StubRegistry(),
             stdin=stdin,
             stdout=stdout,
+            history_token_budget=history_token_budget,
+            speculate=speculate,
         )
     return stdout.getvalue(), tab_calls, skill_calls
 
@@ -475,6 +523,116 @@ def test_empty_lines_are_skipped() -> None:
     assert agent.runs[0]["user_prompt"] == "hello"
 
 
+# ------------------------------------------------------------ speculation
+
+
+def test_speculative_turn_overlaps_routing_and_streams_on_fall_through() -> None:
+    agent = _StubAgent(response_stream=[(["hel", "lo"], ["m1", "m2"])])
+
+    def _responder(query: str) -> None:
+        # The agent request must already be open while routing runs.
+        assert agent.streams_opened.wait(timeout=2), "agent turn did not overlap"
+        return None
+
+    out, _, _ = _run_chat_with_input(
+        "hi tab\nagain\n",
+        agent=agent,
+        registry=_StubRegistry(responder=_responder),
+        speculate=True,
+    )
+
+    assert "hello\n" in out
+    assert [run["user_prompt"] for run in agent.runs] == ["hi tab", "again"]
+    # The first turn's messages were recorded and threaded into the second.
+    assert agent.runs[1]["message_history"] == ["m1", "m2"]
+    assert agent.cancelled == []
+
+
+def test_speculative_turn_is_cancelled_when_a_skill_wins() -> None:
+    persona_agent = _StubAgent(
+        response_stream=[(["persona ", "reply"], [object()])], chunk_delay=0.05
+    )
+    skill_agent = _StubAgent(response_stream=[(["RAWR"], [object()])])
+    registry = _StubRegistry(
+        responder=lambda q: _StubHit(name="draw-dino", passed=True)
+    )
+
+    out, _, skill_calls = _run_chat_with_input(
+        "draw a dinosaur\n",
+        agent=persona_agent,
+        registry=registry,
+        skill_agent=skill_agent,
+        speculate=True,
+    )
+
+    assert "persona" not in out
+    assert "[skill: draw-dino]\nRAWR" in out
+    assert [call["skill_name"] for call in skill_calls] == ["draw-dino"]
+    assert persona_agent.cancelled == ["draw a dinosaur"]
+
+
+def test_below_threshold_hit_streams_the_speculative_turn() -> None:
+    agent = _StubAgent(response_stream=[(["fallback"], [object()])])
+    registry = _StubRegistry(
+        responder=lambda q: _StubHit(name="teach", passed=False)
+    )
+    out, _, skill_calls = _run_chat_with_input(
+        "hmm\n", agent=agent, registry=registry, speculate=True
+    )
+    assert "fallback" in out and "[skill:" not in out
+    assert skill_calls == []
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [("ollama:gemma3:latest", True), ("anthropic:claude-sonnet-4-5", False)],
+)
+def test_speculation_defaults_on_for_ollama_only(
+    isolated_xdg: Any, model: str, expected: bool
+) -> None:
+    from tab_cli.chat import run_chat
+
+    routed: list[str] = []
+
+    def _routed_turn(session: Any, prompt: str, stdout: Any) -> None:
+        routed.append(prompt)
+
+    with (
+        _patched_compile(_StubAgent()),
+        patch("tab_cli.chat._routed_turn", _routed_turn),
+        patch("tab_cli.models.close_shared_models", lambda: None),
+    ):
+        run_chat(
+            model=model,
+            registry=_StubRegistry(),  # type: ignore[arg-type]
+            stdin=io.StringIO("hello\n"),
+            stdout=io.StringIO(),
+            history_token_budget=1000,
+        )
+
+    assert routed == (["hello"] if expected else [])
+
+
+def test_speculate_config_key_overrides_the_model_default(isolated_xdg: Any) -> None:
+    from tab_cli.chat import run_chat
+
+    (isolated_xdg / "config.toml").write_text("[chat]\nspeculate = false\n")
+    routed: list[str] = []
+    with (
+        _patched_compile(_StubAgent()),
+        patch("tab_cli.chat._routed_turn", lambda s, p, o: routed.append(p)),
+        patch("tab_cli.models.close_shared_models", lambda: None),
+    ):
+        run_chat(
+            model="ollama:gemma3:latest",
+            registry=_StubRegistry(),  # type: ignore[arg-type]
+            stdin=io.StringIO("hello\n"),
+            stdout=io.StringIO(),
+            history_token_budget=1000,
+        )
+    assert routed == []
+
+
 # ----------------------------------------------------- Typer-level dispatch
 
 
@@ -976,3 +1134,226 @@ def test_listen_mode_bypasses_settings_nudge() -> None:
     assert "humor 90%" not in out.lower()
     # The setting line went to the skill agent instead.
     assert skill_agent.runs[1]["user_prompt"] == "set humor to 90%"
+
+
+# ------------------------------------------------------ history compaction
+#
+# ``_HistoryManager`` keeps the threaded history inside a token budget
+# by dropping the oldest whole turns. These tests build real
+# pydantic-ai messages so the turn splitter sees the shapes the REPL
+# actually records — including a ``teach``-style tool round-trip.
+
+
+def _system(text: str = "be tab") -> Any:
+    from pydantic_ai.messages import ModelRequest, SystemPromptPart, UserPromptPart
+
+    return ModelRequest(
+        parts=[SystemPromptPart(content=text), UserPromptPart(content="hello")]
+    )
+
+
+def _exchange(n: int, *, size: int = 400) -> list[Any]:
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+    return [
+        ModelRequest(parts=[UserPromptPart(content=f"question {n}")]),
+        ModelResponse(parts=[TextPart(content="x" * size)]),
+    ]
+
+
+def _tool_exchange(n: int) -> list[Any]:
+    from pydantic_ai.messages import (
+        ModelRequest,
+        ModelResponse,
+        TextPart,
+        ToolCallPart,
+        ToolReturnPart,
+        UserPromptPart,
+    )
+
+    return [
+        ModelRequest(parts=[UserPromptPart(content=f"teach me {n}")]),
+        ModelResponse(
+            parts=[
+                ToolCallPart(
+                    tool_name="web_search", args={"query": "q"}, tool_call_id=f"c{n}"
+                )
+            ]
+        ),
+        ModelRequest(
+            parts=[
+                ToolReturnPart(
+                    tool_name="web_search", content="y" * 400, tool_call_id=f"c{n}"
+                )
+            ]
+        ),
+        ModelResponse(parts=[TextPart(content="lesson")]),
+    ]
+
+
+def _history(*turns: list[Any]) -> list[Any]:
+    from pydantic_ai.messages import ModelResponse, TextPart
+
+    out: list[Any] = [_system(), ModelResponse(parts=[TextPart(content="hi")])]
+    for turn in turns:
+        out.extend(turn)
+    return out
+
+
+def test_history_under_budget_is_returned_untouched() -> None:
+    from tab_cli.chat import _HistoryManager
+
+    history = _history(_exchange(1))
+    assert _HistoryManager(token_budget=10_000).compact(history) is history
+
+
+def test_history_over_budget_drops_oldest_turns_and_keeps_system_prompt() -> None:
+    from pydantic_ai.messages import SystemPromptPart, UserPromptPart
+
+    from tab_cli.chat import _HistoryManager
+
+    history = _history(*(_exchange(n) for n in range(10)))
+    compacted = _HistoryManager(token_budget=350).compact(history)
+
+    head = compacted[0].parts
+    assert isinstance(head[0], SystemPromptPart)
+    assert head[0].content == "be tab"
+    prompts = [
+        part.content
+        for message in compacted
+        for part in message.parts
+        if isinstance(part, UserPromptPart)
+    ]
+    # Newest turns survive, oldest (including the opening "hello") don't.
+    assert prompts[-1] == "question 9"
+    assert "hello" not in prompts
+    assert "question 0" not in prompts
+    dropped = 11 - len(prompts)
+    assert f"{dropped} earlier turns" in head[-1].content
+
+
+def test_compaction_never_splits_tool_call_from_tool_return() -> None:
+    from pydantic_ai.messages import ToolCallPart, ToolReturnPart
+
+    from tab_cli.chat import _HistoryManager
+
+    history = _history(*(_tool_exchange(n) for n in range(6)))
+    for budget in range(50, 800, 25):
+        compacted = _HistoryManager(token_budget=budget).compact(history)
+        calls = {
+            part.tool_call_id
+            for message in compacted
+            for part in message.parts
+            if isinstance(part, ToolCallPart)
+        }
+        returns = {
+            part.tool_call_id
+            for message in compacted
+            for part in message.parts
+            if isinstance(part, ToolReturnPart)
+        }
+        assert calls == returns
+
+
+def test_compaction_keeps_newest_turn_even_when_it_alone_is_over_budget() -> None:
+    from tab_cli.chat import _HistoryManager
+
+    history = _history(_exchange(1), _exchange(2, size=10_000))
+    compacted = _HistoryManager(token_budget=100).compact(history)
+    assert compacted[-2:] == history[-2:]
+
+
+def test_repeated_compaction_replaces_the_trim_note() -> None:
+    from pydantic_ai.messages import SystemPromptPart
+
+    from tab_cli.chat import _HistoryManager
+
+    manager = _HistoryManager(token_budget=300)
+    history = manager.compact(_history(*(_exchange(n) for n in range(5))))
+    history = manager.compact([*history, *_exchange(5), *_exchange(6)])
+
+    notes = [
+        part
+        for part in history[0].parts
+        if isinstance(part, SystemPromptPart) and part.content.startswith("[")
+    ]
+    assert len(notes) == 1
+    assert f"{manager.trimmed_turns} earlier turns" in notes[0].content
+
+
+def test_run_chat_threads_compacted_history_into_next_turn() -> None:
+    """End to end: a tight budget trims what the second turn sees."""
+    big = _history(*(_exchange(n) for n in range(8)))
+    agent = _StubAgent(response_stream=[(["one"], big), (["two"], [object()])])
+
+    _run_chat_with_input(
+        "first\nsecond\n/exit\n", agent=agent, history_token_budget=300
+    )
+
+    threaded = agent.runs[1]["message_history"]
+    assert len(threaded) < len(big)
+    assert threaded[-2:] == big[-2:]
+
+
+def test_listen_mode_does_not_compact_mid_dump() -> None:
+    """``listen`` synthesises from the whole dump; trimming early lines
+    while the user is still talking would lose them."""
+    big = _history(*(_exchange(n) for n in range(8)))
+    skill_agent = _StubAgent(
+        response_stream=[(["Listening."], [object()]), ([""], big), ([""], big)]
+    )
+    registry = _StubRegistry(
+        responder=lambda q: _StubHit(name="listen", passed=True)
+        if "listen" in q
+        else None
+    )
+
+    _run_chat_with_input(
+        "listen to me\nthought one\nthought two\n/exit\n",
+        agent=_StubAgent(),
+        skill_agent=skill_agent,
+        registry=registry,
+        history_token_budget=300,
+    )
+
+    assert skill_agent.runs[2]["message_history"] == big
+
+
+# ------------------------------------------------------------------ /stats
+
+
+def test_stats_reports_the_last_turns_ollama_timings() -> None:
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart
+    from pydantic_ai.usage import RequestUsage
+
+    def _turn(prompt: str, output_tokens: int) -> list[Any]:
+        return [
+            ModelRequest.user_text_prompt(prompt),
+            ModelResponse(
+                parts=[TextPart(content="ok")],
+                provider_name="ollama",
+                usage=RequestUsage(
+                    input_tokens=10,
+                    output_tokens=output_tokens,
+                    details={"eval_duration": 1_000_000_000},
+                ),
+            ),
+        ]
+
+    first = _turn("one", 5)
+    second = first + _turn("two", 40)
+    agent = _StubAgent(response_stream=[(["a"], first), (["b"], second)])
+
+    out, _, _ = _run_chat_with_input(
+        "/stats\none\ntwo\n/stats\n/exit\n", agent=agent
+    )
+
+    assert "[stats: no turns yet]" in out
+    # Only the second turn's response counts, not the history before it.
+    assert "[stats: 10 in / 40 out, 40.0 tok/s, load 0.00s]" in out
+    assert [run["user_prompt"] for run in agent.runs] == ["one", "two"]
+
+
+def test_stats_explains_hosted_models_have_no_timings() -> None:
+    out, _, _ = _run_chat_with_input("hi\n/stats\n/exit\n", agent=_StubAgent())
+    assert "[stats: timings are only reported for ollama: models]" in out
@@ -1,10 +1,13 @@
 """Tests for `tab_cli.config` loaders.
 
-Two loaders share file location and warning conventions:
-:func:`load_settings_from_config` (personality dials) and
-:func:`load_default_model_from_config` (the default model identifier).
-Both honor missing-file silence, malformed-file single-warning,
-per-value drops with a warning.
+The loaders share file location and warning conventions:
+:func:`load_settings_from_config` (personality dials),
+:func:`load_default_model_from_config` (the default model identifier),
+and :func:`load_grimoire_backend_from_config` (the skill vector store).
+All honor missing-file silence, malformed-file single-warning,
+per-value drops with a warning. The file is parsed once per process;
+``conftest.py`` clears that cache around every test, and a test that
+rewrites the file mid-way clears it again itself.
 """
 
 from __future__ import annotations
@@ -13,8 +16,13 @@ from pathlib import Path
 
 import pytest
 
+from tab_cli import config
 from tab_cli.config import (
+    load_chat_history_tokens_from_config,
+    load_chat_speculate_from_config,
     load_default_model_from_config,
+    load_grimoire_backend_from_config,
+    load_ollama_options_from_config,
     load_settings_from_config,
 )
 
@@ -293,3 +301,170 @@ def test_default_model_path_resolves_under_home_dot_tab(
     )
     monkeypatch.setattr(Path, "home", classmethod(lambda cls: fake_home))
     assert load_default_model_from_config() == "anthropic:claude-haiku"
+
+
+# ------------------------------------------------------------ grimoire.backend
+
+
+def test_grimoire_backend_missing_section_returns_none(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text('[model]\ndefault = "x:y"\n')
+    assert load_grimoire_backend_from_config() is None
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.parametrize("backend", ["pgvector", "memory"])
+def test_grimoire_backend_returns_configured_value(
+    fake_xdg: Path, backend: str
+) -> None:
+    (fake_xdg / "config.toml").write_text(f'[grimoire]\nbackend = "{backend}"\n')
+    assert load_grimoire_backend_from_config() == backend
+
+
+def test_grimoire_backend_unknown_value_warns_and_returns_none(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text('[grimoire]\nbackend = "faiss"\n')
+    assert load_grimoire_backend_from_config() is None
+    assert "grimoire.backend" in capsys.readouterr().err
+
+
+# ------------------------------------------------------- chat.history_tokens
+
+
+def test_chat_history_tokens_returns_configured_value(fake_xdg: Path) -> None:
+    (fake_xdg / "config.toml").write_text("[chat]\nhistory_tokens = 4000\n")
+    assert load_chat_history_tokens_from_config() == 4000
+
+
+def test_chat_history_tokens_missing_section_returns_none(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text('[model]\ndefault = "x:y"\n')
+    assert load_chat_history_tokens_from_config() is None
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "true", '"lots"', "1.5"])
+def test_chat_history_tokens_invalid_value_warns_and_returns_none(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str], value: str
+) -> None:
+    (fake_xdg / "config.toml").write_text(f"[chat]\nhistory_tokens = {value}\n")
+    assert load_chat_history_tokens_from_config() is None
+    assert "chat.history_tokens" in capsys.readouterr().err
+
+
+# ------------------------------------------------------------ chat.speculate
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_chat_speculate_returns_configured_value(
+    fake_xdg: Path, value: bool
+) -> None:
+    (fake_xdg / "config.toml").write_text(
+        f"[chat]\nspeculate = {str(value).lower()}\n"
+    )
+    assert load_chat_speculate_from_config() is value
+
+
+def test_chat_speculate_absent_returns_none(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text("[chat]\nhistory_tokens = 4000\n")
+    assert load_chat_speculate_from_config() is None
+    assert capsys.readouterr().err == ""
+
+
+def test_chat_speculate_non_bool_warns_and_returns_none(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text('[chat]\nspeculate = "yes"\n')
+    assert load_chat_speculate_from_config() is None
+    assert "chat.speculate" in capsys.readouterr().err
+
+
+# ----------------------------------------------------------------- [ollama]
+
+
+@pytest.mark.parametrize(
+    ("toml", "expected"),
+    [
+        ('keep_alive = "30m"\nnum_ctx = 8192', {"keep_alive": "30m", "num_ctx": 8192}),
+        ("keep_alive = -1", {"keep_alive": -1}),
+        ("keep_alive = 300.5", {"keep_alive": 300.5}),
+        ("num_ctx = 4096", {"num_ctx": 4096}),
+    ],
+)
+def test_ollama_options_returns_valid_keys(
+    fake_xdg: Path, toml: str, expected: dict[str, object]
+) -> None:
+    (fake_xdg / "config.toml").write_text(f"[ollama]\n{toml}\n")
+    assert load_ollama_options_from_config() == expected
+
+
+def test_ollama_options_missing_file_or_section_is_empty(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert load_ollama_options_from_config() == {}
+    (fake_xdg / "config.toml").write_text("[chat]\nhistory_tokens = 10\n")
+    assert load_ollama_options_from_config() == {}
+    assert capsys.readouterr().err == ""
+
+
+def test_ollama_options_drops_only_the_invalid_key(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text(
+        '[ollama]\nkeep_alive = true\nnum_ctx = 2048\n'
+    )
+    assert load_ollama_options_from_config() == {"num_ctx": 2048}
+    assert "ollama.keep_alive" in capsys.readouterr().err
+
+    (fake_xdg / "config.toml").write_text('[ollama]\nnum_ctx = "big"\n')
+    config._clear_cache()  # the file is read once per process
+    assert load_ollama_options_from_config() == {}
+    assert "ollama.num_ctx" in capsys.readouterr().err
+
+
+# ------------------------------------------------------------- read once
+
+
+def test_ollama_options_read_and_warn_once_per_process(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Every ``ollama:`` agent compile asks; only the first reads the file."""
+    path = fake_xdg / "config.toml"
+    path.write_text('[ollama]\nkeep_alive = "30m"\nnum_ctx = "big"\n')
+
+    first = load_ollama_options_from_config()
+    first["keep_alive"] = "mutated by a caller"
+    path.unlink()
+
+    assert load_ollama_options_from_config() == {"keep_alive": "30m"}
+    assert load_ollama_options_from_config() == {"keep_alive": "30m"}
+    assert capsys.readouterr().err.count("ollama.num_ctx") == 1
+
+
+def test_malformed_file_warns_once_across_loaders(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text("[chat\nspeculate = true\n")
+
+    assert load_settings_from_config() == {}
+    assert load_default_model_from_config() is None
+    assert load_grimoire_backend_from_config() is None
+    assert load_chat_history_tokens_from_config() is None
+    assert load_chat_speculate_from_config() is None
+    assert load_ollama_options_from_config() == {}
+    assert capsys.readouterr().err.count("tab: ignoring malformed") == 1
+
+
+def test_invalid_section_warns_once_across_loaders(
+    fake_xdg: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (fake_xdg / "config.toml").write_text('chat = "loud"\n')
+
+    assert load_chat_history_tokens_from_config() is None
+    assert load_chat_speculate_from_config() is None
+    assert capsys.readouterr().err.count("[chat]") == 1
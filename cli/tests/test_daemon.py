@@ -0,0 +1,418 @@
+"""Tests for :mod:`tab_cli.daemon` — ``tab serve`` and its thin client.
+
+Three layers, each pinned separately:
+
+- :meth:`TabDaemon.handle`: request validation, the compiled-agent LRU
+  keyed by (skill, settings, model), error replies instead of raises,
+  and routing through a lazily loaded registry. Driven directly with
+  stub compilers — no socket, no model.
+- The socket round-trip: a real daemon on a throwaway Unix socket,
+  spoken to by :func:`forward`. Covers "no daemon" (missing or stale
+  socket → ``None``), error replies (→ :class:`DaemonError`), protocol
+  mismatch (→ ``None``), and refusing to start over a live daemon.
+- CLI wiring: ``tab ask`` and a skill command print the daemon's
+  answer without compiling anything, and a daemon error collapses to
+  the ``tab: <reason>`` contract. The suite-wide ``_no_daemon`` fixture
+  is undone here with the real ``_forward_to_daemon``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from tab_cli import cli
+from tab_cli.cli import app
+from tab_cli.daemon import (
+    PROTOCOL_VERSION,
+    DaemonError,
+    DaemonRegistry,
+    TabDaemon,
+    forward,
+)
+
+# Captured before the autouse ``_no_daemon`` fixture swaps it out.
+_REAL_FORWARD_TO_DAEMON = cli._forward_to_daemon
+
+
+@dataclass
+class _StubResult:
+    output: str
+
+
+@dataclass
+class _StubAgent:
+    label: str
+    delay: float = 0.0
+    fail: bool = False
+
+    async def run(self, prompt: str) -> _StubResult:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return _StubResult(output=f"{self.label}: {prompt}")
+
+
+@dataclass
+class _Compiler:
+    """Records compile calls; returns a fresh stub agent each time."""
+
+    calls: list[dict[str, Any]] = field(default_factory=list)
+    delay: float = 0.0
+    fail: bool = False
+
+    def agent(self, **kwargs: Any) -> _StubAgent:
+        self.calls.append(kwargs)
+        return _StubAgent("tab", delay=self.delay, fail=self.fail)
+
+    def skill(self, skill_name: str, **kwargs: Any) -> _StubAgent:
+        self.calls.append({"skill": skill_name, **kwargs})
+        return _StubAgent(skill_name)
+
+
+@dataclass(frozen=True)
+class _Hit:
+    name: str
+    similarity: float
+    threshold: float
+    passed: bool
+
+
+class _StubRegistry:
+    def match_many(self, queries: list[str]) -> list[_Hit | None]:
+        return [
+            _Hit("draw-dino", 0.9, 0.55, True) if "dino" in query else None
+            for query in queries
+        ]
+
+
+def _daemon(compiler: _Compiler, **kwargs: Any) -> TabDaemon:
+    return TabDaemon(
+        compile_agent=compiler.agent, compile_skill=compiler.skill, **kwargs
+    )
+
+
+def _handle(daemon: TabDaemon, **request: Any) -> dict[str, Any]:
+    return asyncio.run(daemon.handle({"v": PROTOCOL_VERSION, **request}))
+
+
+# ------------------------------------------------------------------ handle
+
+
+def test_ask_compiles_once_per_settings_and_model() -> None:
+    compiler = _Compiler()
+    daemon = _daemon(compiler)
+
+    async def run() -> list[dict[str, Any]]:
+        base = {"v": PROTOCOL_VERSION, "op": "ask", "model": "m1"}
+        return [
+            await daemon.handle({**base, "prompt": "a", "settings": {"humor": 10}}),
+            await daemon.handle({**base, "prompt": "b", "settings": {"humor": 10}}),
+            await daemon.handle({**base, "prompt": "c", "settings": {"humor": 90}}),
+        ]
+
+    replies = asyncio.run(run())
+
+    assert replies[0] == {"ok": True, "output": "tab: a"}
+    assert [reply["output"] for reply in replies] == ["tab: a", "tab: b", "tab: c"]
+    assert [call["settings"].humor for call in compiler.calls] == [10, 90]
+    assert all(call["model"] == "m1" for call in compiler.calls)
+
+
+def test_skill_op_compiles_the_named_skill_with_its_tools() -> None:
+    compiler = _Compiler()
+    reply = _handle(_daemon(compiler), op="skill", skill="teach", prompt="CRDTs")
+
+    assert reply == {"ok": True, "output": "teach: CRDTs"}
+    (call,) = compiler.calls
+    assert call["skill"] == "teach"
+    names = {getattr(tool, "__name__", None) for tool in call["tools"]}
+    assert names == {"web_search", "web_search_many"}
+
+
+@pytest.mark.parametrize(
+    ("request_fields", "message"),
+    [
+        ({"op": "skill", "skill": "../etc", "prompt": "x"}, "invalid skill name"),
+        ({"op": "ask"}, "prompt"),
+        ({"op": "ask", "prompt": "x", "settings": {"humor": 500}}, "humor"),
+        ({"op": "dance"}, "unknown op"),
+        ({"op": "route", "queries": "not a list"}, "queries"),
+    ],
+)
+def test_bad_requests_get_error_replies(
+    request_fields: dict[str, Any], message: str
+) -> None:
+    reply = _handle(_daemon(_Compiler()), **request_fields)
+    assert reply["ok"] is False
+    assert message in reply["error"]
+
+
+def test_other_protocol_versions_are_unsupported() -> None:
+    reply = asyncio.run(_daemon(_Compiler()).handle({"v": 99, "op": "ping"}))
+    assert reply["ok"] is False and reply["unsupported"] is True
+
+
+def test_model_failures_and_timeouts_become_error_replies() -> None:
+    failing = _handle(_daemon(_Compiler(fail=True)), op="ask", prompt="x")
+    assert failing == {"ok": False, "error": "model exploded"}
+
+    slow = _daemon(_Compiler(delay=1.0), request_timeout=0.05)
+    assert _handle(slow, op="ask", prompt="x") == {
+        "ok": False,
+        "error": "tab serve timed out after 0.05s",
+    }
+
+
+def test_route_loads_the_registry_once_and_serialises_hits() -> None:
+    loads: list[int] = []
+
+    def load() -> _StubRegistry:
+        loads.append(1)
+        return _StubRegistry()
+
+    daemon = TabDaemon(load_registry=load)
+
+    async def run() -> list[dict[str, Any]]:
+        request = {"v": PROTOCOL_VERSION, "op": "route"}
+        return [
+            await daemon.handle({**request, "queries": ["a dino", "weather"]}),
+            await daemon.handle({**request, "queries": ["dino"]}),
+        ]
+
+    first, second = asyncio.run(run())
+
+    assert first == {
+        "ok": True,
+        "hits": [
+            {"name": "draw-dino", "similarity": 0.9, "threshold": 0.55, "passed": True},
+            None,
+        ],
+    }
+    assert second["hits"][0]["passed"] is True
+    assert loads == [1]
+
+
+# ------------------------------------------------------------------ socket
+
+
+@pytest.fixture
+def sock_path() -> Iterator[Path]:
+    # AF_UNIX paths are capped near 100 bytes; pytest's tmp_path can
+    # exceed that, so use a short directory under the system temp root.
+    with tempfile.TemporaryDirectory(prefix="tab-") as root:
+        yield Path(root) / "serve.sock"
+
+
+class _Running:
+    """A :class:`TabDaemon` serving on a background thread's loop."""
+
+    def __init__(self, daemon: TabDaemon, path: Path) -> None:
+        self._ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._task: asyncio.Future[None] | None = None
+        self._thread = threading.Thread(
+            target=self._run, args=(daemon, path), daemon=True
+        )
+
+    def _run(self, daemon: TabDaemon, path: Path) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._task = asyncio.ensure_future(daemon.serve(path, ready=self._ready.set))
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+
+    def __enter__(self) -> _Running:
+        self._thread.start()
+        assert self._ready.wait(timeout=5), "daemon did not start"
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        assert self._task is not None
+        self._loop.call_soon_threadsafe(self._task.cancel)
+        self._thread.join(timeout=5)
+
+
+def _umask() -> int:
+    current = os.umask(0)
+    os.umask(current)
+    return current
+
+
+def test_forward_round_trips_through_a_running_daemon(sock_path: Path) -> None:
+    compiler = _Compiler()
+    umask = _umask()
+    with _Running(_daemon(compiler), sock_path):
+        assert sock_path.stat().st_mode & 0o777 == 0o600
+        assert _umask() == umask  # only tightened around the bind
+        first = forward({"op": "ask", "prompt": "hi", "model": "m"}, path=sock_path)
+        second = forward({"op": "ask", "prompt": "again", "model": "m"}, path=sock_path)
+        assert isinstance(forward({"op": "ping"}, path=sock_path), int)
+
+    assert (first, second) == ("tab: hi", "tab: again")
+    assert len(compiler.calls) == 1  # the second turn reused the agent
+    assert not sock_path.exists()  # cleaned up on shutdown
+
+
+def test_forward_returns_none_without_a_daemon(sock_path: Path) -> None:
+    assert forward({"op": "ping"}, path=sock_path) is None
+
+    # A socket file nobody listens on — a daemon that died uncleanly.
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()
+    assert forward({"op": "ping"}, path=sock_path) is None
+
+
+def test_forward_raises_on_error_replies(sock_path: Path) -> None:
+    with _Running(_daemon(_Compiler(fail=True)), sock_path):
+        with pytest.raises(DaemonError, match="model exploded"):
+            forward({"op": "ask", "prompt": "x"}, path=sock_path)
+
+
+def _one_shot_server(path: Path, reply: bytes) -> threading.Thread:
+    """Accept one request and answer it with ``reply``, raw."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+
+    def _serve() -> None:
+        conn, _ = server.accept()
+        conn.makefile("rb").readline()
+        conn.sendall(reply)
+        conn.close()
+        server.close()
+
+    thread = threading.Thread(target=_serve, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_forward_raises_when_the_connection_drops_mid_request(
+    sock_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _reset(sock: socket.socket) -> bytes:
+        raise ConnectionResetError(104, "Connection reset by peer")
+
+    monkeypatch.setattr("tab_cli.daemon._read_line", _reset)
+    thread = _one_shot_server(sock_path, b"")
+    with pytest.raises(DaemonError, match="lost the connection"):
+        forward({"op": "ask", "prompt": "x"}, path=sock_path)
+    thread.join(timeout=5)
+
+
+def test_forward_raises_on_replies_that_are_not_objects(sock_path: Path) -> None:
+    thread = _one_shot_server(sock_path, b'["ok"]\n')
+    with pytest.raises(DaemonError, match="expected a JSON object"):
+        forward({"op": "ask", "prompt": "x"}, path=sock_path)
+    thread.join(timeout=5)
+
+
+def test_daemon_registry_routes_over_the_socket(sock_path: Path) -> None:
+    daemon = TabDaemon(load_registry=_StubRegistry)
+    with _Running(daemon, sock_path):
+        hits = DaemonRegistry(sock_path).match_many(["dino", "nope"])
+
+    assert hits[0] is not None and hits[0].name == "draw-dino" and hits[0].passed
+    assert hits[1] is None
+
+
+def test_serve_refuses_to_replace_a_live_daemon(sock_path: Path) -> None:
+    with _Running(_daemon(_Compiler()), sock_path):
+        with pytest.raises(RuntimeError, match="already running"):
+            asyncio.run(_daemon(_Compiler()).serve(sock_path))
+        # The live daemon's socket survived the failed start.
+        assert forward({"op": "ping"}, path=sock_path) is not None
+
+
+def test_serve_replaces_a_stale_socket(sock_path: Path) -> None:
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()
+
+    with _Running(_daemon(_Compiler()), sock_path):
+        assert forward({"op": "ask", "prompt": "x"}, path=sock_path) == "tab: x"
+
+
+def test_malformed_request_lines_get_an_error_reply(sock_path: Path) -> None:
+    with _Running(_daemon(_Compiler()), sock_path):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(sock_path))
+        client.sendall(b"{nope\n")
+        reply = json.loads(client.makefile().readline())
+        client.close()
+
+    assert reply["ok"] is False and reply["error"].startswith("invalid JSON")
+
+
+# --------------------------------------------------------------------- CLI
+
+
+@pytest.fixture
+def daemon_replies(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Restore the real fast path and fake the socket behind it."""
+    sent: list[dict[str, Any]] = []
+
+    def _forward(request: dict[str, Any]) -> Any:
+        sent.append(request)
+        if request.get("prompt") == "boom":
+            raise DaemonError("model exploded")
+        return f"served: {request.get('prompt')}"
+
+    monkeypatch.setattr("tab_cli.cli._forward_to_daemon", _REAL_FORWARD_TO_DAEMON)
+    monkeypatch.setattr("tab_cli.daemon.forward", _forward)
+    return sent
+
+
+def _explode(*args: Any, **kwargs: Any) -> Any:
+    raise AssertionError("in-process path must not run when the daemon answers")
+
+
+def test_ask_prints_the_daemons_answer_without_compiling(
+    daemon_replies: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("tab_cli.personality.compile_tab_agent", _explode)
+
+    result = CliRunner().invoke(app, ["ask", "hello", "--humor", "20"])
+
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout == "served: hello\n"
+    (request,) = daemon_replies
+    assert request["op"] == "ask"
+    assert request["model"] == "anthropic:test-stub"
+    assert request["settings"]["humor"] == 20
+
+
+def test_skill_commands_forward_with_the_skill_name(
+    daemon_replies: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("tab_cli.skills.run_skill", _explode)
+
+    result = CliRunner().invoke(app, ["draw-dino", "a", "stegosaurus"])
+
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout == "served: a stegosaurus\n"
+    assert daemon_replies[0]["op"] == "skill"
+    assert daemon_replies[0]["skill"] == "draw-dino"
+
+
+def test_daemon_errors_use_the_tab_error_contract(
+    daemon_replies: list[dict[str, Any]],
+) -> None:
+    result = CliRunner().invoke(app, ["ask", "boom"])
+    assert result.exit_code == 1
+    assert result.stderr.strip() == "tab: model exploded"
@@ -0,0 +1,202 @@
+"""Tests for :mod:`tab_cli.embeddings` — the registry's embedding cache.
+
+The contract pinned here is the one the cold-start fix rests on: an
+unchanged skill description is served from ``~/.tab/embeddings/``
+without touching the embedder, while an edited description or a
+different embedder model is a miss by construction. The cache is
+advisory, so corrupt entries read as misses instead of raising.
+
+No Ollama anywhere — the inner embedder is a recording fake, and the
+:class:`OllamaEmbedder` test drives a stub client through the same
+``embed(model=, input=, keep_alive=)`` call ``ollama-python`` exposes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from tab_cli.embeddings import (
+    CachedEmbedder,
+    EmbeddingCache,
+    OllamaEmbedder,
+    embedding_cache_dir,
+)
+
+
+# --------------------------------------------------------------- fakes
+
+
+@dataclass
+class _RecordingEmbedder:
+    """Deterministic embedder that records every batch it was asked for."""
+
+    identity: str = "fake:embedder"
+    batches: list[list[str]] = field(default_factory=list)
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+
+@dataclass
+class _StubEmbedResponse:
+    embeddings: list[list[float]]
+
+
+@dataclass
+class _StubOllamaClient:
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    def embed(
+        self, *, model: str, input: list[str] | str, keep_alive: Any = None
+    ) -> _StubEmbedResponse:
+        self.calls.append({"model": model, "input": input, "keep_alive": keep_alive})
+        texts = [input] if isinstance(input, str) and input else list(input)
+        return _StubEmbedResponse(embeddings=[[0.1, 0.2] for _ in texts])
+
+
+# ------------------------------------------------------ EmbeddingCache
+
+
+def test_cache_dir_lives_under_dot_tab() -> None:
+    assert embedding_cache_dir() == Path.home() / ".tab" / "embeddings"
+
+
+def test_cache_round_trips_a_vector(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    cache.put("ollama:nomic-embed-text", "draw a dino", [0.25, -0.5, 1.0])
+    assert cache.get("ollama:nomic-embed-text", "draw a dino") == [0.25, -0.5, 1.0]
+
+
+def test_cache_key_separates_identity_and_text(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    cache.put("ollama:a", "text", [1.0])
+    assert cache.get("ollama:b", "text") is None
+    assert cache.get("ollama:a", "text!") is None
+
+
+def test_cache_treats_corrupt_entry_as_miss(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    (tmp_path / f"{EmbeddingCache.key('x', 'y')}.json").write_text("{nope")
+    assert cache.get("x", "y") is None
+
+
+def test_cache_rejects_entry_with_mismatched_embedder(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    cache.put("x", "y", [1.0])
+    path = tmp_path / f"{EmbeddingCache.key('x', 'y')}.json"
+    path.write_text(path.read_text().replace('"x"', '"other"'))
+    assert cache.get("x", "y") is None
+
+
+def test_cache_put_swallows_write_failures(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    EmbeddingCache(blocker).put("x", "y", [1.0])  # must not raise
+
+
+# ------------------------------------------------------ CachedEmbedder
+
+
+def test_cached_embedder_serves_descriptions_from_disk_on_second_run(
+    tmp_path: Path,
+) -> None:
+    """Acceptance signal: unchanged descriptions are never re-embedded."""
+    descriptions = ["draw ascii dinosaurs", "teach a topic"]
+
+    first = _RecordingEmbedder()
+    CachedEmbedder(first, EmbeddingCache(tmp_path), cacheable=descriptions).embed_many(
+        descriptions
+    )
+    assert first.batches == [descriptions]
+
+    second = _RecordingEmbedder()
+    vectors = CachedEmbedder(
+        second, EmbeddingCache(tmp_path), cacheable=descriptions
+    ).embed_many(descriptions)
+    assert second.batches == []
+    assert vectors == [[20.0, 1.0, 0.5], [13.0, 1.0, 0.5]]
+
+
+def test_cached_embedder_only_embeds_changed_descriptions(tmp_path: Path) -> None:
+    CachedEmbedder(
+        _RecordingEmbedder(), EmbeddingCache(tmp_path), cacheable=["a", "b"]
+    ).embed_many(["a", "b"])
+
+    inner = _RecordingEmbedder()
+    CachedEmbedder(inner, EmbeddingCache(tmp_path), cacheable=["a", "b2"]).embed_many(
+        ["a", "b2"]
+    )
+    assert inner.batches == [["b2"]]
+
+
+def test_cached_embedder_never_persists_queries(tmp_path: Path) -> None:
+    inner = _RecordingEmbedder()
+    embedder = CachedEmbedder(inner, EmbeddingCache(tmp_path), cacheable=["desc"])
+
+    embedder.embed("what's the weather")
+    embedder.embed("what's the weather")
+
+    assert inner.batches == [["what's the weather"], ["what's the weather"]]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cached_embedder_reports_inner_identity(tmp_path: Path) -> None:
+    embedder = CachedEmbedder(
+        _RecordingEmbedder(identity="ollama:nomic-embed-text"),
+        EmbeddingCache(tmp_path),
+    )
+    assert embedder.identity == "ollama:nomic-embed-text"
+
+
+# ------------------------------------------------------ OllamaEmbedder
+
+
+def test_ollama_embedder_batches_into_one_embed_call() -> None:
+    client = _StubOllamaClient()
+    embedder = OllamaEmbedder("nomic-embed-text", client=client)
+
+    vectors = embedder.embed_many(["one", "two", "three"])
+
+    assert len(vectors) == 3
+    assert client.calls == [
+        {
+            "model": "nomic-embed-text",
+            "input": ["one", "two", "three"],
+            "keep_alive": None,
+        }
+    ]
+    assert embedder.identity == "ollama:nomic-embed-text"
+
+
+def test_ollama_embedder_empty_batch_skips_the_network() -> None:
+    client = _StubOllamaClient()
+    assert OllamaEmbedder(client=client).embed_many([]) == []
+    assert client.calls == []
+
+
+def test_ollama_embedder_sends_keep_alive_and_warms_up_with_empty_input() -> None:
+    client = _StubOllamaClient()
+    embedder = OllamaEmbedder(keep_alive="30m", client=client)
+
+    embedder.warm_up()
+    embedder.embed("hello")
+
+    assert client.calls == [
+        {"model": "nomic-embed-text", "input": "", "keep_alive": "30m"},
+        {"model": "nomic-embed-text", "input": ["hello"], "keep_alive": "30m"},
+    ]
+
+
+def test_cached_embedder_warm_up_delegates_when_the_inner_can(tmp_path: Path) -> None:
+    client = _StubOllamaClient()
+    CachedEmbedder(OllamaEmbedder(client=client), EmbeddingCache(tmp_path)).warm_up()
+    assert [call["input"] for call in client.calls] == [""]
+
+    # A fake without ``warm_up`` is simply not preloaded.
+    CachedEmbedder(_RecordingEmbedder(), EmbeddingCache(tmp_path)).warm_up()
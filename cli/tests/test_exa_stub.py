@@ -0,0 +1,110 @@
+"""Tests for ``benchmarks/exa_stub.py`` and the ``EXA_SEARCH_URL`` override.
+
+These are the only web-search tests that go over a real socket: the
+stub binds an ephemeral loopback port and the tool talks to it through
+the same pooled ``httpx.Client`` production uses. That pins the wire
+contract — the stub's payloads parse into ``title``/``url``/``snippet``
+rows, and the injected latency and failures surface the way Exa's
+would — which is what makes the stub trustworthy for benchmarks.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from exa_stub import ExaStubServer
+
+from tab_cli.web_search import (
+    build_web_search_many_tool,
+    build_web_search_tool,
+    default_web_search,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from tab_cli.web_search import _web_search_for_key
+
+    monkeypatch.setattr("tab_cli.web_search._shared_client", None)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    _web_search_for_key.cache_clear()
+
+
+def test_stub_results_parse_through_every_passage_field() -> None:
+    with ExaStubServer(text_chars=40) as stub:
+        out = build_web_search_tool(api_key="k", search_url=stub.url, num_results=3)(
+            "event sourcing"
+        )
+
+    assert [row["url"] for row in out] == [
+        f"https://stub.example/event-sourcing/{n}" for n in (1, 2, 3)
+    ]
+    # text, snippet, highlights in rotation — all three yield a snippet.
+    assert all(row["snippet"].startswith("event sourcing") for row in out)
+    assert " ... " in out[2]["snippet"]
+    assert stub.requests[0]["numResults"] == 3
+
+
+def test_stub_injected_failure_becomes_an_error_entry() -> None:
+    with ExaStubServer(error_rate=1.0) as stub:
+        out = build_web_search_tool(api_key="k", search_url=stub.url)("q")
+    assert out[0]["title"] == "[web_search error]"
+    assert "500" in out[0]["snippet"]
+
+
+def test_stub_latency_trips_the_tool_timeout() -> None:
+    with ExaStubServer(latency_seconds=0.5) as stub:
+        out = build_web_search_tool(
+            api_key="k", search_url=stub.url, timeout_seconds=0.1
+        )("q")
+    assert out[0]["title"] == "[web_search error]"
+    assert "Timeout" in out[0]["snippet"]
+
+
+def test_stub_requires_an_api_key_header() -> None:
+    with ExaStubServer() as stub:
+        response = httpx.post(stub.url, json={"query": "q"})
+    assert response.status_code == 401
+
+
+def test_stub_error_draws_are_reproducible_per_seed() -> None:
+    def failures(seed: int) -> list[bool]:
+        with ExaStubServer(error_rate=0.5, seed=seed) as stub:
+            tool = build_web_search_tool(api_key="k", search_url=stub.url)
+            return [tool(f"q{n}")[0]["title"] == "[web_search error]" for n in range(8)]
+
+    assert failures(7) == failures(7)
+    assert 0 < sum(failures(7)) < 8
+
+
+def test_stub_rejects_out_of_range_error_rate() -> None:
+    with pytest.raises(ValueError, match="error_rate"):
+        ExaStubServer(error_rate=1.5)
+
+
+def test_web_search_many_against_the_stub_runs_in_parallel() -> None:
+    with ExaStubServer(latency_seconds=0.2) as stub:
+        tool = build_web_search_many_tool(api_key="k", search_url=stub.url)
+        out = tool(["a", "b", "c"])
+
+    assert {row["query"] for row in out} == {"a", "b", "c"}
+    assert len(stub.requests) == 3
+
+
+def test_exa_search_url_env_override_reaches_the_default_tool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with ExaStubServer() as stub:
+        monkeypatch.setenv("EXA_API_KEY", "stub")
+        monkeypatch.setenv("EXA_SEARCH_URL", stub.url)
+        out = default_web_search()("q")
+        default_web_search()("q")
+
+    assert out[0]["url"].startswith("https://stub.example/")
+    # Overridden endpoints are never cached: both calls reached the stub
+    # and nothing landed in ~/.tab/search-cache/.
+    assert len(stub.requests) == 2
+    assert not (Path.home() / ".tab" / "search-cache").exists()
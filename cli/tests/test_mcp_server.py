@@ -48,21 +48,33 @@ class _StubResult:
 class _StubAgent:
     """Stand-in for ``pydantic_ai.Agent`` for the MCP server's needs.
 
-    Records each ``run_sync`` call so tests can assert that the prompt
+    Records each ``run`` call so tests can assert that the prompt
     arrived intact and the per-call ``model`` override (if any) made it
-    into the compile call. ``response`` is what ``run_sync`` returns;
+    into the compile call. ``response`` is what ``run`` returns;
     ``raise_on_run`` lets a test exercise the error-surface path.
+    ``delay`` holds each run open so concurrency tests can observe
+    overlap; ``in_flight`` / ``peak`` track it.
     """
 
     response: str = "hello from tab"
     raise_on_run: BaseException | None = None
+    delay: float = 0.0
     runs: list[tuple[tuple[Any, ...], dict[str, Any]]] = field(default_factory=list)
+    in_flight: int = 0
+    peak: int = 0
 
-    def run_sync(self, *args: Any, **kwargs: Any) -> _StubResult:
+    async def run(self, *args: Any, **kwargs: Any) -> _StubResult:
         self.runs.append((args, kwargs))
-        if self.raise_on_run is not None:
-            raise self.raise_on_run
-        return _StubResult(output=self.response)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.raise_on_run is not None:
+                raise self.raise_on_run
+            return _StubResult(output=self.response)
+        finally:
+            self.in_flight -= 1
 
 
 @dataclass
@@ -231,7 +243,7 @@ def test_search_memory_returns_v0_stub() -> None:
 
 
 def test_ask_tab_propagates_agent_errors() -> None:
-    """A failure inside ``run_sync`` becomes a tool-call error.
+    """A failure inside ``agent.run`` becomes a tool-call error.
 
     FastMCP marshals exceptions raised inside a tool into the
     ``CallToolResult.is_error`` flag — the client doesn't see a Python
@@ -261,6 +273,118 @@ def test_ask_tab_propagates_agent_errors() -> None:
         assert "API key missing" in str(result) or "tab" in str(result).lower()
 
 
+def _ask_many(server: Any, models: list[str | None]) -> None:
+    """Call ``ask_tab`` once per entry, sequentially, with that model."""
+
+    async def _calls() -> None:
+        from fastmcp import Client
+
+        async with Client(server) as client:
+            for model in models:
+                args: dict[str, Any] = {"prompt": "x"}
+                if model is not None:
+                    args["model"] = model
+                await client.call_tool("ask_tab", args)
+
+    _run(_calls())
+
+
+def test_ask_tab_reuses_the_compiled_agent_per_model() -> None:
+    """Settings are fixed per server, so a repeat call with the same
+    effective model must not recompile."""
+    agent = _StubAgent()
+    recorder = _CompileRecorder(agent=agent)
+    server = build_server(model="ollama:gemma3", compile_agent=recorder)
+
+    _ask_many(server, [None, None, "ollama:gemma3", "anthropic:claude", None])
+
+    assert [call["model"] for call in recorder.calls] == [
+        "ollama:gemma3",
+        "anthropic:claude",
+    ]
+    assert len(agent.runs) == 5
+
+
+def test_agent_cache_evicts_least_recently_used_model() -> None:
+    recorder = _CompileRecorder(agent=_StubAgent())
+    server = build_server(compile_agent=recorder, agent_cache_size=2)
+
+    _ask_many(server, ["a:1", "b:2", "a:1", "c:3", "a:1", "b:2"])
+
+    # "b:2" was least recently used when "c:3" arrived, so it recompiles.
+    assert [call["model"] for call in recorder.calls] == ["a:1", "b:2", "c:3", "b:2"]
+
+
+def _fan_out(server: Any, count: int) -> list[Any]:
+    """Issue ``count`` concurrent ``ask_tab`` calls over one client."""
+
+    async def _calls() -> list[Any]:
+        from fastmcp import Client
+
+        async with Client(server) as client:
+            return await asyncio.gather(
+                *(
+                    client.call_tool("ask_tab", {"prompt": f"p{n}"})
+                    for n in range(count)
+                )
+            )
+
+    return _run(_calls())
+
+
+def test_ask_tab_calls_run_concurrently() -> None:
+    """One slow model call must not hold up the others."""
+    agent = _StubAgent(delay=0.05)
+    server = build_server(
+        compile_agent=_CompileRecorder(agent=agent), max_concurrency=4
+    )
+
+    results = _fan_out(server, 4)
+
+    assert [r.data for r in results] == ["hello from tab"] * 4
+    assert agent.peak == 4
+
+
+def test_ask_tab_concurrency_is_capped_by_the_semaphore() -> None:
+    agent = _StubAgent(delay=0.02)
+    server = build_server(
+        compile_agent=_CompileRecorder(agent=agent), max_concurrency=2
+    )
+
+    _fan_out(server, 5)
+
+    assert len(agent.runs) == 5
+    assert agent.peak == 2
+
+
+def test_ask_tab_times_out_slow_calls() -> None:
+    agent = _StubAgent(delay=5.0)
+    server = build_server(
+        compile_agent=_CompileRecorder(agent=agent), request_timeout=0.05
+    )
+
+    async def _call() -> Any:
+        from fastmcp import Client
+        from fastmcp.exceptions import ToolError
+
+        async with Client(server) as client:
+            try:
+                return await client.call_tool("ask_tab", {"prompt": "hello"})
+            except ToolError as exc:
+                return exc
+
+    result = _run(_call())
+    assert "timed out after 0.05s" in str(result)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_concurrency": 0}, {"request_timeout": 0.0}]
+)
+def test_build_server_rejects_invalid_limits(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        build_server(compile_agent=_CompileRecorder(agent=_StubAgent()), **kwargs)
+
+
 # -------------------------------------------------------- typer-level tests
 
 
@@ -334,6 +458,8 @@ def test_mcp_invokes_run_server_with_resolved_settings(
     )
     assert result.exit_code == 0, result.stderr
     assert captured.get("model") == "anthropic:claude-sonnet-4"
+    assert captured.get("max_concurrency") == 4
+    assert captured.get("request_timeout") == 300.0
     settings = captured.get("settings")
     assert settings is not None
     assert settings.humor == 10
@@ -341,6 +467,24 @@ def test_mcp_invokes_run_server_with_resolved_settings(
     assert settings.directness == 80
 
 
+def test_mcp_concurrency_flags_reach_run_server(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr(
+        "tab_cli.mcp_server.run_server",
+        lambda **kwargs: captured.update(kwargs),
+        raising=True,
+    )
+
+    result = runner.invoke(app, ["mcp", "--max-concurrency", "8", "--timeout", "0"])
+
+    assert result.exit_code == 0, result.stderr
+    assert captured["max_concurrency"] == 8
+    # ``--timeout 0`` disables the per-call limit.
+    assert captured["request_timeout"] is None
+
+
 def test_mcp_collapses_runtime_errors_to_readable_stderr(
     runner: CliRunner, monkeypatch: pytest.MonkeyPatch
 ) -> None:
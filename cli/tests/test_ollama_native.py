@@ -17,9 +17,13 @@ agent-loop bug somewhere downstream.
 from __future__ import annotations
 
 import asyncio
+import threading
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
 
+import pytest
+
 from ollama import ChatResponse, Message
 from pydantic_ai.messages import (
     ModelRequest,
@@ -33,7 +37,12 @@ from pydantic_ai.messages import (
 from pydantic_ai.models import ModelRequestParameters
 from pydantic_ai.tools import ToolDefinition
 
-from tab_cli.models import OllamaNativeModel
+from tab_cli.models import (
+    OllamaNativeModel,
+    OllamaTurnMetrics,
+    close_shared_models,
+    shared_ollama_model,
+)
 
 
 def _run(coro: Any) -> Any:
@@ -198,7 +207,87 @@ def test_translate_model_response_tool_call_only_emits_empty_content():
     assert "tool_calls" in result[0]
 
 
-# --- _translate_tools: pydantic-ai ToolDefinition → Ollama tool spec ---
+# --- _TranslationMemo: incremental history translation ---
+
+
+def _counting_memo() -> tuple[Any, list[Any]]:
+    from tab_cli.models.ollama_native import _TranslationMemo
+
+    seen: list[Any] = []
+
+    def _translate(msg: Any) -> list[dict[str, Any]]:
+        seen.append(msg)
+        return OllamaNativeModel._translate_message(msg)
+
+    return _TranslationMemo(_translate), seen
+
+
+def _turn(n: int) -> list[Any]:
+    return [
+        ModelRequest(parts=[UserPromptPart(content=f"q{n}")]),
+        ModelResponse(parts=[TextPart(content=f"a{n}")]),
+    ]
+
+
+def test_memo_translates_only_the_new_tail():
+    memo, seen = _counting_memo()
+    history = [ModelRequest(parts=[SystemPromptPart(content="be tab")])]
+    for n in range(3):
+        history += _turn(n)
+
+    memo.translate(history)
+    assert len(seen) == 7
+
+    seen.clear()
+    tail = ModelRequest(parts=[UserPromptPart(content="next")])
+    result = memo.translate([*history, tail])
+    assert seen == [tail]
+    assert result == OllamaNativeModel._translate_messages([*history, tail])
+
+
+def test_memo_serves_interleaved_histories_per_message():
+    """Two conversations on one shared model break the prefix layer on
+    every switch; the per-message layer still skips re-translation."""
+    memo, seen = _counting_memo()
+    first, second = _turn(0), _turn(1)
+    memo.translate(first)
+    memo.translate(second)
+
+    seen.clear()
+    memo.translate(first)
+    memo.translate(second)
+    assert seen == []
+
+
+def test_memo_retranslates_a_message_whose_parts_changed():
+    memo, seen = _counting_memo()
+    msg = ModelRequest(parts=[SystemPromptPart(content="old prompt")])
+    memo.translate([msg])
+
+    # pydantic-ai swaps dynamic system-prompt parts in place.
+    msg.parts[0] = SystemPromptPart(content="new prompt")
+    seen.clear()
+    assert memo.translate([msg]) == [{"role": "system", "content": "new prompt"}]
+    assert seen == [msg]
+
+
+def test_memo_forgets_collected_messages():
+    import gc
+
+    memo, seen = _counting_memo()
+    history = _turn(0)
+    memo.translate(history)
+    assert len(memo) == 2
+
+    # The prefix layer holds the latest history; moving on releases it.
+    memo.translate([])
+    del history
+    seen.clear()
+    gc.collect()
+    assert len(memo) == 0
+
+
+
 
 
 def test_translate_tools_none_returns_none():
@@ -429,6 +518,239 @@ def test_request_passes_tools_through_when_present():
     ]
 
 
+# --- usage and timings ---
+
+
+def _final_chunk(**fields: Any) -> ChatResponse:
+    return ChatResponse(
+        model="gemma3:latest",
+        message=Message(role="assistant", content="done"),
+        done=True,
+        **fields,
+    )
+
+
+_TIMINGS = {
+    "prompt_eval_count": 40,
+    "eval_count": 20,
+    "load_duration": 1_500_000_000,
+    "prompt_eval_duration": 200_000_000,
+    "eval_duration": 500_000_000,
+    "total_duration": 2_300_000_000,
+}
+
+
+def test_translate_response_maps_counts_and_timings_into_usage():
+    result = OllamaNativeModel("gemma3:latest")._translate_response(
+        _final_chunk(**_TIMINGS)
+    )
+    assert result.usage.input_tokens == 40
+    assert result.usage.output_tokens == 20
+    assert result.usage.details == {
+        "load_duration": 1_500_000_000,
+        "prompt_eval_duration": 200_000_000,
+        "eval_duration": 500_000_000,
+        "total_duration": 2_300_000_000,
+    }
+
+
+def test_request_stream_takes_usage_from_the_closing_chunk():
+    model = OllamaNativeModel("gemma3:latest")
+    model._client = AsyncMock()
+    model._client.chat.return_value = _async_iter(
+        [
+            ChatResponse(
+                model="gemma3:latest",
+                message=Message(role="assistant", content="hi "),
+            ),
+            _final_chunk(**_TIMINGS),
+        ]
+    )
+
+    async def _usage() -> Any:
+        async with model.request_stream(
+            messages=[ModelRequest(parts=[UserPromptPart(content="hi")])],
+            model_settings=None,
+            model_request_parameters=_text_params(),
+        ) as streamed:
+            async for _event in streamed:
+                pass
+            return streamed.get().usage
+
+    usage = _run(_usage())
+    assert (usage.input_tokens, usage.output_tokens) == (40, 20)
+    assert usage.details["eval_duration"] == 500_000_000
+
+
+def test_turn_metrics_fold_every_ollama_response_in_the_turn():
+    model = OllamaNativeModel("gemma3:latest")
+    # A tool-calling turn: two requests, only the first cold.
+    first = model._translate_response(_final_chunk(**_TIMINGS))
+    second = model._translate_response(
+        _final_chunk(
+            prompt_eval_count=60,
+            eval_count=30,
+            prompt_eval_duration=100_000_000,
+            eval_duration=1_000_000_000,
+        )
+    )
+    request = ModelRequest(parts=[UserPromptPart(content="hi")])
+
+    metrics = OllamaTurnMetrics.from_messages([request, first, request, second])
+
+    assert metrics is not None
+    assert metrics.requests == 2
+    assert (metrics.input_tokens, metrics.output_tokens) == (100, 50)
+    assert metrics.load_time == pytest.approx(1.5)
+    assert metrics.time_to_first_token == pytest.approx(1.7)
+    assert metrics.tokens_per_second == pytest.approx(50 / 1.5)
+    assert metrics.prompt_tokens_per_second == pytest.approx(100 / 0.3)
+    assert metrics.summary() == (
+        "100 in / 50 out, 33.3 tok/s, prompt 333.3 tok/s, "
+        "first token 1.70s, load 1.50s, 2 requests"
+    )
+
+
+def test_turn_metrics_need_ollama_responses_and_tolerate_missing_timings():
+    hosted = ModelResponse(parts=[TextPart(content="hi")], provider_name="anthropic")
+    assert OllamaTurnMetrics.from_messages([hosted, object()]) is None
+
+    bare = OllamaNativeModel("gemma3:latest")._translate_response(_final_chunk())
+    metrics = OllamaTurnMetrics.from_messages([bare])
+    assert metrics is not None
+    assert metrics.tokens_per_second is None
+    assert metrics.time_to_first_token is None
+    assert metrics.summary() == "0 in / 0 out, load 0.00s"
+
+
+# --- model settings → Ollama options / keep_alive ---
+
+
+def _text_params() -> ModelRequestParameters:
+    return ModelRequestParameters(
+        function_tools=[],
+        output_mode="text",
+        output_object=None,
+        output_tools=[],
+        allow_text_output=True,
+    )
+
+
+def _chat_kwargs(model: OllamaNativeModel, model_settings: Any) -> dict[str, Any]:
+    """Run one non-streamed request and return what ``chat`` was called with."""
+    model._client = AsyncMock()
+    model._client.chat.return_value = ChatResponse(
+        model="gemma3:latest",
+        message=Message(role="assistant", content="ok"),
+    )
+    _run(
+        model.request(
+            messages=[ModelRequest(parts=[UserPromptPart(content="hi")])],
+            model_settings=model_settings,
+            model_request_parameters=_text_params(),
+        )
+    )
+    return model._client.chat.await_args.kwargs
+
+
+def test_request_without_settings_sends_no_options():
+    kwargs = _chat_kwargs(OllamaNativeModel("gemma3:latest"), None)
+    assert kwargs["options"] is None
+    assert kwargs["keep_alive"] is None
+
+
+def test_request_maps_model_settings_onto_ollama_options():
+    kwargs = _chat_kwargs(
+        OllamaNativeModel("gemma3:latest"),
+        {
+            "max_tokens": 256,
+            "temperature": 0.2,
+            "top_p": 0.9,
+            "seed": 7,
+            "stop_sequences": ["\n\n"],
+            "timeout": 30.0,  # no Ollama equivalent; dropped
+        },
+    )
+    assert kwargs["options"] == {
+        "num_predict": 256,
+        "temperature": 0.2,
+        "top_p": 0.9,
+        "seed": 7,
+        "stop": ["\n\n"],
+    }
+
+
+def test_model_level_num_ctx_keep_alive_and_settings_merge():
+    model = OllamaNativeModel(
+        "gemma3:latest",
+        keep_alive="30m",
+        num_ctx=8192,
+        settings={"temperature": 0.5},
+    )
+    kwargs = _chat_kwargs(model, {"max_tokens": 64})
+    # Model settings merge under the per-run ones (pydantic-ai's
+    # ``prepare_request``); num_ctx rides along on every call.
+    assert kwargs["options"] == {"num_ctx": 8192, "temperature": 0.5, "num_predict": 64}
+    assert kwargs["keep_alive"] == "30m"
+
+
+def test_extra_body_passes_ollama_only_options_and_keep_alive():
+    model = OllamaNativeModel("gemma3:latest", keep_alive="30m", num_ctx=8192)
+    kwargs = _chat_kwargs(
+        model, {"extra_body": {"top_k": 20, "num_ctx": 2048, "keep_alive": -1}}
+    )
+    assert kwargs["options"] == {"num_ctx": 2048, "top_k": 20}
+    assert kwargs["keep_alive"] == -1
+
+
+def test_request_stream_sends_options_and_keep_alive():
+    model = OllamaNativeModel("gemma3:latest", keep_alive=600)
+    model._client = AsyncMock()
+    model._client.chat.return_value = _async_iter(
+        [
+            ChatResponse(
+                model="gemma3:latest",
+                message=Message(role="assistant", content="ok"),
+                done=True,
+            )
+        ]
+    )
+
+    async def _drain() -> None:
+        async with model.request_stream(
+            messages=[ModelRequest(parts=[UserPromptPart(content="hi")])],
+            model_settings={"max_tokens": 32},
+            model_request_parameters=_text_params(),
+        ) as streamed:
+            async for _event in streamed:
+                pass
+
+    _run(_drain())
+
+    kwargs = model._client.chat.await_args.kwargs
+    assert kwargs["options"] == {"num_predict": 32}
+    assert kwargs["keep_alive"] == 600
+
+
+def test_resolve_model_applies_ollama_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from tab_cli.personality import resolve_model
+
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+    (tmp_path / ".tab").mkdir()
+    (tmp_path / ".tab" / "config.toml").write_text(
+        '[ollama]\nkeep_alive = "1h"\nnum_ctx = 16384\n'
+    )
+    try:
+        model = resolve_model("ollama:gemma3:latest")
+        assert model._request_options(None) == ({"num_ctx": 16384}, "1h")
+        # Same options → the same shared model.
+        assert resolve_model("ollama:gemma3:latest") is model
+    finally:
+        close_shared_models()
+
+
 # --- compile_tab_agent dispatcher ---
 
 
@@ -472,6 +794,143 @@ def test_compile_tab_agent_none_model_passes_through():
     assert not isinstance(agent.model, OllamaNativeModel)
 
 
+# --- shared_ollama_model: one model + client per (name, host) ---
+
+
+def test_shared_ollama_model_reuses_instance_per_name_and_host():
+    try:
+        first = shared_ollama_model("gemma3:latest")
+        assert shared_ollama_model("gemma3:latest") is first
+        other_host = shared_ollama_model("gemma3:latest", host="http://gpu:11434")
+        assert other_host is not first
+        assert shared_ollama_model("llama3:latest") is not first
+        assert shared_ollama_model("gemma3:latest", num_ctx=4096) is not first
+    finally:
+        close_shared_models()
+
+
+def test_close_shared_models_forgets_every_model():
+    first = shared_ollama_model("gemma3:latest")
+    close_shared_models()
+    assert shared_ollama_model("gemma3:latest") is not first
+    close_shared_models()
+
+
+def test_recompiled_agents_share_one_ollama_model():
+    """A settings nudge in the REPL recompiles the agent; the recompiled
+    agent must reuse the model (and its connection pool), not open a
+    new client."""
+    from tab_cli.personality import TabSettings, compile_tab_agent
+
+    try:
+        first = compile_tab_agent(model="ollama:gemma3:latest")
+        second = compile_tab_agent(
+            settings=TabSettings(humor=10), model="ollama:gemma3:latest"
+        )
+        assert second.model is first.model
+    finally:
+        close_shared_models()
+
+
+def test_client_is_reused_within_a_loop_and_rebuilt_across_loops():
+    """httpx connections belong to the loop that opened them; a model
+    reused from another loop must not hand it the old pool."""
+    model = OllamaNativeModel("gemma3:latest")
+
+    async def _two_lookups() -> tuple[Any, Any]:
+        return model._bound_client(), model._bound_client()
+
+    first_a, first_b = _run(_two_lookups())
+    second_a, _ = _run(_two_lookups())
+
+    assert first_a is first_b
+    assert second_a is not first_a
+
+
+def test_rebinding_closes_the_previous_clients_pool():
+    model = OllamaNativeModel("gemma3:latest")
+
+    async def _bind() -> Any:
+        client = model._bound_client()
+        await asyncio.sleep(0)  # let a retiring client's close run
+        return client
+
+    first = _run(_bind())
+    second = _run(_bind())
+
+    assert first._client.is_closed
+    assert not second._client.is_closed
+
+
+def test_concurrent_loops_keep_their_own_clients():
+    """A shared model in use on two live loops at once — the REPL's turn
+    loop alongside a worker thread's — must not close or swap the other
+    loop's pool."""
+    model = OllamaNativeModel("gemma3:latest")
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+
+        async def _bind() -> Any:
+            client = model._bound_client()
+            await asyncio.sleep(0)  # give any retiring close a chance to run
+            return client
+
+        def _on_worker() -> Any:
+            return asyncio.run_coroutine_threadsafe(_bind(), loop).result(timeout=5)
+
+        async def _interleaved() -> list[Any]:
+            ours = [model._bound_client()]
+            theirs = [await asyncio.to_thread(_on_worker)]
+            ours.append(await _bind())
+            theirs.append(await asyncio.to_thread(_on_worker))
+            return ours + theirs
+
+        mine, mine_again, worker, worker_again = _run(_interleaved())
+
+        assert mine is mine_again
+        assert worker is worker_again
+        assert worker is not mine
+        assert not mine._client.is_closed
+        assert not worker._client.is_closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+def test_close_runs_aclose_on_the_clients_loop():
+    model = OllamaNativeModel("gemma3:latest")
+    loop = asyncio.new_event_loop()
+    try:
+
+        async def _bind() -> Any:
+            return model._bound_client()
+
+        client = loop.run_until_complete(_bind())
+        model.close()
+        assert client._client.is_closed
+    finally:
+        loop.close()
+
+
+def test_aclose_closes_the_pool_from_inside_its_loop():
+    """``tab mcp`` shuts down from the loop its requests ran on."""
+    model = OllamaNativeModel("gemma3:latest")
+
+    async def _use_then_close() -> Any:
+        client = model._bound_client()
+        await model.aclose()
+        return client
+
+    assert _run(_use_then_close())._client.is_closed
+
+
+def test_close_without_a_request_is_a_no_op():
+    OllamaNativeModel("gemma3:latest").close()
+
+
 # --- streaming: OllamaNativeModel.request_stream + _OllamaStreamedResponse ---
 
 
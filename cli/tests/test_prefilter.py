@@ -0,0 +1,199 @@
+"""Tests for :mod:`tab_cli.prefilter` — the lexical pre-gate in ``tab chat``.
+
+The pre-gate is one-sided: a ``False`` skips routing entirely, so the
+load-bearing property is a zero false-negative rate. That is measured
+here against ``tests/fixtures/dispatch_eval.json`` with the vocabulary
+built from the real ``plugins/tab/skills`` SKILL.md files — every row
+whose ``expected`` names a skill must survive the pre-gate — and so
+must :data:`_PARAPHRASES`, a hand-written corpus of short, indirect
+ways of asking for each skill, which is where a lexical rule is most
+likely to go wrong. How many negatives it short-circuits is a tuning
+number, not a contract, so those aren't pinned one by one.
+
+The chat wiring is pinned with the same stub registry shape
+``test_chat.py`` uses, recording which lines reached ``match``.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from tab_cli.prefilter import LexicalPrefilter, content_tokens
+from tab_cli.registry import SkillRecord, parse_skill_frontmatter
+
+_FIXTURE = Path(__file__).parent / "fixtures" / "dispatch_eval.json"
+_SKILLS_DIR = Path(__file__).resolve().parents[2] / "plugins" / "tab" / "skills"
+
+
+@pytest.fixture(scope="module")
+def prefilter() -> LexicalPrefilter:
+    records = [
+        parse_skill_frontmatter(path)
+        for path in sorted(_SKILLS_DIR.glob("*/SKILL.md"))
+    ]
+    assert records, f"no SKILL.md files under {_SKILLS_DIR}"
+    return LexicalPrefilter.from_records(records)
+
+
+# Short and indirect requests, most sharing no word with the skill's
+# SKILL.md. Keyed by skill directory so a new skill without entries
+# fails ``test_paraphrase_corpus_covers_every_skill``.
+_PARAPHRASES: dict[str, list[str]] = {
+    "draw-dino": [
+        "sketch a stegosaurus",
+        "t-rex pls",
+        "triceratops!",
+        "ascii brontosaurus",
+        "make me a velociraptor",
+    ],
+    "hey-tab": [
+        "hello",
+        "hey",
+        "hi there",
+        "what mcps should I install",
+        "setup help",
+    ],
+    "listen": [
+        "I need to vent",
+        "let me ramble",
+        "just hear me out",
+        "stay quiet while I talk",
+        "don't reply yet",
+    ],
+    "teach": [
+        "tutor me on rust",
+        "explain monads",
+        "help me understand CRDTs",
+        "lesson on raft consensus",
+        "how do vaccines work",
+    ],
+    "think": [
+        "brainstorm with me",
+        "I have an idea",
+        "help me noodle on something",
+        "let's riff",
+        "poke holes in my plan",
+    ],
+}
+
+
+def _fixture_rows() -> list[dict[str, Any]]:
+    return json.loads(_FIXTURE.read_text())
+
+
+def test_no_false_negatives_on_the_dispatch_fixture(
+    prefilter: LexicalPrefilter,
+) -> None:
+    positives = [row["query"] for row in _fixture_rows() if row["expected"]]
+
+    assert [query for query in positives if not prefilter.could_match(query)] == []
+
+
+def test_paraphrase_corpus_covers_every_skill() -> None:
+    skills = {path.parent.name for path in _SKILLS_DIR.glob("*/SKILL.md")}
+
+    assert set(_PARAPHRASES) == skills
+
+
+@pytest.mark.parametrize(
+    "query",
+    [query for queries in _PARAPHRASES.values() for query in queries],
+)
+def test_no_false_negatives_on_skill_paraphrases(
+    prefilter: LexicalPrefilter, query: str
+) -> None:
+    assert prefilter.could_match(query)
+
+
+def test_rejects_acknowledgements_and_small_talk(prefilter: LexicalPrefilter) -> None:
+    for line in ("thanks, that worked", "ok", "lol", "ok got it", "thank you!"):
+        assert not prefilter.could_match(line), line
+
+
+def test_rejects_pastes_logs_and_code(prefilter: LexicalPrefilter) -> None:
+    log = "\n".join(f"2026-01-0{n} INFO worker started" for n in range(1, 7))
+    code = "def f(x): return {k: v[0] for (k, v) in x.items() if v}"
+    long_line = "please teach me " + "and then some more words " * 40
+
+    assert not prefilter.could_match(log)
+    assert not prefilter.could_match(code)
+    assert not prefilter.could_match(long_line)
+    assert not prefilter.could_match("   ")
+
+
+def test_keeps_anything_beyond_small_talk(prefilter: LexicalPrefilter) -> None:
+    # Anchored: one skill word is enough, even next to an acknowledgement.
+    assert prefilter.could_match("dino?")
+    assert prefilter.could_match("ok, listen")
+    # One word off the small-talk list and it embeds.
+    assert prefilter.could_match("thanks, now explain monads")
+    assert prefilter.could_match("good morning")
+
+
+def test_vocabulary_drops_description_boilerplate() -> None:
+    record = SkillRecord(
+        name="draw-dino",
+        description="Use when the user invokes /draw-dino for a dinosaur.",
+        threshold=0.55,
+        path=Path("draw-dino/SKILL.md"),
+    )
+    vocabulary = LexicalPrefilter.from_records([record]).vocabulary
+
+    assert {"draw", "dino", "dinosaur"} <= vocabulary
+    assert not vocabulary & content_tokens("use user invokes tab")
+
+
+def test_stemming_collides_inflections() -> None:
+    assert content_tokens("listening") == content_tokens("listen")
+    assert content_tokens("draws") == content_tokens("draw")
+
+
+# ------------------------------------------------------------------ chat
+
+
+class _RecordingRegistry:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def match(self, query: str) -> None:
+        self.queries.append(query)
+        return None
+
+
+class _StubAgent:
+    def run_stream_events(self, prompt: str, **_: Any) -> Any:
+        raise AssertionError("patched out")
+
+
+def test_chat_skips_registry_for_lines_the_prefilter_rules_out(
+    prefilter: LexicalPrefilter,
+) -> None:
+    from tab_cli.chat import run_chat
+
+    registry = _RecordingRegistry()
+    turns: list[str] = []
+
+    def _turn(session: Any, line: str, stdout: Any) -> None:
+        turns.append(line)
+
+    with (
+        patch("tab_cli.chat.compile_tab_agent", lambda **_: _StubAgent()),
+        patch("tab_cli.chat._stream_agent_turn", _turn),
+    ):
+        run_chat(
+            registry=registry,  # type: ignore[arg-type]
+            prefilter=prefilter,
+            speculate=False,
+            stdin=io.StringIO("thanks, that worked\nteach me how OAuth works\n"),
+            stdout=io.StringIO(),
+            history_token_budget=1000,
+        )
+
+    assert registry.queries == ["teach me how OAuth works"]
+    assert turns == ["thanks, that worked", "teach me how OAuth works"]
@@ -0,0 +1,88 @@
+"""Tests for :mod:`tab_cli.prompt_cache` — the stat-validated prompt cache.
+
+The property under test is the one the personality and skill modules
+care about: an unchanged file is served from memory, and *any* edit is
+visible on the next read. ``transform`` is a counting wrapper so the
+tests can tell a cache hit from a re-read.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tab_cli.prompt_cache import PromptFileCache
+
+
+class _CountingTransform:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, text: str) -> str:
+        self.calls += 1
+        return text.upper()
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Backdate ``path``'s mtime so it falls outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_unchanged_file_is_read_once(tmp_path: Path) -> None:
+    path = tmp_path / "tab.md"
+    path.write_text("body")
+    _age(path)
+    transform = _CountingTransform()
+    cache = PromptFileCache(transform)
+
+    assert cache.read(path) == "BODY"
+    assert cache.read(path) == "BODY"
+    assert transform.calls == 1
+
+
+def test_edit_is_picked_up_on_next_read(tmp_path: Path) -> None:
+    path = tmp_path / "tab.md"
+    path.write_text("old")
+    _age(path, 120)
+    cache = PromptFileCache(_CountingTransform())
+    assert cache.read(path) == "OLD"
+
+    # Same size, different mtime — the stamp still moves.
+    path.write_text("new")
+    _age(path, 60)
+    assert cache.read(path) == "NEW"
+
+
+def test_recently_modified_file_is_not_cached(tmp_path: Path) -> None:
+    """A file touched inside the racy window could change again without
+    its stamp moving, so it is re-read until it settles."""
+    path = tmp_path / "tab.md"
+    path.write_text("fresh")
+    transform = _CountingTransform()
+    cache = PromptFileCache(transform)
+
+    cache.read(path)
+    cache.read(path)
+    assert transform.calls == 2
+
+
+def test_missing_file_raises_file_not_found(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        PromptFileCache(_CountingTransform()).read(tmp_path / "nope.md")
+
+
+def test_clear_forces_a_reread(tmp_path: Path) -> None:
+    path = tmp_path / "tab.md"
+    path.write_text("body")
+    _age(path)
+    transform = _CountingTransform()
+    cache = PromptFileCache(transform)
+
+    cache.read(path)
+    cache.clear()
+    cache.read(path)
+    assert transform.calls == 2
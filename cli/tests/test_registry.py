@@ -18,8 +18,8 @@ from __future__ import annotations
 import math
 import re
 from collections.abc import Sequence
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -28,13 +28,18 @@ from grimoire import Gate
 from grimoire.db.repository import CorpusMeta, ItemMatch, ItemSeed
 from grimoire.embeddings import embedder_from_callable
 
+from tab_cli.embeddings import EmbeddingCache
 from tab_cli.registry import (
     DEFAULT_THRESHOLD,
     SKILL_CORPUS,
     SkillFrontmatterError,
     SkillRegistry,
+    corpus_fingerprint,
+    load_seeded_fingerprint,
     load_skill_registry,
+    normalize_routing_query,
     parse_skill_frontmatter,
+    save_seeded_fingerprint,
 )
 
 # Resolve the worktree's plugins/ directory once. Tests run from the cli/
@@ -133,6 +138,8 @@ class _InMemoryRepository:
     def __init__(self) -> None:
         self._corpora: dict[str, list[_Row]] = {}
         self._meta: dict[str, CorpusMeta] = {}
+        self.queries = 0
+        self._writes = 0
 
     def get_corpus_meta(self, corpus_key: str) -> CorpusMeta | None:
         return self._meta.get(corpus_key)
@@ -145,6 +152,7 @@ class _InMemoryRepository:
         embedder_identity: str,
         embedding_dimensions: int,
     ) -> None:
+        self._writes += 1
         self._corpora[corpus_key] = [
             _Row(
                 name=row.name,
@@ -158,7 +166,9 @@ class _InMemoryRepository:
             corpus_key=corpus_key,
             embedder=embedder_identity,
             embedding_dimensions=embedding_dimensions,
-            embedded_at=datetime(2026, 4, 25, tzinfo=UTC),
+            # Every write gets its own timestamp, as grimoire's does.
+            embedded_at=datetime(2026, 4, 25, tzinfo=UTC)
+            + timedelta(seconds=self._writes),
         )
 
     def top_k_in_corpus(
@@ -167,6 +177,7 @@ class _InMemoryRepository:
         query_vec: list[float],
         k: int,
     ) -> list[ItemMatch]:
+        self.queries += 1
         rows = self._corpora.get(corpus_key, [])
         scored = [
             ItemMatch(
@@ -517,3 +528,455 @@ def test_load_skill_registry_handles_empty_skills_directory(tmp_path: Path) -> N
     assert registry.records == ()
     # Gate works; just nothing seeded.
     assert registry.match("anything") is None
+
+
+# ------------------------------------------------------- corpus fingerprint
+
+
+def test_corpus_fingerprint_is_order_independent() -> None:
+    paths = sorted((PLUGINS_DIR / "tab" / "skills").glob("*/SKILL.md"))
+    records = [parse_skill_frontmatter(path) for path in paths]
+    assert corpus_fingerprint(records) == corpus_fingerprint(reversed(records))
+
+
+def test_corpus_fingerprint_tracks_description_threshold_and_embedder(
+    tmp_path: Path,
+) -> None:
+    base = parse_skill_frontmatter(
+        _write_skill(tmp_path / "a", threshold_line=None, description="One.")
+    )
+    edited = parse_skill_frontmatter(
+        _write_skill(tmp_path / "b", threshold_line=None, description="Two.")
+    )
+    retuned = parse_skill_frontmatter(
+        _write_skill(
+            tmp_path / "c", threshold_line="grimoire-threshold: 0.7", description="One."
+        )
+    )
+
+    fingerprint = corpus_fingerprint([base], embedder_identity="ollama:x")
+    assert fingerprint != corpus_fingerprint([edited], embedder_identity="ollama:x")
+    assert fingerprint != corpus_fingerprint([retuned], embedder_identity="ollama:x")
+    assert fingerprint != corpus_fingerprint([base], embedder_identity="ollama:y")
+    # The SKILL.md location isn't part of what the gate sees.
+    moved = parse_skill_frontmatter(
+        _write_skill(tmp_path / "d", threshold_line=None, description="One.")
+    )
+    assert fingerprint == corpus_fingerprint([moved], embedder_identity="ollama:x")
+
+
+def test_seeded_fingerprint_round_trips_per_corpus(tmp_path: Path) -> None:
+    state = tmp_path / "skill-corpus.json"
+    assert load_seeded_fingerprint(SKILL_CORPUS, state) is None
+
+    save_seeded_fingerprint(SKILL_CORPUS, "abc", state)
+    save_seeded_fingerprint("other-corpus", "def", state)
+
+    assert load_seeded_fingerprint(SKILL_CORPUS, state) == "abc"
+    assert load_seeded_fingerprint("other-corpus", state) == "def"
+
+
+def test_seeded_fingerprint_treats_malformed_state_as_unseeded(
+    tmp_path: Path,
+) -> None:
+    state = tmp_path / "skill-corpus.json"
+    state.write_text("{not json", encoding="utf-8")
+    assert load_seeded_fingerprint(SKILL_CORPUS, state) is None
+
+
+def test_injected_gate_is_seeded_and_registry_carries_fingerprint(
+    tmp_path: Path,
+) -> None:
+    """An injected gate is always seeded — a fresh fake starts empty."""
+    state = tmp_path / "skill-corpus.json"
+    registry = load_skill_registry(PLUGINS_DIR, gate=_make_gate(), seed_state=state)
+
+    assert registry.fingerprint == corpus_fingerprint(registry.records)
+    assert registry.match("draw an ASCII art dinosaur") is not None
+    assert not state.exists()
+
+
+# ----------------------------------------------------------- memory backend
+
+
+@dataclass
+class _BagOfWordsEmbedder:
+    """Tab-side :class:`EmbedderLike` over the same hashed bag-of-words."""
+
+    identity: str = _FAKE_IDENTITY
+    calls: int = 0
+    batches: list[list[str]] = field(default_factory=list)
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls += len(texts)
+        self.batches.append(list(texts))
+        return [_hashed_bag_of_words(text) for text in texts]
+
+
+def test_memory_backend_routes_without_postgres(tmp_path: Path) -> None:
+    """``backend="memory"`` builds a working gate on the NumPy index."""
+    registry = load_skill_registry(
+        PLUGINS_DIR,
+        embedder=_BagOfWordsEmbedder(),
+        cache=EmbeddingCache(tmp_path),
+        backend="memory",
+    )
+
+    hit = registry.match("draw an ASCII art dinosaur")
+
+    assert hit is not None
+    assert hit.name == "draw-dino"
+    assert hit.passed
+
+
+def test_memory_backend_reuses_cached_description_embeddings(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path)
+    load_skill_registry(
+        PLUGINS_DIR, embedder=_BagOfWordsEmbedder(), cache=cache, backend="memory"
+    )
+
+    second = _BagOfWordsEmbedder()
+    registry = load_skill_registry(
+        PLUGINS_DIR, embedder=second, cache=cache, backend="memory"
+    )
+
+    assert second.calls == 0
+    assert registry.records
+
+
+def test_unknown_backend_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="grimoire backend"):
+        load_skill_registry(PLUGINS_DIR, cache=EmbeddingCache(tmp_path), backend="faiss")
+
+
+# ------------------------------------------------- pinned grimoire contract
+
+
+def _installed_grimoire_version() -> str | None:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("grimoire")
+    except PackageNotFoundError:
+        return None
+
+
+@pytest.mark.skipif(
+    _installed_grimoire_version() is None,
+    reason="needs the pinned grimoire release installed (uv sync)",
+)
+def test_pinned_grimoire_accepts_the_default_gate_wiring() -> None:
+    """The default path calls ``Gate.from_settings(corpus=, embedder=)``
+    with :func:`to_grimoire_embedder`'s adapter, and the seed check reads
+    ``gate.repository``. The fakes above only mirror that surface; this
+    pins it against the grimoire release ``pyproject.toml`` installs."""
+    import inspect
+
+    from tab_cli.embeddings import to_grimoire_embedder
+
+    adapter = to_grimoire_embedder(_BagOfWordsEmbedder())
+    assert adapter.identity == _FAKE_IDENTITY
+    assert type(adapter) is type(_make_embedder())
+
+    signature = inspect.signature(Gate.from_settings)
+    signature.bind(corpus=SKILL_CORPUS, embedder=adapter)
+
+    gate = Gate(
+        corpus=SKILL_CORPUS,
+        embedder=adapter,
+        repository=_InMemoryRepository(),  # type: ignore[arg-type]
+    )
+    assert isinstance(gate.repository, _InMemoryRepository)
+
+
+# ------------------------------------------------------- pgvector seeding
+
+
+def _pgvector_registry(
+    tmp_path: Path, repository: _InMemoryRepository, monkeypatch: pytest.MonkeyPatch
+) -> tuple[SkillRegistry, list[object]]:
+    """Load through the default pgvector path with ``repository`` behind it."""
+    seeded: list[object] = []
+
+    class _Gate(Gate):
+        def seed(self, rows: object) -> None:
+            seeded.append(rows)
+            super().seed(rows)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(
+        "grimoire.Gate.from_settings",
+        lambda corpus, embedder: _Gate(
+            corpus=corpus,
+            embedder=embedder,
+            repository=repository,  # type: ignore[arg-type]
+        ),
+    )
+    registry = load_skill_registry(
+        PLUGINS_DIR,
+        embedder=_BagOfWordsEmbedder(),
+        cache=EmbeddingCache(tmp_path / "embeddings"),
+        seed_state=tmp_path / "skill-corpus.json",
+        backend="pgvector",
+    )
+    return registry, seeded
+
+
+def test_pgvector_seed_is_skipped_when_state_and_corpus_match(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repository = _InMemoryRepository()
+    _, first = _pgvector_registry(tmp_path, repository, monkeypatch)
+    registry, second = _pgvector_registry(tmp_path, repository, monkeypatch)
+
+    assert len(first) == 1
+    assert second == []
+    # The check reads the corpus meta; it never lists rows through a
+    # similarity query, whose recall depends on the index.
+    assert repository.queries == 0
+    assert registry.match("draw an ASCII art dinosaur") is not None
+
+
+def test_pgvector_reseeds_an_empty_corpus_despite_a_matching_state_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A fresh or repointed database has no rows the state file can vouch for."""
+    _pgvector_registry(tmp_path, _InMemoryRepository(), monkeypatch)
+    fresh = _InMemoryRepository()
+    registry, seeded = _pgvector_registry(tmp_path, fresh, monkeypatch)
+
+    assert len(seeded) == 1
+    assert fresh.get_corpus_meta(SKILL_CORPUS) is not None
+    assert registry.match("draw an ASCII art dinosaur") is not None
+
+
+def test_pgvector_reseeds_a_corpus_rewritten_since_the_state_was_saved(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repository = _InMemoryRepository()
+    registry, _ = _pgvector_registry(tmp_path, repository, monkeypatch)
+    # Another writer (or a restore) replaces the corpus with fewer rows.
+    meta = repository.get_corpus_meta(SKILL_CORPUS)
+    assert meta is not None
+    repository.seed_corpus(
+        SKILL_CORPUS,
+        [
+            ItemSeed(name=row.name, text=row.text, embedding=row.vec, threshold=0.5)
+            for row in repository._corpora[SKILL_CORPUS][1:]
+        ],
+        embedder_identity=meta.embedder,
+        embedding_dimensions=meta.embedding_dimensions,
+    )
+
+    _, seeded = _pgvector_registry(tmp_path, repository, monkeypatch)
+
+    assert len(seeded) == 1
+    assert len(repository._corpora[SKILL_CORPUS]) == len(registry.records)
+
+
+# ------------------------------------------------------------ match_many
+
+_ROUTING_QUERIES = [
+    "draw an ASCII art dinosaur",
+    "what's the weather in Berlin",
+    "teach me about byzantine fault tolerance",
+]
+
+
+def _memory_registry(
+    tmp_path: Path, embedder: _BagOfWordsEmbedder
+) -> SkillRegistry:
+    return load_skill_registry(
+        PLUGINS_DIR,
+        embedder=embedder,
+        cache=EmbeddingCache(tmp_path),
+        backend="memory",
+    )
+
+
+def test_match_many_agrees_with_match_per_query(tmp_path: Path) -> None:
+    registry = _memory_registry(tmp_path, _BagOfWordsEmbedder())
+
+    batched = registry.match_many(_ROUTING_QUERIES)
+    single = [registry.match(query) for query in _ROUTING_QUERIES]
+
+    assert [h.name for h in batched] == [h.name for h in single]
+    assert [h.passed for h in batched] == [h.passed for h in single]
+    for b, s in zip(batched, single, strict=True):
+        assert b.similarity == pytest.approx(s.similarity, abs=1e-5)
+        assert b.threshold == pytest.approx(s.threshold)
+
+
+def test_match_many_embeds_all_queries_in_one_call(tmp_path: Path) -> None:
+    embedder = _BagOfWordsEmbedder()
+    registry = _memory_registry(tmp_path, embedder)
+    embedder.batches.clear()
+
+    registry.match_many(_ROUTING_QUERIES)
+    registry.match_many(["one more query", "and another"])
+
+    # Descriptions are served from the embedding cache, so the inner
+    # embedder only ever sees one batch per match_many.
+    assert embedder.batches == [_ROUTING_QUERIES, ["one more query", "and another"]]
+
+
+def test_match_many_empty_input_skips_the_embedder(tmp_path: Path) -> None:
+    embedder = _BagOfWordsEmbedder()
+    registry = _memory_registry(tmp_path, embedder)
+    embedder.batches.clear()
+
+    assert registry.match_many([]) == []
+    assert embedder.batches == []
+
+
+def test_match_many_without_embedder_falls_back_to_gate_matches() -> None:
+    registry = load_skill_registry(PLUGINS_DIR, gate=_make_gate())
+    hits = registry.match_many(_ROUTING_QUERIES[:2])
+    assert [h.name if h else None for h in hits] == [
+        registry.match(q).name for q in _ROUTING_QUERIES[:2]
+    ]
+
+
+def test_match_many_embeds_repeated_queries_once_and_keeps_input_order(
+    tmp_path: Path,
+) -> None:
+    embedder = _BagOfWordsEmbedder()
+    registry = _memory_registry(tmp_path, embedder)
+    embedder.batches.clear()
+    queries = [
+        _ROUTING_QUERIES[1],
+        _ROUTING_QUERIES[0],
+        _ROUTING_QUERIES[1],
+        _ROUTING_QUERIES[2],
+        _ROUTING_QUERIES[0],
+    ]
+
+    hits = registry.match_many(queries)
+
+    assert embedder.batches == [
+        [_ROUTING_QUERIES[1], _ROUTING_QUERIES[0], _ROUTING_QUERIES[2]]
+    ]
+    expected = {q: registry.match(q) for q in _ROUTING_QUERIES}
+    assert [h.name for h in hits] == [expected[q].name for q in queries]
+    assert hits[0] == hits[2]
+
+
+# ------------------------------------------------------------- hit cache
+
+
+@dataclass
+class _CountingGate:
+    """Wraps a real gate and counts how often ``match`` reaches it."""
+
+    inner: Gate
+    queries: list[str] = field(default_factory=list)
+
+    def seed(self, rows: object) -> None:
+        self.inner.seed(rows)
+
+    def match(self, query: str) -> object:
+        self.queries.append(query)
+        return self.inner.match(query)
+
+
+def _cached_registry(**kwargs: object) -> tuple[SkillRegistry, _CountingGate]:
+    gate = _CountingGate(_make_gate())
+    loaded = load_skill_registry(PLUGINS_DIR, gate=gate)  # type: ignore[arg-type]
+    registry = SkillRegistry(
+        gate,  # type: ignore[arg-type]
+        loaded.records,
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return registry, gate
+
+
+def test_normalize_routing_query_folds_case_and_whitespace() -> None:
+    assert normalize_routing_query("  Draw   a\tDino! ") == "draw a dino!"
+
+
+def test_repeated_queries_skip_the_gate() -> None:
+    registry, gate = _cached_registry()
+
+    first = registry.match("draw an ASCII art dinosaur")
+    again = registry.match("Draw an  ASCII art dinosaur")
+
+    assert again == first
+    assert gate.queries == ["draw an ASCII art dinosaur"]
+
+
+def test_hit_cache_evicts_least_recently_used() -> None:
+    registry, gate = _cached_registry(hit_cache_size=2)
+
+    registry.match("a")
+    registry.match("b")
+    registry.match("a")  # refresh "a"; "b" is now the oldest
+    registry.match("c")
+    registry.match("a")
+    registry.match("b")
+
+    assert gate.queries == ["a", "b", "c", "b"]
+
+
+def test_hit_cache_size_zero_disables_caching() -> None:
+    registry, gate = _cached_registry(hit_cache_size=0)
+    registry.match("ok")
+    registry.match("ok")
+    assert gate.queries == ["ok", "ok"]
+
+
+def test_hit_cache_lookups_never_touch_the_overrides_file(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Overrides only change ``tab grimoire``'s display, not the gate's
+    verdicts, so the hot path has no reason to stat them."""
+
+    def _no_overrides() -> Path:
+        raise AssertionError("routing consulted the overrides file")
+
+    monkeypatch.setattr("tab_cli.grimoire_overrides.overrides_path", _no_overrides)
+    registry, gate = _cached_registry()
+
+    registry.match("thanks")
+    registry.match("thanks")
+    registry.match_many(["thanks"])
+
+    assert gate.queries == ["thanks"]
+
+
+def test_hit_cache_is_per_registry() -> None:
+    registry, _ = _cached_registry()
+    other, other_gate = _cached_registry()
+    registry.match("thanks")
+    other.match("thanks")
+    assert other_gate.queries == ["thanks"]
+
+
+def test_match_many_only_embeds_uncached_queries(tmp_path: Path) -> None:
+    embedder = _BagOfWordsEmbedder()
+    registry = _memory_registry(tmp_path, embedder)
+    registry.match_many(["teach me about raft"])
+    embedder.batches.clear()
+
+    hits = registry.match_many(["Teach me about  raft", "draw a dino"])
+
+    assert embedder.batches == [["draw a dino"]]
+    assert hits[0].name == registry.match("teach me about raft").name
+
+
+def test_warm_up_preloads_the_embedder_when_it_can() -> None:
+    class _Preloading:
+        identity = "fake:preloading"
+        warmed = 0
+
+        def warm_up(self) -> None:
+            self.warmed += 1
+
+    embedder = _Preloading()
+    registry, _ = _cached_registry(embedder=embedder)
+    registry.warm_up()
+    assert embedder.warmed == 1
+
+    # No embedder (an injected gate that embeds in-process): nothing to do.
+    _cached_registry()[0].warm_up()
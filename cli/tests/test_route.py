@@ -0,0 +1,160 @@
+"""Tests for ``tab route`` and :mod:`tab_cli.route`.
+
+The registry is a recording stub with a ``match_many`` that answers
+from a lookup table, so the tests pin what the route layer owns:
+input parsing (plain lines and JSONL), batching — one ``match_many``
+call per ``batch_size`` queries — and the output row shape. Scoring
+itself is :meth:`SkillRegistry.match_many`'s contract, pinned in
+``test_registry.py``.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from tab_cli.cli import app
+from tab_cli.route import route_lines
+
+
+@dataclass(frozen=True)
+class _StubHit:
+    name: str
+    similarity: float
+    threshold: float
+    passed: bool
+
+
+@dataclass
+class _StubRegistry:
+    """``match_many`` that hits ``draw-dino`` for anything mentioning dinos."""
+
+    batches: list[list[str]] = field(default_factory=list)
+
+    def match_many(self, queries: list[str]) -> list[_StubHit | None]:
+        self.batches.append(list(queries))
+        return [
+            _StubHit("draw-dino", 0.81234, 0.55, True)
+            if "dino" in query
+            else _StubHit("teach", 0.2, 0.55, False)
+            for query in queries
+        ]
+
+
+def _route(lines: list[str], **kwargs: Any) -> tuple[_StubRegistry, list[dict]]:
+    registry = _StubRegistry()
+    written: list[str] = []
+    route_lines(registry, lines, written.append, **kwargs)  # type: ignore[arg-type]
+    return registry, [json.loads(chunk) for chunk in written]
+
+
+def test_route_emits_one_row_per_query_in_input_order() -> None:
+    _, rows = _route(["draw a dino\n", "\n", "  what is CRDT  \n"])
+
+    assert rows == [
+        {
+            "query": "draw a dino",
+            "skill": "draw-dino",
+            "similarity": 0.8123,
+            "threshold": 0.55,
+            "passed": True,
+        },
+        {
+            "query": "what is CRDT",
+            "skill": "teach",
+            "similarity": 0.2,
+            "threshold": 0.55,
+            "passed": False,
+        },
+    ]
+
+
+def test_route_calls_match_many_once_per_batch() -> None:
+    registry, rows = _route([f"q{n}" for n in range(5)], batch_size=2)
+    assert [len(batch) for batch in registry.batches] == [2, 2, 1]
+    assert [row["query"] for row in rows] == [f"q{n}" for n in range(5)]
+
+
+def test_route_jsonl_accepts_strings_and_objects_and_flags_bad_lines() -> None:
+    registry, rows = _route(
+        ['"dino please"', '{"query": "hi", "id": 9}', "{oops", '{"q": 1}'],
+        jsonl=True,
+    )
+
+    assert registry.batches == [["dino please", "hi"]]
+    assert rows[0]["skill"] == "draw-dino"
+    assert rows[1]["id"] == 9 and rows[1]["query"] == "hi"
+    assert rows[2]["error"].startswith("invalid JSON")
+    assert "query" in rows[3]["error"]
+
+
+def test_route_reports_an_empty_corpus_as_nulls() -> None:
+    class _Empty:
+        def match_many(self, queries: list[str]) -> list[None]:
+            return [None] * len(queries)
+
+    written: list[str] = []
+    route_lines(_Empty(), ["anything"], written.append)  # type: ignore[arg-type]
+    assert json.loads(written[0]) == {
+        "query": "anything",
+        "skill": None,
+        "similarity": None,
+        "threshold": None,
+        "passed": False,
+    }
+
+
+def test_route_rejects_non_positive_batch_size() -> None:
+    registry: Any = _StubRegistry()
+    with pytest.raises(ValueError, match="batch_size"):
+        route_lines(registry, [], lambda _: None, batch_size=0)
+
+
+# ------------------------------------------------------------------- CLI
+
+
+def test_route_command_reads_a_file_and_writes_out(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    registry = _StubRegistry()
+    monkeypatch.setattr(
+        "tab_cli.registry.load_skill_registry", lambda plugins_dir: registry
+    )
+    source = tmp_path / "queries.txt"
+    source.write_text("dino\nweather\n")
+    target = tmp_path / "rows.jsonl"
+
+    result = CliRunner().invoke(
+        app, ["route", str(source), "--out", str(target), "--batch-size", "1"]
+    )
+
+    assert result.exit_code == 0, result.stderr
+    rows = [json.loads(line) for line in target.read_text().splitlines()]
+    assert [row["skill"] for row in rows] == ["draw-dino", "teach"]
+    assert registry.batches == [["dino"], ["weather"]]
+
+
+def test_route_command_reads_stdin_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "tab_cli.registry.load_skill_registry", lambda plugins_dir: _StubRegistry()
+    )
+    result = CliRunner().invoke(app, ["route"], input="a dino\n")
+    assert result.exit_code == 0, result.stderr
+    assert json.loads(result.stdout)["passed"] is True
+
+
+def test_route_command_surfaces_registry_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _boom(plugins_dir: Path) -> None:
+        raise RuntimeError("ollama is not running")
+
+    monkeypatch.setattr("tab_cli.registry.load_skill_registry", _boom)
+    result = CliRunner().invoke(app, ["route"], input="x\n")
+    assert result.exit_code == 1
+    assert result.stderr.strip() == "tab: ollama is not running"
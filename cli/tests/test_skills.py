@@ -114,6 +114,22 @@ Body line two.
     assert "description:" not in body
 
 
+def test_read_skill_body_picks_up_edits_between_reads(tmp_path: Path) -> None:
+    """The body is cached across compiles, but never served stale."""
+    import os
+    import time
+
+    skill_md = tmp_path / "tab" / "skills" / "fake" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text("---\nname: fake\n---\nfirst\n", encoding="utf-8")
+    past = time.time() - 120
+    os.utime(skill_md, (past, past))
+    assert read_skill_body("fake", plugins_dir=tmp_path) == "first\n"
+
+    skill_md.write_text("---\nname: fake\n---\nsecond\n", encoding="utf-8")
+    assert read_skill_body("fake", plugins_dir=tmp_path) == "second\n"
+
+
 # ---------------------------------------------------------- build_skill_system_prompt
 
 
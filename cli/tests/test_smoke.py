@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 from typer.testing import CliRunner
 
 from tab_cli.cli import app
@@ -12,3 +15,25 @@ def test_help_mentions_tab() -> None:
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "tab" in result.stdout.lower()
+
+
+def test_importing_cli_does_not_import_pydantic_ai() -> None:
+    """``tab --help`` and the light subcommands must not pay for pydantic-ai.
+
+    Checked in a fresh interpreter: by the time this test runs, other
+    test modules have already imported the agent stack into this
+    process's ``sys.modules``.
+    """
+    probe = (
+        "import sys\n"
+        "import tab_cli.cli\n"
+        "leaked = sorted(m for m in sys.modules if m.split('.')[0] == 'pydantic_ai')\n"
+        "print(','.join(leaked))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
@@ -258,6 +258,7 @@ def test_teach_passes_a_web_search_tool_into_run_skill(
     assert tools is not None and len(tools) >= 1
     names = {getattr(t, "__name__", str(t)) for t in tools}
     assert "web_search" in names, f"expected web_search in {names!r}"
+    assert "web_search_many" in names, f"expected web_search_many in {names!r}"
 
 
 def test_teach_registers_web_search_tool_on_skill_agent(
@@ -520,7 +521,7 @@ def test_chat_routes_teach_match_through_grimoire_to_skill_agent_with_tool(
     tools = teach_call.get("tools") or ()
     assert len(tools) >= 1
     names = {getattr(t, "__name__", str(t)) for t in tools}
-    assert "web_search" in names
+    assert {"web_search", "web_search_many"} <= names
 
     # Skill output reached stdout.
     assert "starting point" in out
@@ -0,0 +1,342 @@
+"""Tests for :mod:`tab_cli.tracing` and the spans ``tab chat`` records.
+
+The span file is the contract: one JSON object per line with
+OpenTelemetry's span field names, children pointing at their parent's
+``span_id`` and sharing its ``trace_id``. The chat tests drive the REPL
+with stub agents and a stub registry — the same shapes ``test_chat.py``
+uses — and assert which spans each kind of turn produces and how they
+nest, not how long they took.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from tab_cli import tracing
+from tab_cli.cli import app
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Path:
+    path = tmp_path / "trace.jsonl"
+    tracing.enable(path)
+    return path
+
+
+def _spans(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _children(spans: list[dict[str, Any]], parent: dict[str, Any]) -> list[str]:
+    return [
+        span["name"] for span in spans if span["parent_span_id"] == parent["span_id"]
+    ]
+
+
+# ----------------------------------------------------------------- core
+
+
+def test_disabled_tracing_writes_nothing(tmp_path: Path) -> None:
+    with tracing.span("chat.turn") as span:
+        span.set(route="agent")
+    tracing.record("model.first_token", 1, 2)
+    assert list(tracing.stream(iter(["a", "b"]), tracing.now())) == ["a", "b"]
+
+    assert not tracing.enabled()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spans_nest_and_use_otel_field_names(trace_file: Path) -> None:
+    with tracing.span("chat.turn", chars=5) as turn:
+        with tracing.span("grimoire.match"):
+            pass
+        turn.set(route="agent")
+    with tracing.span("chat.turn"):
+        pass
+
+    child, first, second = _spans(trace_file)
+    assert set(first) == {
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "name",
+        "start_time_unix_nano",
+        "end_time_unix_nano",
+        "attributes",
+        "status",
+    }
+    assert len(first["trace_id"]) == 32 and len(first["span_id"]) == 16
+    assert first["parent_span_id"] is None
+    assert first["attributes"] == {"chars": 5, "route": "agent"}
+    assert child["parent_span_id"] == first["span_id"]
+    assert child["trace_id"] == first["trace_id"]
+    assert first["start_time_unix_nano"] <= child["start_time_unix_nano"]
+    assert child["end_time_unix_nano"] <= first["end_time_unix_nano"]
+    # A new root is a new trace.
+    assert second["trace_id"] != first["trace_id"]
+
+
+def test_span_marks_errors_and_reraises(trace_file: Path) -> None:
+    with pytest.raises(ValueError), tracing.span("agent.compile"):
+        raise ValueError("no such skill")
+
+    (span,) = _spans(trace_file)
+    assert span["status"] == "error"
+    assert span["attributes"] == {"error.type": "ValueError"}
+
+
+def test_stream_records_first_token_then_stream(trace_file: Path) -> None:
+    started = tracing.now()
+    assert list(tracing.stream(iter(["hel", "lo"]), started)) == ["hel", "lo"]
+    assert list(tracing.stream(iter([]), started)) == []
+
+    first_token, streamed = _spans(trace_file)
+    assert first_token["name"] == "model.first_token"
+    assert first_token["start_time_unix_nano"] == started
+    assert streamed["name"] == "model.stream"
+    assert streamed["start_time_unix_nano"] == first_token["end_time_unix_nano"]
+    assert streamed["attributes"] == {"chunks": 2, "chars": 5}
+
+
+def test_traced_tools_record_calls_and_keep_the_schema_inputs(
+    trace_file: Path,
+) -> None:
+    from pydantic_ai import Tool
+
+    def web_search(query: str) -> list[str]:
+        """Search the web."""
+        return [query]
+
+    async def fetch(url: str) -> str:
+        return url
+
+    tool = Tool(web_search)
+    wrapped, wrapped_async, untouched = tracing.traced_tools([web_search, fetch, tool])
+
+    assert untouched is tool
+    assert wrapped.__name__ == "web_search" and wrapped.__doc__ == "Search the web."
+    assert wrapped("dinos") == ["dinos"]
+    assert asyncio.run(wrapped_async("x")) == "x"
+    assert [span["attributes"]["tool"] for span in _spans(trace_file)] == [
+        "web_search",
+        "fetch",
+    ]
+
+
+def test_traced_tools_is_a_passthrough_when_disabled() -> None:
+    def web_search(query: str) -> str:
+        return query
+
+    assert tracing.traced_tools([web_search]) == [web_search]
+
+
+# ----------------------------------------------------------------- chat
+
+
+@dataclass
+class _StreamResult:
+    chunks: list[str]
+
+    def stream_text(self, *, delta: bool = False) -> Iterator[str]:
+        yield from self.chunks
+
+    def all_messages(self) -> list[Any]:
+        return [object()]
+
+
+@dataclass
+class _AsyncStreamResult:
+    chunks: list[str]
+
+    async def stream_text(self, *, delta: bool = False) -> AsyncIterator[str]:
+        for chunk in self.chunks:
+            yield chunk
+
+    def all_messages(self) -> list[Any]:
+        return [object()]
+
+
+@dataclass
+class _Agent:
+    def run_stream_sync(self, prompt: str, **_: Any) -> _StreamResult:
+        return _StreamResult(["o", "k"])
+
+    @asynccontextmanager
+    async def run_stream(self, prompt: str, **_: Any) -> AsyncIterator[Any]:
+        yield _AsyncStreamResult(["o", "k"])
+
+
+@dataclass(frozen=True)
+class _Hit:
+    name: str
+    passed: bool
+    similarity: float = 0.9
+
+
+@dataclass
+class _Registry:
+    queries: list[str] = field(default_factory=list)
+
+    def match(self, query: str) -> _Hit | None:
+        self.queries.append(query)
+        return _Hit("draw-dino", True) if "dino" in query else None
+
+
+def _chat(text: str, *, speculate: bool = False) -> None:
+    from tab_cli.chat import run_chat
+
+    with (
+        patch("tab_cli.chat.compile_tab_agent", lambda **_: _Agent()),
+        patch("tab_cli.skills.compile_skill_agent", lambda *_, **__: _Agent()),
+    ):
+        run_chat(
+            registry=_Registry(),  # type: ignore[arg-type]
+            speculate=speculate,
+            stdin=io.StringIO(text),
+            stdout=io.StringIO(),
+            history_token_budget=1000,
+        )
+
+
+def test_chat_turns_are_traces_with_their_phases_nested(trace_file: Path) -> None:
+    _chat("set humor to 90%\ndraw a dino\nhello there\n/stats\n/exit\n")
+
+    spans = _spans(trace_file)
+    turns = [span for span in spans if span["name"] == "chat.turn"]
+    # The session-start compile is its own trace; /stats and /exit aren't turns.
+    assert [span["name"] for span in spans if span["parent_span_id"] is None] == [
+        "agent.compile",
+        "chat.turn",
+        "chat.turn",
+        "chat.turn",
+    ]
+    assert [turn["attributes"]["route"] for turn in turns] == [
+        "settings",
+        "skill",
+        "agent",
+    ]
+
+    assert _children(spans, turns[0]) == ["settings.detect", "agent.compile"]
+    assert _children(spans, turns[1]) == [
+        "settings.detect",
+        "grimoire.match",
+        "agent.compile",
+        "model.first_token",
+        "model.stream",
+    ]
+    assert _children(spans, turns[2]) == [
+        "settings.detect",
+        "grimoire.match",
+        "model.first_token",
+        "model.stream",
+    ]
+
+    match = next(span for span in spans if span["name"] == "grimoire.match")
+    assert match["attributes"] == {
+        "skill": "draw-dino",
+        "similarity": 0.9,
+        "passed": True,
+    }
+    dino_spans = [
+        span for span in spans if span["attributes"].get("skill") == "draw-dino"
+    ]
+    assert [span["name"] for span in dino_spans] == [
+        "grimoire.match",
+        "agent.compile",
+    ]
+    assert len({span["trace_id"] for span in spans}) == 4
+
+
+def test_speculative_turn_keeps_worker_thread_spans_in_the_turn(
+    trace_file: Path,
+) -> None:
+    _chat("hello there\n/exit\n", speculate=True)
+
+    spans = _spans(trace_file)
+    (turn,) = [span for span in spans if span["name"] == "chat.turn"]
+    assert sorted(_children(spans, turn)) == [
+        "grimoire.match",
+        "model.first_token",
+        "model.stream",
+        "settings.detect",
+    ]
+
+
+# ---------------------------------------------------------- model / CLI
+
+
+def test_ollama_stream_records_request_setup(trace_file: Path) -> None:
+    from ollama import ChatResponse, Message
+    from pydantic_ai.messages import ModelRequest, UserPromptPart
+    from pydantic_ai.models import ModelRequestParameters
+
+    from tab_cli.models import OllamaNativeModel
+
+    async def _chunks() -> AsyncIterator[ChatResponse]:
+        yield ChatResponse(
+            model="gemma3:latest",
+            message=Message(role="assistant", content="hi"),
+            done=True,
+        )
+
+    model = OllamaNativeModel("gemma3:latest")
+    model._client = AsyncMock()
+    model._client.chat.return_value = _chunks()
+
+    async def _drain() -> None:
+        async with model.request_stream(
+            messages=[ModelRequest(parts=[UserPromptPart(content="hi")])],
+            model_settings=None,
+            model_request_parameters=ModelRequestParameters(),
+        ) as streamed:
+            async for _event in streamed:
+                pass
+
+    asyncio.run(_drain())
+
+    (setup,) = _spans(trace_file)
+    assert setup["name"] == "model.request_setup"
+    assert setup["attributes"] == {"model": "gemma3:latest", "messages": 1, "tools": 0}
+
+
+def test_trace_flag_and_env_var_enable_tracing(tmp_path: Path) -> None:
+    seen: list[bool] = []
+
+    def _stub(**_: Any) -> None:
+        seen.append(tracing.enabled())
+
+    with patch("tab_cli.chat.run_chat", _stub):
+        CliRunner().invoke(app, ["chat"])
+        CliRunner().invoke(app, ["--trace", str(tmp_path / "a.jsonl"), "chat"])
+        tracing.disable()
+        CliRunner().invoke(app, [], env={"TAB_TRACE": str(tmp_path / "b.jsonl")})
+
+    assert seen == [False, True, True]
+
+
+def test_trace_env_var_enables_tracing_once_for_chat(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    with (
+        patch("tab_cli.chat.run_chat", lambda **_: None),
+        patch.object(tracing, "enable", calls.append),
+    ):
+        result = CliRunner().invoke(
+            app, ["chat"], env={"TAB_TRACE": str(tmp_path / "c.jsonl")}
+        )
+
+    assert result.exit_code == 0, result.output
+    assert calls == [str(tmp_path / "c.jsonl")]
@@ -0,0 +1,122 @@
+"""Tests for :mod:`tab_cli.vector_index` — the in-process skill index.
+
+The repository has to behave like grimoire's pgvector store from the
+gate's point of view: ``seed_corpus`` replaces, ``top_k_in_corpus``
+returns cosine-ranked :class:`ItemMatch` rows carrying each row's own
+threshold, and ``get_corpus_meta`` records the embedder identity so the
+gate's mismatch detection still works. A real :class:`grimoire.Gate`
+drives it end-to-end in the last test.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from grimoire import Gate
+from grimoire.db.repository import ItemSeed
+from grimoire.embeddings import embedder_from_callable
+
+from tab_cli.vector_index import InMemoryRepository
+
+
+def _seed(repo: InMemoryRepository) -> None:
+    repo.seed_corpus(
+        "skills",
+        [
+            ItemSeed(name="x", text="x", embedding=[2.0, 0.0, 0.0], threshold=0.5),
+            ItemSeed(name="y", text="y", embedding=[0.0, 3.0, 0.0], threshold=0.7),
+            ItemSeed(name="xy", text="xy", embedding=[1.0, 1.0, 0.0], threshold=0.9),
+        ],
+        embedder_identity="fake:vector-index",
+        embedding_dimensions=3,
+    )
+
+
+def test_top_1_returns_cosine_best_row_with_its_threshold() -> None:
+    repo = InMemoryRepository()
+    _seed(repo)
+
+    [match] = repo.top_k_in_corpus("skills", [0.0, 5.0, 0.0], 1)
+
+    assert match.name == "y"
+    # Exact: thresholds are stored as float64, so 0.7 reads back as 0.7.
+    assert match.threshold == 0.7
+    assert match.similarity == pytest.approx(1.0)
+
+
+def test_top_k_is_sorted_best_first() -> None:
+    repo = InMemoryRepository()
+    _seed(repo)
+
+    matches = repo.top_k_in_corpus("skills", [1.0, 0.2, 0.0], 3)
+
+    assert [m.name for m in matches] == ["x", "xy", "y"]
+    similarities = [m.similarity for m in matches]
+    assert similarities == sorted(similarities, reverse=True)
+
+
+def test_top_k_caps_at_corpus_size() -> None:
+    repo = InMemoryRepository()
+    _seed(repo)
+    assert len(repo.top_k_in_corpus("skills", [1.0, 1.0, 1.0], 10)) == 3
+
+
+def test_zero_query_scores_zero_rather_than_nan() -> None:
+    repo = InMemoryRepository()
+    _seed(repo)
+    [match] = repo.top_k_in_corpus("skills", [0.0, 0.0, 0.0], 1)
+    assert match.similarity == 0.0
+
+
+def test_unknown_corpus_has_no_meta_and_no_matches() -> None:
+    repo = InMemoryRepository()
+    assert repo.get_corpus_meta("missing") is None
+    assert repo.top_k_in_corpus("missing", [1.0], 1) == []
+
+
+def test_seed_records_meta_and_replaces_previous_rows() -> None:
+    repo = InMemoryRepository()
+    _seed(repo)
+    repo.seed_corpus(
+        "skills",
+        [ItemSeed(name="only", text="only", embedding=[0.0, 0.0, 1.0], threshold=0.1)],
+        embedder_identity="fake:vector-index",
+        embedding_dimensions=3,
+    )
+
+    meta = repo.get_corpus_meta("skills")
+    assert meta is not None
+    assert meta.embedder == "fake:vector-index"
+    assert meta.embedding_dimensions == 3
+    assert [m.name for m in repo.top_k_in_corpus("skills", [1.0, 0.0, 0.0], 5)] == [
+        "only"
+    ]
+
+
+def test_seed_rejects_dimension_mismatch() -> None:
+    repo = InMemoryRepository()
+    with pytest.raises(ValueError, match="3-dim"):
+        repo.seed_corpus(
+            "skills",
+            [ItemSeed(name="a", text="a", embedding=[1.0, 0.0], threshold=0.5)],
+            embedder_identity="fake:vector-index",
+            embedding_dimensions=3,
+        )
+
+
+def test_gate_routes_through_in_memory_repository() -> None:
+    def _embed(text: str) -> list[float]:
+        return [1.0, 0.0] if "dino" in text else [0.0, 1.0]
+
+    gate = Gate(
+        corpus="skills",
+        embedder=embedder_from_callable(_embed, identity="fake:vector-index"),
+        repository=InMemoryRepository(),  # type: ignore[arg-type]
+    )
+    gate.seed([("draw-dino", "draw a dino", 0.55), ("teach", "teach me", 0.55)])
+
+    hit = gate.match("a dino please")
+
+    assert hit is not None
+    assert hit.name == "draw-dino"
+    assert hit.passed
@@ -0,0 +1,171 @@
+"""Tests for :mod:`tab_cli.warmup` — preloading local models at session start.
+
+No Ollama: ``ollama.Client`` is replaced with a recording fake, and the
+chat / MCP wiring tests capture what :func:`start_warm_up` was handed
+rather than starting threads, so they pin *what* gets warmed and
+*when* without racing a background load.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from tab_cli.models import OllamaNativeModel, close_shared_models
+from tab_cli.warmup import start_warm_up
+
+
+@dataclass
+class _Warmable:
+    name: str
+    log: list[str]
+    error: Exception | None = None
+
+    def warm_up(self) -> None:
+        self.log.append(self.name)
+        if self.error is not None:
+            raise self.error
+
+
+def test_start_warm_up_skips_targets_that_cannot_preload() -> None:
+    assert start_warm_up() is None
+    assert start_warm_up(None, "anthropic:claude-sonnet-4-5", object()) is None
+
+
+def test_start_warm_up_runs_targets_in_order_and_swallows_failures() -> None:
+    log: list[str] = []
+    thread = start_warm_up(
+        _Warmable("model", log, error=ConnectionError("ollama is not running")),
+        None,
+        _Warmable("embedder", log),
+    )
+
+    assert thread is not None and thread.daemon
+    thread.join(timeout=5)
+    assert log == ["model", "embedder"]
+
+
+@dataclass
+class _RecordingClient:
+    calls: list[dict[str, Any]] = field(default_factory=list)
+    error: Exception | None = None
+
+    def __call__(self, host: str | None = None) -> _RecordingClient:
+        self.calls.append({"host": host})
+        return self
+
+    def chat(self, **kwargs: Any) -> None:
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+
+    @property
+    def _client(self) -> _RecordingClient:
+        # Stands in for the httpx pool ``ollama.Client`` wraps.
+        return self
+
+    def close(self) -> None:
+        self.calls.append({"closed": True})
+
+
+def test_ollama_model_warm_up_loads_with_the_request_options(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _RecordingClient()
+    monkeypatch.setattr("ollama.Client", client)
+
+    OllamaNativeModel(
+        "gemma3:latest", host="http://box:11434", keep_alive="30m", num_ctx=8192
+    ).warm_up()
+
+    # Same num_ctx the turns send, or the first turn would reload.
+    assert client.calls == [
+        {"host": "http://box:11434"},
+        {
+            "model": "gemma3:latest",
+            "messages": [],
+            "options": {"num_ctx": 8192},
+            "keep_alive": "30m",
+        },
+        {"closed": True},
+    ]
+
+
+def test_ollama_model_warm_up_closes_its_client_when_the_load_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _RecordingClient(error=ConnectionError("ollama is not running"))
+    monkeypatch.setattr("ollama.Client", client)
+
+    with pytest.raises(ConnectionError):
+        OllamaNativeModel("gemma3:latest").warm_up()
+
+    assert client.calls[-1] == {"closed": True}
+
+
+# --------------------------------------------------------------- wiring
+
+
+class _StubRegistry:
+    def match(self, query: str) -> None:
+        return None
+
+    def warm_up(self) -> None:  # pragma: no cover — captured, not run
+        pass
+
+
+@dataclass
+class _StubAgent:
+    model: Any
+
+
+def _capture_warm_ups(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, ...]]:
+    captured: list[tuple[Any, ...]] = []
+    monkeypatch.setattr(
+        "tab_cli.warmup.start_warm_up", lambda *targets: captured.append(targets)
+    )
+    return captured
+
+
+def test_chat_warms_the_model_then_the_routing_embedder(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from tab_cli.chat import run_chat
+
+    captured = _capture_warm_ups(monkeypatch)
+    model = object()
+    monkeypatch.setattr("tab_cli.chat.compile_tab_agent", lambda **_: _StubAgent(model))
+    registry = _StubRegistry()
+
+    run_chat(
+        registry=registry,  # type: ignore[arg-type]
+        speculate=False,
+        stdin=io.StringIO(""),
+        stdout=io.StringIO(),
+        history_token_budget=1000,
+    )
+
+    assert captured == [(model,), (registry,)]
+
+
+def test_mcp_server_warms_the_default_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    from tab_cli import mcp_server
+
+    captured = _capture_warm_ups(monkeypatch)
+
+    class _Server:
+        def run(self, **_: Any) -> None:
+            captured.append(("run",))
+
+    monkeypatch.setattr(mcp_server, "build_server", lambda **_: _Server())
+    try:
+        mcp_server.run_server(model="ollama:gemma3:latest")
+        (model,), run = captured
+        assert isinstance(model, OllamaNativeModel)
+        assert model.model_name == "gemma3:latest"
+        assert run == ("run",)
+    finally:
+        close_shared_models()
@@ -15,15 +15,23 @@ than ``responses``/``vcr`` because the surface area is tiny (one
 
 from __future__ import annotations
 
+import json
+import os
+import threading
+import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import pytest
 
+from tab_cli.search_cache import SearchCache, normalize_query, search_cache_dir
 from tab_cli.web_search import (
     EXA_SEARCH_URL,
+    build_web_search_many_tool,
     build_web_search_tool,
     default_web_search,
+    default_web_search_many,
 )
 
 
@@ -76,6 +84,42 @@ class _FakeClient:
         self.closed = True
 
 
+@pytest.fixture(autouse=True)
+def _fresh_shared_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Start every test without the module's pooled client or memoized tools.
+
+    Tests that patch ``httpx.Client`` need the pool to be built under
+    the patch, not reused from an earlier test. ``HOME`` points at a
+    scratch dir so the default tool's result cache never touches the
+    real ``~/.tab/search-cache/``.
+    """
+    from tab_cli.web_search import _web_search_for_key, _web_search_many_for_key
+
+    monkeypatch.setattr("tab_cli.web_search._shared_client", None)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    _web_search_for_key.cache_clear()
+    _web_search_many_for_key.cache_clear()
+
+
+class _RecordingHttpxClient:
+    """Replacement for ``httpx.Client`` that records construction and use."""
+
+    instances: list[_RecordingHttpxClient] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.posts: list[str] = []
+        self.closed = False
+        _RecordingHttpxClient.instances.append(self)
+
+    def post(self, url: str, **_: Any) -> _FakeResponse:
+        self.posts.append(url)
+        return _FakeResponse(payload={"results": []})
+
+    def close(self) -> None:
+        self.closed = True
+
+
 # ----------------------------------------------------- happy-path search
 
 
@@ -297,3 +341,328 @@ def test_default_web_search_reads_exa_api_key_from_env(
     posts = [c for c in captured if "url" in c]
     assert posts, "expected a real HTTP attempt when EXA_API_KEY is set"
     assert posts[0]["headers"]["x-api-key"] == "from-env-key"
+
+
+# --------------------------------------------------- pooled shared client
+
+
+def test_searches_without_injected_client_share_one_pooled_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No per-call client: TCP + TLS setup is paid once, not per search."""
+    import importlib.util
+
+    _RecordingHttpxClient.instances = []
+    monkeypatch.setattr("httpx.Client", _RecordingHttpxClient)
+
+    first = build_web_search_tool(api_key="k")
+    second = build_web_search_tool(api_key="k")
+    first("one")
+    first("two")
+    second("three")
+
+    (client,) = _RecordingHttpxClient.instances
+    assert client.posts == [EXA_SEARCH_URL] * 3
+    assert client.closed is False
+    assert client.kwargs["http2"] is (importlib.util.find_spec("h2") is not None)
+
+
+def test_closing_the_shared_client_lets_the_next_search_rebuild_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from tab_cli.web_search import _close_shared_http_client
+
+    _RecordingHttpxClient.instances = []
+    monkeypatch.setattr("httpx.Client", _RecordingHttpxClient)
+    web_search = build_web_search_tool(api_key="k")
+
+    web_search("before")
+    _close_shared_http_client()
+    _close_shared_http_client()  # idempotent, as atexit may race a manual close
+    web_search("after")
+
+    first, second = _RecordingHttpxClient.instances
+    assert first.closed is True
+    assert second.posts == [EXA_SEARCH_URL]
+
+
+def test_default_web_search_reuses_the_tool_for_an_unchanged_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "key-a")
+    tool = default_web_search()
+    assert default_web_search() is tool
+
+    monkeypatch.setenv("EXA_API_KEY", "key-b")
+    assert default_web_search() is not tool
+
+
+# ------------------------------------------------------ on-disk result cache
+
+_ONE_RESULT = {
+    "results": [{"title": "T", "url": "https://example.com", "text": "body"}]
+}
+
+
+def test_search_cache_dir_lives_under_dot_tab() -> None:
+    assert search_cache_dir() == Path.home() / ".tab" / "search-cache"
+
+
+def test_normalize_query_folds_case_whitespace_and_trailing_punctuation() -> None:
+    assert normalize_query("  Event   Sourcing\ttrade-offs?! ") == (
+        "event sourcing trade-offs"
+    )
+    assert SearchCache.key("Event sourcing?", 10) == SearchCache.key(
+        "event  sourcing", 10
+    )
+    assert SearchCache.key("event sourcing", 10) != SearchCache.key(
+        "event sourcing", 5
+    )
+
+
+def test_repeated_query_is_served_from_cache_without_a_request(
+    tmp_path: Path,
+) -> None:
+    cache = SearchCache(tmp_path)
+    client = _FakeClient(response=_FakeResponse(payload=_ONE_RESULT))
+    web_search = build_web_search_tool(api_key="k", http_client=client, cache=cache)
+
+    first = web_search("Event sourcing")
+    second = web_search("event sourcing?")
+
+    assert second == first
+    assert len(client.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_survives_a_new_tool_and_cache_instance(tmp_path: Path) -> None:
+    """Persistence is the point: a later session reads the earlier one's entry."""
+    client = _FakeClient(response=_FakeResponse(payload=_ONE_RESULT))
+    build_web_search_tool(api_key="k", http_client=client, cache=SearchCache(tmp_path))(
+        "q"
+    )
+
+    later = _FakeClient()
+    out = build_web_search_tool(
+        api_key="k", http_client=later, cache=SearchCache(tmp_path)
+    )("q")
+
+    assert later.calls == []
+    assert out[0]["url"] == "https://example.com"
+
+
+def test_errors_and_empty_results_are_not_cached(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path)
+    failing = build_web_search_tool(
+        api_key="k",
+        http_client=_FakeClient(response=RuntimeError("boom")),
+        cache=cache,
+    )
+    empty = build_web_search_tool(api_key="k", http_client=_FakeClient(), cache=cache)
+
+    failing("q")
+    empty("other")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_no_key_fallback_never_touches_the_cache(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path)
+    build_web_search_tool(api_key=None, cache=cache)("q")
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_expired_entry_is_a_miss_and_is_removed(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path, ttl_seconds=60)
+    cache.put("q", 10, [{"title": "t", "url": "u", "snippet": "s"}])
+    path = tmp_path / f"{SearchCache.key('q', 10)}.json"
+    entry = json.loads(path.read_text())
+    entry["stored_at"] -= 61
+    path.write_text(json.dumps(entry))
+
+    assert cache.get("q", 10) is None
+    assert not path.exists()
+    assert cache.misses == 1
+
+
+def test_eviction_drops_the_least_recently_used_entry(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path, max_entries=2)
+    row = [{"title": "t", "url": "u", "snippet": "s"}]
+    cache.put("old", 10, row)
+    cache.put("newer", 10, row)
+    # Age both, then touch "old" so it becomes the most recently used.
+    past = time.time() - 100
+    for name in ("old", "newer"):
+        os.utime(tmp_path / f"{SearchCache.key(name, 10)}.json", (past, past))
+    assert cache.get("old", 10) == row
+
+    cache.put("newest", 10, row)
+
+    assert cache.get("newer", 10) is None
+    assert cache.get("old", 10) == row
+    assert cache.get("newest", 10) == row
+
+
+def test_corrupt_entry_reads_as_a_miss(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path)
+    (tmp_path / f"{SearchCache.key('q', 10)}.json").write_text("{nope")
+    assert cache.get("q", 10) is None
+
+
+def test_put_swallows_write_failures(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    SearchCache(blocker).put("q", 10, [{"title": "t", "url": "u", "snippet": "s"}])
+
+
+def test_default_web_search_caches_under_home(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "k")
+    _RecordingHttpxClient.instances = []
+    monkeypatch.setattr("httpx.Client", _RecordingHttpxClient)
+    monkeypatch.setattr(
+        _RecordingHttpxClient,
+        "post",
+        lambda self, url, **_: (
+            self.posts.append(url) or _FakeResponse(payload=_ONE_RESULT)
+        ),
+    )
+
+    default_web_search()("q")
+    default_web_search()("Q")
+
+    (client,) = _RecordingHttpxClient.instances
+    assert client.posts == [EXA_SEARCH_URL]
+    assert len(list(search_cache_dir().iterdir())) == 1
+
+
+# ------------------------------------------------------- web_search_many
+
+
+@dataclass
+class _PerQueryClient:
+    """Answers each query from a table, optionally after a per-query delay."""
+
+    payloads: dict[str, Any]
+    delays: dict[str, float] = field(default_factory=dict)
+    queries: list[str] = field(default_factory=list)
+    in_flight: int = 0
+    peak: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def post(self, url: str, *, json: dict[str, Any], **_: Any) -> _FakeResponse:
+        query = json["query"]
+        with self.lock:
+            self.queries.append(query)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delays.get(query, 0.02))
+            return _FakeResponse(payload=self.payloads.get(query, {"results": []}))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def _row(url: str) -> dict[str, str]:
+    return {"title": url, "url": url, "text": f"about {url}"}
+
+
+def test_web_search_many_runs_queries_concurrently() -> None:
+    client = _PerQueryClient(
+        payloads={q: {"results": [_row(f"https://{q}")]} for q in "abcd"},
+        delays=dict.fromkeys("abcd", 0.2),
+    )
+    web_search_many = build_web_search_many_tool(api_key="k", http_client=client)
+
+    started = time.perf_counter()
+    out = web_search_many(["a", "b", "c", "d"])
+    elapsed = time.perf_counter() - started
+
+    assert client.peak == 4
+    assert elapsed < 0.6  # serial would be 0.8s
+    assert [r["query"] for r in out] == ["a", "b", "c", "d"]
+
+
+def test_web_search_many_dedupes_urls_across_queries_in_query_order() -> None:
+    client = _PerQueryClient(
+        payloads={
+            "first": {"results": [_row("https://shared"), _row("https://one")]},
+            "second": {"results": [_row("https://shared"), _row("https://two")]},
+        }
+    )
+    out = build_web_search_many_tool(api_key="k", http_client=client)(
+        ["first", "second"]
+    )
+
+    assert [(r["url"], r["query"]) for r in out] == [
+        ("https://shared", "first"),
+        ("https://one", "first"),
+        ("https://two", "second"),
+    ]
+    assert out[0]["snippet"] == "about https://shared"
+
+
+def test_web_search_many_runs_normalised_duplicate_queries_once() -> None:
+    client = _PerQueryClient(payloads={})
+    build_web_search_many_tool(api_key="k", http_client=client)(
+        ["Event sourcing", "event sourcing?", "  ", "CQRS"]
+    )
+    assert sorted(client.queries) == ["CQRS", "Event sourcing"]
+
+
+def test_web_search_many_returns_what_finished_by_the_deadline() -> None:
+    client = _PerQueryClient(
+        payloads={
+            "fast": {"results": [_row("https://fast")]},
+            "slow": {"results": [_row("https://slow")]},
+        },
+        delays={"fast": 0.0, "slow": 1.0},
+    )
+    web_search_many = build_web_search_many_tool(
+        api_key="k", http_client=client, deadline_seconds=0.2
+    )
+
+    started = time.perf_counter()
+    out = web_search_many(["fast", "slow"])
+
+    assert time.perf_counter() - started < 0.8
+    assert out[0]["url"] == "https://fast"
+    assert out[1]["title"] == "[web_search timeout]"
+    assert out[1]["query"] == "slow"
+
+
+def test_web_search_many_collapses_repeated_no_key_notes() -> None:
+    out = build_web_search_many_tool(api_key=None)(["a", "b", "c"])
+    assert len(out) == 1
+    assert "EXA_API_KEY" in out[0]["snippet"]
+
+
+def test_web_search_many_empty_batch_returns_empty_list() -> None:
+    client = _PerQueryClient(payloads={})
+    assert build_web_search_many_tool(api_key="k", http_client=client)([" "]) == []
+    assert client.queries == []
+
+
+def test_web_search_many_shares_the_result_cache(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path)
+    client = _PerQueryClient(payloads={"q": {"results": [_row("https://q")]}})
+    build_web_search_tool(api_key="k", http_client=client, cache=cache)("q")
+
+    out = build_web_search_many_tool(
+        api_key="k", http_client=client, num_results=10, cache=cache
+    )(["q"])
+
+    assert client.queries == ["q"]
+    assert out[0]["url"] == "https://q"
+
+
+def test_default_web_search_many_is_memoized_per_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "key-a")
+    tool = default_web_search_many()
+    assert tool.__name__ == "web_search_many"
+    assert default_web_search_many() is tool
+
+    monkeypatch.setenv("EXA_API_KEY", "key-b")
+    assert default_web_search_many() is not tool